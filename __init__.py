@@ -5,12 +5,19 @@ from aqt.qt import *
 from .panel import CustomTitleBar, OpenEvidencePanel, OnboardingWidget
 from .utils import clean_html_text
 from .reviewer_highlight import setup_highlight_hooks
+from .latency import budget
+from .theme import apply_theme
+from .pending_actions import queue as pending_actions
+from . import auto_submit
+from .sync_pause import state as sync_state
+from .tutorial_dispatch import tutorial_event, tutorial_target_rect
 
 # Global references
 dock_widget = None
 current_card_question = ""
 current_card_answer = ""
 is_showing_answer = False
+pending_card = None  # Card whose text hasn't been extracted yet (reduced mode)
 
 
 def create_dock_widget():
@@ -22,6 +29,9 @@ def create_dock_widget():
         dock_widget = QDockWidget("OpenEvidence", mw)
         dock_widget.setObjectName("OpenEvidenceDock")
 
+        # One shared stylesheet for everything in the dock (see theme.py)
+        apply_theme(dock_widget)
+
         # Check if onboarding is complete
         config = mw.addonManager.getConfig(__name__) or {}
         onboarding_complete = config.get("onboarding_completed", False)
@@ -76,11 +86,7 @@ def toggle_panel():
         dock_widget.hide()
 
         # Notify tutorial that panel was closed
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event("panel_closed")
-        except:
-            pass
+        tutorial_event("panel_closed")
     else:
         # If the dock is floating, dock it back to the right side
         if dock_widget.isFloating():
@@ -89,20 +95,13 @@ def toggle_panel():
 
         dock_widget.show()
         dock_widget.raise_()
+        flush_pending_card_text()
 
         # Notify tutorial that panel was opened
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event("panel_opened")
-        except:
-            pass
+        tutorial_event("panel_opened")
 
     # Notify tutorial that panel was toggled (fires on both open and close)
-    try:
-        from .tutorial import tutorial_event
-        tutorial_event("panel_toggled")
-    except:
-        pass
+    tutorial_event("panel_toggled")
 
 
 def on_webview_did_receive_js_message(handled, message, context):
@@ -114,21 +113,18 @@ def on_webview_did_receive_js_message(handled, message, context):
     # Handle tutorial event messages
     if message.startswith("tutorial:"):
         event_name = message.replace("tutorial:", "", 1)
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event(event_name)
-        except:
-            pass
+        tutorial_event(event_name)
         return (True, None)
 
     # Handle tutorial events from highlight bubble
     if message.startswith("openevidence:tutorial_event:"):
         event_name = message.replace("openevidence:tutorial_event:", "", 1)
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event(event_name)
-        except:
-            pass
+        tutorial_event(event_name)
+        return (True, None)
+
+    # Handle tutorial target rects pushed from the toolbar
+    if message.startswith("openevidence:tutorial_rect:"):
+        tutorial_target_rect("toolbar", message.replace("openevidence:tutorial_rect:", "", 1))
         return (True, None)
 
     # Handle highlight bubble messages
@@ -143,11 +139,7 @@ def on_webview_did_receive_js_message(handled, message, context):
         handle_add_context(selected_text)
 
         # Notify tutorial that text was highlighted
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event("text_highlighted")
-        except:
-            pass
+        tutorial_event("text_highlighted")
 
         return (True, None)
 
@@ -163,11 +155,7 @@ def on_webview_did_receive_js_message(handled, message, context):
                 handle_ask_query(query, context)
                 
                 # Notify tutorial that a question was submitted
-                try:
-                    from .tutorial import tutorial_event
-                    tutorial_event("ask_question_submitted")
-                except:
-                    pass
+                tutorial_event("ask_question_submitted")
         except:
             pass
         return (True, None)
@@ -177,7 +165,27 @@ def on_webview_did_receive_js_message(handled, message, context):
 
 def store_current_card_text(card):
     """Store the current card text globally for keybinding access from OpenEvidence panel"""
-    global current_card_question, current_card_answer, is_showing_answer, dock_widget
+    global is_showing_answer, pending_card
+
+    # Check which side is showing
+    is_showing_answer = bool(mw.reviewer and mw.reviewer.state == "answer")
+
+    if budget.reduced:
+        # Reduced mode: extract the text only when the panel can use it,
+        # and then after the flip rather than during it
+        pending_card = card
+        if is_panel_visible():
+            QTimer.singleShot(0, flush_pending_card_text)
+        return
+
+    pending_card = None
+    extract_card_text(card)
+    push_card_text()
+
+
+def extract_card_text(card):
+    """Clean the card's question and answer HTML into the global card texts"""
+    global current_card_question, current_card_answer, is_showing_answer
 
     try:
         # Always get both question and answer
@@ -201,22 +209,39 @@ def store_current_card_text(card):
             # If we can't find the question in the answer, just use the full answer
             current_card_answer = full_answer_text
 
-        # Check which side is showing
-        if mw.reviewer and mw.reviewer.state == "answer":
-            is_showing_answer = True
-        else:
-            is_showing_answer = False
+    except:
+        current_card_question = ""
+        current_card_answer = ""
+        is_showing_answer = False
+
 
-        # Update the JavaScript context with new card texts (using templates)
+def push_card_text():
+    """Update the JavaScript context with new card texts (using templates)"""
+    try:
         if dock_widget and dock_widget.widget():
             panel = dock_widget.widget()
             if hasattr(panel, 'update_card_text_in_js'):
                 panel.update_card_text_in_js()
-
     except:
-        current_card_question = ""
-        current_card_answer = ""
-        is_showing_answer = False
+        pass
+
+
+def is_panel_visible():
+    """Whether the OpenEvidence dock is currently shown"""
+    return bool(dock_widget and dock_widget.isVisible())
+
+
+def flush_pending_card_text():
+    """Extract and push card text that was deferred in reduced mode"""
+    global pending_card
+
+    if pending_card is None or not is_panel_visible():
+        return
+    card = pending_card
+    pending_card = None
+    with budget.measure("deferred_card_text", deferred=True):
+        extract_card_text(card)
+        push_card_text()
 
 
 def handle_add_context(selected_text):
@@ -231,6 +256,7 @@ def handle_add_context(selected_text):
     if not dock_widget.isVisible():
         dock_widget.show()
         dock_widget.raise_()
+        flush_pending_card_text()
 
     # Get the panel widget
     panel = dock_widget.widget()
@@ -239,62 +265,53 @@ def handle_add_context(selected_text):
         if hasattr(panel, 'show_web_view'):
             panel.show_web_view()
 
-        # Inject the text into the OpenEvidence search box
-        # Priority: 1) Follow-up input (if active conversation), 2) Main search input
-        js_code = """
-        (function() {
-            var newText = %s;
-            var searchInput = null;
-            
-            // First, check for follow-up input (indicates active conversation)
-            // Look for input with "follow-up" in placeholder
-            var followUpInput = document.querySelector('input[placeholder*="follow-up"], input[placeholder*="Follow-up"], textarea[placeholder*="follow-up"]');
-            
-            if (followUpInput) {
-                // Active conversation - use follow-up input
-                searchInput = followUpInput;
-                console.log('Anki: Found follow-up input, using that');
-            } else {
-                // No active conversation - use main search input
-                searchInput = document.querySelector('input[placeholder*="medical"], input[placeholder*="question"], textarea, input[type="text"]');
-                console.log('Anki: No follow-up input, using main search');
-            }
-            
-            if (searchInput) {
-                var existingText = searchInput.value.trim();
-
-                // Append to existing text if present, otherwise just set new text
-                var finalText = existingText ? existingText + ' ' + newText : newText;
-
-                // Use native setter for React compatibility
-                var nativeSetter = Object.getOwnPropertyDescriptor(
-                    searchInput.tagName === 'TEXTAREA' ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype,
-                    'value'
-                ).set;
-                nativeSetter.call(searchInput, finalText);
-
-                // Dispatch events
-                searchInput.dispatchEvent(new InputEvent('input', { bubbles: true, cancelable: true, inputType: 'insertText', data: finalText }));
-                searchInput.dispatchEvent(new Event('change', { bubbles: true }));
-
-                // Focus the input
-                searchInput.focus();
-
-                console.log('Anki: Added context to search box');
-            } else {
-                console.log('Anki: Could not find search input');
-            }
-        })();
-        """ % repr(selected_text)
-
-        panel.web.page().runJavaScript(js_code)
+        if hasattr(panel, 'page_watchdog'):
+            panel.page_watchdog.check_before_action()
+
+    # Inject the text into the OpenEvidence search box
+    # Priority: 1) Follow-up input (if active conversation), 2) Main search input
+    js_code = """
+    (function() {
+        var newText = %s;
+
+        // Follow-up input if there's an active conversation, else the main
+        // search input (kept current by the input locator)
+        var searchInput = window.ankiInputs.target();
+
+        if (searchInput) {
+            var existingText = searchInput.value.trim();
+
+            // Append to existing text if present, otherwise just set new text
+            var finalText = existingText ? existingText + ' ' + newText : newText;
+
+            // Use native setter for React compatibility
+            var nativeSetter = Object.getOwnPropertyDescriptor(
+                searchInput.tagName === 'TEXTAREA' ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype,
+                'value'
+            ).set;
+            nativeSetter.call(searchInput, finalText);
 
+            // Dispatch events
+            searchInput.dispatchEvent(new InputEvent('input', { bubbles: true, cancelable: true, inputType: 'insertText', data: finalText }));
+            searchInput.dispatchEvent(new Event('change', { bubbles: true }));
+
+            // Focus the input
+            searchInput.focus();
+
+            console.log('Anki: Added context to search box');
+            return 'ok';
+        }
+        console.log('Anki: Could not find search input');
+        return 'no_input';
+    })();
+    """ % repr(selected_text)
+
+    # Delivered in order once the page is ready (see pending_actions)
+    pending_actions.submit("add_context", selected_text, js_code)
+
+    if panel and hasattr(panel, 'web'):
         # Notify tutorial that add to chat was used
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event("add_to_chat")
-        except:
-            pass
+        tutorial_event("add_to_chat")
 
 
 def handle_ask_query(query, context):
@@ -309,6 +326,7 @@ def handle_ask_query(query, context):
     if not dock_widget.isVisible():
         dock_widget.show()
         dock_widget.raise_()
+        flush_pending_card_text()
 
     # Get the panel widget
     panel = dock_widget.widget()
@@ -317,63 +335,14 @@ def handle_ask_query(query, context):
         if hasattr(panel, 'show_web_view'):
             panel.show_web_view()
 
-        # Format the message with query and context
-        formatted_message = f"{query}\n\nContext:\n{context}"
-
-        # Inject the formatted message and trigger submit
-        js_code = """
-        (function() {
-            var searchInput = document.querySelector('input[placeholder*="medical"], input[placeholder*="question"], textarea, input[type="text"]');
-            if (searchInput) {
-                var text = %s;
-
-                // Use native setter for React compatibility
-                var nativeSetter = Object.getOwnPropertyDescriptor(
-                    searchInput.tagName === 'TEXTAREA' ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype,
-                    'value'
-                ).set;
-                nativeSetter.call(searchInput, text);
-
-                // Dispatch events
-                searchInput.dispatchEvent(new InputEvent('input', { bubbles: true, cancelable: true, inputType: 'insertText', data: text }));
-                searchInput.dispatchEvent(new Event('change', { bubbles: true }));
-
-                // Focus the input
-                searchInput.focus();
-
-                // Try to find and click the submit button after a short delay
-                setTimeout(function() {
-                    // Look for common submit button patterns
-                    var submitButton = document.querySelector('button[type="submit"]') ||
-                                     document.querySelector('button:has(svg)') ||
-                                     searchInput.closest('form')?.querySelector('button');
-
-                    if (submitButton) {
-                        submitButton.click();
-                        console.log('Anki: Auto-submitted query');
-                    } else {
-                        // Try simulating Enter key press
-                        var enterEvent = new KeyboardEvent('keydown', {
-                            key: 'Enter',
-                            code: 'Enter',
-                            keyCode: 13,
-                            which: 13,
-                            bubbles: true,
-                            cancelable: true
-                        });
-                        searchInput.dispatchEvent(enterEvent);
-                        console.log('Anki: Simulated Enter key');
-                    }
-                }, 100);
-
-                console.log('Anki: Added query with context to search box');
-            } else {
-                console.log('Anki: Could not find search input');
-            }
-        })();
-        """ % repr(formatted_message)
-
-        panel.web.page().runJavaScript(js_code)
+        if hasattr(panel, 'page_watchdog'):
+            panel.page_watchdog.check_before_action()
+
+    # Format the message with query and context
+    formatted_message = f"{query}\n\nContext:\n{context}"
+
+    # Typed in and submitted once the page is ready (see auto_submit)
+    auto_submit.ask(formatted_message)
 
 
 def add_toolbar_button(links, toolbar):
@@ -404,11 +373,13 @@ def on_answer_shown(card):
     """Called when answer is shown - store card text and notify tutorial"""
     store_current_card_text(card)
     # Notify tutorial that answer was shown
-    try:
-        from .tutorial import tutorial_event
-        tutorial_event("answer_shown")
-    except:
-        pass
+    tutorial_event("answer_shown")
+
+
+def on_config_updated(config):
+    """Called after the config is saved in Anki's add-on config editor"""
+    # The budget caches its value so flips don't read config
+    budget.reload_config()
 
 
 # Hook registration
@@ -416,7 +387,13 @@ gui_hooks.webview_did_receive_js_message.append(on_webview_did_receive_js_messag
 gui_hooks.top_toolbar_did_init_links.append(add_toolbar_button)
 # Use delayed preloading for better performance
 gui_hooks.main_window_did_init.append(preload_panel)
-gui_hooks.reviewer_did_show_question.append(store_current_card_text)
-gui_hooks.reviewer_did_show_answer.append(on_answer_shown)
+gui_hooks.reviewer_did_show_question.append(budget.timed("store_current_card_text")(store_current_card_text))
+gui_hooks.reviewer_did_show_answer.append(budget.timed("on_answer_shown")(on_answer_shown))
+# Pause the panel's page while Anki syncs
+gui_hooks.sync_will_start.append(sync_state.sync_started)
+gui_hooks.sync_did_finish.append(sync_state.sync_finished)
+gui_hooks.media_sync_did_start_or_stop.append(sync_state.media_sync_changed)
 # Set up highlight bubble hooks for reviewer
 setup_highlight_hooks()
+# Pick up config edits without restarting Anki
+mw.addonManager.setConfigUpdatedAction(__name__, on_config_updated)
@@ -0,0 +1,307 @@
+"""
+Acknowledged auto-submit for "Ask Question".
+
+The question is typed into OpenEvidence's input and submitted by a script
+that checks each step instead of guessing with fixed delays:
+
+1. accept  - wait until the page's framework has taken the value (the
+             input still holds it on the next polls) and the submit button
+             is enabled. The value is set again if the framework reset it.
+2. submit  - click the submit button of the input's own form/composer, or
+             press Enter in the input if it has none (buttons elsewhere on
+             the page are never clicked)
+3. confirm - wait until an answer starts rendering: the URL changes (a new
+             thread) or content is added to the thread container
+             (ankiInputs.thread(), see input_locator.py) outside the
+             composer. Toasts, tooltips and spinners elsewhere don't count.
+
+The script returns 'started' and reports back later through a console
+message ("ANKI_SUBMIT:<json>", picked up by the panel's TutorialAwarePage)
+with the outcome and the time each step took. Until then the pending-action
+queue holds every later action, so nothing else is typed into the input
+mid-submit. A failed attempt is retried up to MAX_ATTEMPTS times, still
+first in the queue, but only when the question wasn't submitted (so a
+question is never asked twice). Timings are kept for the Diagnostics view.
+"""
+
+import json
+import time
+
+from .diagnostics import register_section
+from .page_watchdog import LatencyHistogram
+from .pending_actions import queue, show_status, FAILED_MESSAGE
+
+MAX_ATTEMPTS = 3
+RETRY_BASE_MS = 500
+ACCEPT_TIMEOUT_MS = 3000
+CONFIRM_TIMEOUT_MS = 10000
+POLL_MS = 25
+# How long the queue waits for a result before moving on
+RESULT_TIMEOUT_MS = ACCEPT_TIMEOUT_MS + CONFIRM_TIMEOUT_MS + 5000
+COMPOSER_DEPTH = 4         # Ancestors searched for the input's send button
+RESULT_PREFIX = "ANKI_SUBMIT:"
+STALE_S = 300
+
+SUBMIT_JS = """
+(function() {
+    var submitId = %(id)s;
+    var text = %(text)s;
+    var searchInput = window.ankiInputs.main();
+    if (!searchInput) {
+        console.log('Anki: Could not find search input');
+        return 'no_input';
+    }
+
+    var start = performance.now();
+    var times = {};
+
+    function report(ok, stage, method) {
+        times.total = Math.round(performance.now() - start);
+        console.log('%(prefix)s' + JSON.stringify({
+            id: submitId, ok: ok, stage: stage, method: method || null,
+            // Still holding the question = it was never submitted
+            pending: !!searchInput && searchInput.value === text,
+            times: times
+        }));
+    }
+
+    function setValue() {
+        if (!searchInput.isConnected) {
+            searchInput = window.ankiInputs.main();
+            if (!searchInput) {
+                return;
+            }
+        }
+        // Use native setter for React compatibility
+        var nativeSetter = Object.getOwnPropertyDescriptor(
+            searchInput.tagName === 'TEXTAREA' ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype,
+            'value'
+        ).set;
+        nativeSetter.call(searchInput, text);
+        searchInput.dispatchEvent(new InputEvent('input', { bubbles: true, cancelable: true, inputType: 'insertText', data: text }));
+        searchInput.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+
+    // The input's form, or the closest ancestor (a few levels up) that
+    // holds a button - the box the input and its send button live in
+    function composer() {
+        var form = searchInput.closest('form');
+        if (form) {
+            return form;
+        }
+        var node = searchInput.parentElement;
+        for (var depth = 0; node && node !== document.body && depth < %(composer_depth)d; depth++) {
+            if (node.querySelector('button')) {
+                return node;
+            }
+            node = node.parentElement;
+        }
+        return null;
+    }
+
+    function findSubmitButton() {
+        var box = composer();
+        if (!box) {
+            return null;
+        }
+        return box.querySelector('button[type="submit"]') ||
+               box.querySelector('button:has(svg)') ||
+               box.querySelector('button');
+    }
+
+    function isEnabled(button) {
+        return !button.disabled && button.getAttribute('aria-disabled') !== 'true';
+    }
+
+    function confirm(method) {
+        var submittedAt = performance.now();
+        var url = location.href;
+        var rendered = false;
+        var box = composer();
+        // Only the conversation's own container is watched; without one the
+        // URL change (a new thread) is the signal
+        var thread = window.ankiInputs.thread();
+        var observer = null;
+        if (thread) {
+            observer = new MutationObserver(function(mutations) {
+                for (var i = 0; i < mutations.length && !rendered; i++) {
+                    var target = mutations[i].target;
+                    if (mutations[i].addedNodes.length && !(box && box.contains(target))) {
+                        rendered = true;
+                    }
+                }
+            });
+            observer.observe(thread, { childList: true, subtree: true, characterData: true });
+        }
+
+        function stop() {
+            if (observer) {
+                observer.disconnect();
+            }
+        }
+
+        (function poll() {
+            if (rendered || location.href !== url) {
+                stop();
+                times.confirm = Math.round(performance.now() - submittedAt);
+                report(true, 'confirm', method);
+            } else if (performance.now() - submittedAt > %(confirm_timeout)d) {
+                stop();
+                report(false, 'confirm', method);
+            } else {
+                setTimeout(poll, %(poll)d);
+            }
+        })();
+    }
+
+    function submit() {
+        times.accept = Math.round(performance.now() - start);
+        var button = findSubmitButton();
+        if (button) {
+            button.click();
+            confirm('button');
+        } else {
+            searchInput.dispatchEvent(new KeyboardEvent('keydown', {
+                key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true, cancelable: true
+            }));
+            confirm('enter');
+        }
+    }
+
+    // Wait for two polls in a row with the value kept and the button enabled
+    var steady = 0;
+    var lastSet = performance.now();
+    setValue();
+    searchInput.focus();
+    (function poll() {
+        var button = findSubmitButton();
+        var echoed = !!searchInput && searchInput.value === text;
+        if (echoed && (!button || isEnabled(button))) {
+            steady++;
+        } else {
+            steady = 0;
+            if (!echoed && performance.now() - lastSet > 250) {
+                setValue();  // The framework reset the input (e.g. re-render)
+                lastSet = performance.now();
+            }
+        }
+        if (steady >= 2) {
+            submit();
+        } else if (performance.now() - start > %(accept_timeout)d) {
+            report(false, 'accept');
+        } else {
+            setTimeout(poll, %(poll)d);
+        }
+    })();
+
+    console.log('Anki: Added query with context to search box');
+    return 'started';
+})();
+"""
+
+
+class SubmitStats:
+    """Auto-submit outcomes and timings, shared by every panel of the session"""
+    def __init__(self):
+        self.confirmed = 0
+        self.failed = 0
+        self.retries = 0
+        self.failures = {}         # stage -> count
+        self.accept = LatencyHistogram()
+        self.confirm = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        rows = [
+            ("Confirmed", str(self.confirmed)),
+            ("Failed", str(self.failed)),
+            ("Retries", str(self.retries)),
+            ("Accept", self.accept.summary()),
+            ("Answer started", self.confirm.summary()),
+            ("Total", self.total.summary()),
+        ]
+        for stage, count in sorted(self.failures.items()):
+            rows.append(("Failed at " + stage, str(count)))
+        return rows
+
+
+stats = SubmitStats()
+
+# submit id -> [text, attempt, time submitted]
+_submissions = {}
+_next_id = 0
+
+
+def build_script(submit_id, text):
+    return SUBMIT_JS % {
+        "id": json.dumps(submit_id),
+        "text": json.dumps(text),
+        "prefix": RESULT_PREFIX,
+        "accept_timeout": ACCEPT_TIMEOUT_MS,
+        "confirm_timeout": CONFIRM_TIMEOUT_MS,
+        "poll": POLL_MS,
+        "composer_depth": COMPOSER_DEPTH,
+    }
+
+
+def ask(text):
+    """Type a question into the panel and submit it once the page is ready"""
+    global _next_id
+    # Forget submissions whose page went away before they reported back
+    now = time.monotonic()
+    for submit_id in [k for k, v in _submissions.items() if now - v[2] > STALE_S]:
+        del _submissions[submit_id]
+
+    _next_id += 1
+    _submissions[_next_id] = [text, 1, now]
+    queue.submit("ask_query", text, build_script(_next_id, text),
+                 token=_next_id, result_timeout_ms=RESULT_TIMEOUT_MS)
+
+
+def handle_result(payload):
+    """Handle an "ANKI_SUBMIT:" console message from the panel's page"""
+    try:
+        result = json.loads(payload)
+        submit_id = result["id"]
+    except:
+        return
+    submission = _submissions.get(submit_id)
+    if submission is None:
+        return  # Already handled (e.g. a page that reloaded mid-submit)
+    attempt = submission[1]
+    times = result.get("times") or {}
+
+    if result.get("ok"):
+        del _submissions[submit_id]
+        queue.finished(submit_id)
+        stats.confirmed += 1
+        stats.accept.add(times.get("accept", 0))
+        stats.confirm.add(times.get("confirm", 0))
+        stats.total.add(times.get("total", 0))
+        print("OpenEvidence: Question submitted (%s, accepted in %s ms, answer started after %s ms)"
+              % (result.get("method"), times.get("accept"), times.get("confirm")))
+        show_status("Question sent to OpenEvidence", "delivered")
+        return
+
+    stage = result.get("stage", "unknown")
+    print(f"OpenEvidence: Auto-submit attempt {attempt} failed at {stage}")
+    if result.get("pending") and attempt < MAX_ATTEMPTS:
+        # Not submitted yet - safe to try again, still ahead of later actions
+        if queue.finished(submit_id, retry_ms=RETRY_BASE_MS * (2 ** (attempt - 1))):
+            stats.retries += 1
+            submission[1] = attempt + 1
+            return
+
+    del _submissions[submit_id]
+    queue.finished(submit_id, delivered=not result.get("pending"))
+    stats.failed += 1
+    stats.failures[stage] = stats.failures.get(stage, 0) + 1
+    if result.get("pending"):
+        show_status(FAILED_MESSAGE, "failed")
+    else:
+        # Submitted, but no answer showed up in time
+        show_status("Question sent - OpenEvidence hasn't answered yet", "queued")
+
+
+register_section("Auto-Submit", stats.diagnostics)
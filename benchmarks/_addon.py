@@ -0,0 +1,52 @@
+"""
+Load the add-on's modules outside of Anki for benchmarking.
+
+The add-on is imported as the package `openevidence_ai` from the working
+tree, against the fake aqt in fake_aqt.py. load() imports single modules
+without running the add-on's __init__.py; load_package() runs it as well,
+registering the add-on's hooks on the fake gui_hooks.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import types
+
+from . import fake_aqt
+
+ADDON_DIR = fake_aqt.ADDON_DIR
+PACKAGE_NAME = "openevidence_ai"
+
+
+def _ensure_aqt():
+    if "aqt" not in sys.modules:
+        fake_aqt.install()
+    return sys.modules["aqt"]
+
+
+def load(module_name):
+    """Import `openevidence_ai.<module_name>` from the working tree"""
+    _ensure_aqt()
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(PACKAGE_NAME + "." + module_name)
+
+
+def load_package():
+    """Import the whole add-on (running __init__.py) and return it"""
+    _ensure_aqt()
+    package = sys.modules.get(PACKAGE_NAME)
+    if package is not None and getattr(package, "__file__", None):
+        return package
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME,
+        os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = package
+    spec.loader.exec_module(package)
+    return package
@@ -0,0 +1,330 @@
+"""
+Reviewer bubble style cost benchmark
+
+Writes one HTML page per card size (number of DOM nodes in the card) with
+the reviewer's injected scripts. Open the pages in Chromium (or any
+QtWebEngine-based browser) and compare the reported timings: with the bubble
+in a closed shadow root, show/hide and move cost should stay flat as the
+card grows.
+
+With --run the pages are loaded in an offscreen QtWebEngine view instead,
+and the timings per card size are printed. The run fails if an operation on
+the largest card costs more than FLAT_FACTOR times what it does on the
+smallest one (the bubble's style recalculation is leaking into the card),
+or, with a stored baseline (baselines/bubble_bench.json), when a timing
+regresses past the tolerance. Record one with --update-baseline on the
+machine that runs the comparison. --run requires PyQt6 and
+PyQt6-WebEngine.
+
+Each operation is followed by a forced style and layout flush
+(getComputedStyle + offsetHeight) so the measured time includes the
+recalculation it triggers. Hover is handled purely by CSS :hover rules inside
+the shadow root and can't be triggered from script; show/hide is the same
+kind of class change on the bubble and stands in for it.
+
+"move" goes through the bubble's real selection path: a different card row
+is selected with Command held and a mouseup is dispatched, so the bubble's
+requestAnimationFrame pipeline reads the selection rects and moves the host.
+Only the frame that runs the pipeline is timed, and the run fails if the
+bubble didn't show for a selection. Dragging can't be driven from the page:
+the bubble's pointer handlers live in its closed shadow root.
+
+Usage:
+    python -m benchmarks.bubble_bench [output_dir] [--iterations N]
+    python -m benchmarks.bubble_bench [output_dir] --run [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from ._addon import load
+
+CARD_SIZES = [100, 1000, 10000, 50000]
+OPERATIONS = ["show/hide", "move"]
+
+# Largest card vs smallest card cost allowed before the run fails
+FLAT_FACTOR = 3.0
+# Timing noise that never counts as a regression, in us/op
+NOISE_US = 5.0
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "baselines", "bubble_bench.json")
+
+# Card CSS that restyles form controls globally, like many shared decks do
+CARD_CSS = """
+body { font-family: serif; font-size: 20px; }
+button { all: unset; background: red !important; font-size: 40px !important; }
+textarea { border: 5px solid green !important; }
+.card-row:nth-child(odd) span { color: #333; }
+"""
+
+HARNESS_JS = """
+(function() {
+    var N = %(iterations)d;
+    var api = window.ankiHighlightBubble;
+    var rows = document.querySelectorAll('.card-row span');
+    var rect = {left: 100, right: 300, top: 100, bottom: 120, width: 200, height: 20};
+    var results = {};
+    var lines = [];
+
+    function flush() {
+        getComputedStyle(document.body).color;
+        return document.body.offsetHeight;
+    }
+
+    function record(name, totalMs) {
+        results[name] = totalMs * 1000 / N;
+        lines.push(name + ': ' + results[name].toFixed(1) + ' us/op');
+    }
+
+    function timeSync(name, fn) {
+        flush();
+        var start = performance.now();
+        for (var i = 0; i < N; i++) {
+            fn(i);
+            flush();
+        }
+        record(name, performance.now() - start);
+    }
+
+    // Select a different card row each time and release the mouse with
+    // Command held, so the bubble's own mouseup -> requestAnimationFrame
+    // read/write pipeline measures the selection and moves the bubble.
+    // Only the frame that runs the pipeline is timed.
+    function timeSelectionMoves(name, done) {
+        var total = 0;
+        var missed = 0;
+        var i = 0;
+        var start = 0;
+
+        function before() {
+            flush();
+            start = performance.now();
+        }
+
+        function after() {
+            flush();
+            total += performance.now() - start;
+            if (!api.isVisible()) {
+                missed++;
+            }
+            i++;
+            setTimeout(step, 0);
+        }
+
+        function release() {
+            // Registered around the bubble's own frame callback, in order
+            requestAnimationFrame(before);
+            document.dispatchEvent(new MouseEvent('mouseup', {bubbles: true}));
+            requestAnimationFrame(after);
+        }
+
+        function step() {
+            if (i === N) {
+                record(name, total);
+                results.missed = missed;
+                done();
+                return;
+            }
+            document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Meta', metaKey: true, bubbles: true}));
+            document.dispatchEvent(new MouseEvent('mousedown', {bubbles: true}));
+            var range = document.createRange();
+            range.selectNodeContents(rows[(i * 7) %% rows.length]);
+            var selection = window.getSelection();
+            selection.removeAllRanges();
+            selection.addRange(range);
+            // Let the selectionchange event go by before releasing
+            setTimeout(release, 0);
+        }
+
+        step();
+    }
+
+    timeSync('show/hide', function(i) {
+        if (i %% 2 === 0) { api.show(rect, 'sample text'); } else { api.hide(); }
+    });
+    timeSelectionMoves('move', function() {
+        var out = document.getElementById('bench-results');
+        out.textContent = 'card nodes: %(nodes)d\\n' + lines.join('\\n');
+        console.log(out.textContent);
+        window.bubbleBenchResults = results;
+    });
+})();
+"""
+
+
+def card_html(nodes):
+    rows = []
+    for i in range(nodes // 2):
+        rows.append('<div class="card-row"><span>Card text %d</span></div>' % i)
+    return "\n".join(rows)
+
+
+def build_page(nodes, iterations):
+    reviewer_highlight = load("reviewer_highlight")
+    key_matcher = load("key_matcher")
+    return """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><style>%s</style></head>
+<body>
+<pre id="bench-results">running...</pre>
+%s
+<script>function pycmd() {}</script>
+<script>%s</script>
+<script>%s</script>
+<script>%s</script>
+</body>
+</html>
+""" % (
+        CARD_CSS,
+        card_html(nodes),
+        key_matcher.chord_matcher_script(),
+        reviewer_highlight.HIGHLIGHT_BUBBLE_JS,
+        HARNESS_JS % {"iterations": iterations, "nodes": nodes},
+    )
+
+
+def write_pages(output_dir, iterations):
+    """Write one page per card size; returns {nodes: path}"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {}
+    for nodes in CARD_SIZES:
+        path = os.path.join(output_dir, "bubble_%d.html" % nodes)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(build_page(nodes, iterations))
+        print("wrote", path)
+        paths[nodes] = path
+    return paths
+
+
+def _evaluate(page, script, timeout_ms):
+    """Result of a script once it's truthy, polled until timeout_ms (or None)"""
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    value = [None]
+    while time.monotonic() < deadline:
+        loop = QEventLoop()
+
+        def got(result):
+            value[0] = result
+            loop.quit()
+        page.runJavaScript(script, got)
+        loop.exec()
+        if value[0]:
+            return value[0]
+        loop = QEventLoop()
+        QTimer.singleShot(100, loop.quit)
+        loop.exec()
+    return None
+
+
+def measure(paths):
+    """Load each page offscreen and read its timings: {nodes: {operation: us/op}}"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtCore import QUrl, QEventLoop, QTimer
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    results = {}
+    for nodes, path in sorted(paths.items()):
+        # A shown view, so the page gets animation frames. setHtml is
+        # limited to 2 MB, so the big cards load from file.
+        view = QWebEngineView()
+        view.resize(1024, 768)
+        view.show()
+        loop = QEventLoop()
+        view.loadFinished.connect(lambda ok: loop.quit())
+        timeout = QTimer()
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(loop.quit)
+        timeout.start(120000)
+        view.load(QUrl.fromLocalFile(os.path.abspath(path)))
+        loop.exec()
+        timeout.stop()
+
+        timings = _evaluate(view.page(), "window.bubbleBenchResults || null", 120000)
+        if not timings:
+            raise RuntimeError("no timings from the %d-node page" % nodes)
+        if timings.get("missed"):
+            raise RuntimeError("the bubble didn't show for %d of the selections on the %d-node page"
+                               % (timings["missed"], nodes))
+        results[nodes] = {name: round(float(timings[name]), 1) for name in OPERATIONS}
+        view.close()
+        view.deleteLater()
+        app.processEvents()
+    return results
+
+
+def check_flat(results):
+    """Return a list of failures where cost grows with the card"""
+    smallest, largest = results[min(results)], results[max(results)]
+    failures = []
+    for name in OPERATIONS:
+        if largest[name] > smallest[name] * FLAT_FACTOR + NOISE_US:
+            failures.append("%s: %.1f us on %d nodes vs %.1f us on %d nodes (%.0fx allowed)"
+                            % (name, largest[name], max(results), smallest[name], min(results),
+                               FLAT_FACTOR))
+    return failures
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages"""
+    failures = []
+    for nodes, timings in results.items():
+        recorded = baseline.get(str(nodes), {})
+        for name in OPERATIONS:
+            if name in recorded and timings[name] > recorded[name] * (1 + tolerance) + NOISE_US:
+                failures.append("%s on %d nodes: %.1f us vs baseline %.1f us (+%d%% allowed)"
+                                % (name, nodes, timings[name], recorded[name], tolerance * 100))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_dir", nargs="?", default="bubble_bench_out")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--run", action="store_true", help="load the pages offscreen and check the timings")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed relative regression (default 0.3 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    paths = write_pages(args.output_dir, args.iterations)
+    if not args.run:
+        return 0
+
+    results = measure(paths)
+    for nodes, timings in sorted(results.items()):
+        print("%6d nodes   " % nodes + "   ".join(
+            "%s %8.1f us/op" % (name, timings[name]) for name in OPERATIONS))
+
+    failures = check_flat(results)
+    if args.update_baseline and not failures:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({str(nodes): timings for nodes, timings in results.items()}, f, indent=2)
+            f.write("\n")
+        print("Baseline written to", args.baseline)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            failures += compare(results, json.load(f), args.tolerance)
+    else:
+        print("No baseline at %s - run with --update-baseline to record one" % args.baseline)
+
+    if failures:
+        print("REGRESSION:")
+        for failure in failures:
+            print("  " + failure)
+        return 1
+    print("OK - bubble cost stays flat as the card grows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
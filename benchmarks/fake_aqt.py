@@ -0,0 +1,180 @@
+"""
+Fake aqt environment for running the add-on outside of Anki.
+
+Provides just enough of aqt for the add-on to import and for its reviewer
+hooks to be driven from a script:
+
+- aqt.mw with an addonManager (config backed by config.json.default),
+  a reviewer with a question/answer state and the window methods the add-on calls
+- aqt.gui_hooks with hooks that keep their callbacks and can be fired
+- aqt.utils with no-op tooltip/showInfo
+- aqt.qt re-exporting PyQt6, when it is installed (the add-on's UI modules
+  import real Qt classes; no QApplication is created, so benchmarks must not
+  create widgets)
+"""
+
+import copy
+import json
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeHook:
+    """A gui_hooks hook: callbacks are appended/removed and fired in order"""
+    def __init__(self, name):
+        self.name = name
+        self._hooks = []
+
+    def append(self, callback):
+        self._hooks.append(callback)
+
+    def remove(self, callback):
+        if callback in self._hooks:
+            self._hooks.remove(callback)
+
+    def count(self):
+        return len(self._hooks)
+
+    def __call__(self, *args):
+        """Fire an action hook"""
+        for callback in list(self._hooks):
+            callback(*args)
+
+    def filter(self, value, *args):
+        """Fire a filter hook, threading `value` through each callback"""
+        for callback in list(self._hooks):
+            value = callback(value, *args)
+        return value
+
+
+class FakeGuiHooks:
+    """Namespace that creates hooks on first access"""
+    def __init__(self):
+        self._all = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        hook = self._all.get(name)
+        if hook is None:
+            hook = self._all[name] = FakeHook(name)
+        return hook
+
+    def hooks(self):
+        return dict(self._all)
+
+
+class FakeAddonManager:
+    """Config storage like Anki's: getConfig returns a fresh copy every call"""
+    def __init__(self, config):
+        self._config = config
+
+    def getConfig(self, module):
+        return copy.deepcopy(self._config)
+
+    def writeConfig(self, module, conf):
+        self._config = copy.deepcopy(conf)
+
+    def setWebExports(self, module, pattern):
+        pass
+
+    def setConfigUpdatedAction(self, module, action):
+        pass
+
+
+class FakeReviewer:
+    def __init__(self):
+        self.state = "question"
+        self.card = None
+        self.web = None
+
+
+class FakeMainWindow:
+    def __init__(self, config):
+        self.addonManager = FakeAddonManager(config)
+        self.reviewer = FakeReviewer()
+        self.toolbar = None
+        self.col = None
+
+    def height(self):
+        return 800
+
+    def width(self):
+        return 1200
+
+    def installEventFilter(self, obj):
+        pass
+
+    def removeEventFilter(self, obj):
+        pass
+
+    def addDockWidget(self, *args):
+        pass
+
+
+class FakeCard:
+    """Card with fixed rendered question/answer HTML"""
+    def __init__(self, card_id, question_html, answer_html, ord=0):
+        self.id = card_id
+        self.nid = card_id
+        self.ord = ord
+        self._question = question_html
+        self._answer = answer_html
+
+    def question(self, reload=False, browser=False):
+        return self._question
+
+    def answer(self):
+        return self._answer
+
+
+def default_config():
+    """The add-on's shipped default config"""
+    with open(os.path.join(ADDON_DIR, "config.json.default"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _install_qt(aqt):
+    try:
+        from PyQt6 import QtCore, QtGui, QtWidgets
+    except ImportError:
+        return
+    qt = types.ModuleType("aqt.qt")
+    for module in (QtCore, QtGui, QtWidgets):
+        for name in dir(module):
+            if not name.startswith("_"):
+                setattr(qt, name, getattr(module, name))
+    try:
+        from PyQt6 import QtWebEngineCore, QtWebEngineWidgets
+        for module in (QtWebEngineCore, QtWebEngineWidgets):
+            for name in dir(module):
+                if not name.startswith("_"):
+                    setattr(qt, name, getattr(module, name))
+    except ImportError:
+        pass
+    sys.modules["aqt.qt"] = qt
+    aqt.qt = qt
+
+
+def install(config=None):
+    """Register the fake aqt modules and return the fake `aqt` module"""
+    if config is None:
+        config = default_config()
+
+    aqt = types.ModuleType("aqt")
+    aqt.__path__ = []
+    aqt.mw = FakeMainWindow(config)
+    aqt.gui_hooks = FakeGuiHooks()
+
+    utils = types.ModuleType("aqt.utils")
+    utils.tooltip = lambda *args, **kwargs: None
+    utils.showInfo = lambda *args, **kwargs: None
+    aqt.utils = utils
+
+    sys.modules["aqt"] = aqt
+    sys.modules["aqt.utils"] = utils
+    _install_qt(aqt)
+    return aqt
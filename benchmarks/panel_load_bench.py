@@ -0,0 +1,232 @@
+"""
+Panel load benchmark with a local stand-in site
+
+Loads a stand-in for openevidence.com in QtWebEngine, with and without the
+add-on's request filter (request_filter.py) on the profile, and reports:
+
+- load      - time from load() to loadFinished
+- requests  - requests that reached the network during the load
+- chatter   - requests made while the page sat idle afterwards (beacons,
+              session-replay uploads, polling)
+
+The stand-in page pulls in the kind of third parties real sites do: a tag
+manager, analytics, session replay, a web font from a font CDN, and scripts
+that keep sending beacons. Every host is served by one local HTTP server that
+the benchmark sets as Qt's application proxy, with added latency for the
+third-party hosts, so nothing leaves the machine.
+
+Requires PyQt6 and PyQt6-WebEngine.
+
+Usage:
+    python -m benchmarks.panel_load_bench [--runs 5] [--idle 3]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIRST_PARTY = "www.openevidence.com"
+THIRD_PARTY_DELAY = 0.15  # Seconds added to every third-party response
+
+# Third-party scripts the stand-in page loads; each keeps beaconing home
+THIRD_PARTY_SCRIPTS = [
+    "http://www.googletagmanager.com/gtm.js",
+    "http://www.google-analytics.com/analytics.js",
+    "http://static.hotjar.com/c/hotjar.js",
+    "http://cdn.segment.com/analytics.js",
+    "http://edge.fullstory.com/s/fs.js",
+    "http://www.clarity.ms/tag/clarity.js",
+]
+
+INDEX_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<title>OpenEvidence (stand-in)</title>
+<link rel="stylesheet" href="/app.css">
+<style>
+@font-face { font-family: "Inter"; src: url("http://fonts.gstatic.com/s/inter/v1/inter.woff2"); }
+body { font-family: "Inter", sans-serif; }
+</style>
+%(scripts)s
+<script src="/app.js"></script>
+</head>
+<body>
+<main><h1>Ask a medical question</h1><textarea placeholder="Ask anything"></textarea></main>
+</body>
+</html>
+"""
+
+APP_JS = """
+document.addEventListener('DOMContentLoaded', function() {
+    navigator.sendBeacon('/telemetry', 'loaded');
+});
+"""
+
+# Served for every third-party script: beacon home every 250 ms
+TRACKER_JS = """
+(function() {
+    var host = '%(host)s';
+    navigator.sendBeacon('http://' + host + '/collect', 'init');
+    setInterval(function() {
+        navigator.sendBeacon('http://' + host + '/collect', 'event');
+        fetch('http://' + host + '/poll', {mode: 'no-cors'}).catch(function() {});
+    }, 250);
+})();
+"""
+
+
+class StandInServer:
+    """HTTP server that answers for every host (used as Qt's proxy)"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = Counter()  # host -> requests seen
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                parts = urlsplit(self.path)
+                host = parts.hostname or self.headers.get("Host", "").split(":")[0]
+                with server.lock:
+                    server.requests[host] += 1
+
+                if host != FIRST_PARTY:
+                    time.sleep(THIRD_PARTY_DELAY)
+
+                body, content_type = server.content(host, parts.path)
+                if self.command == "POST":
+                    self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _respond
+            do_POST = _respond
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def content(self, host, path):
+        if host == FIRST_PARTY:
+            if path in ("", "/"):
+                scripts = "\n".join('<script src="%s"></script>' % url for url in THIRD_PARTY_SCRIPTS)
+                return (INDEX_HTML % {"scripts": scripts}).encode(), "text/html"
+            if path == "/app.js":
+                return APP_JS.encode(), "application/javascript"
+            if path == "/app.css":
+                return b"main { max-width: 640px; margin: 40px auto; }", "text/css"
+            return b"", "text/plain"
+        if path.endswith(".js"):
+            return (TRACKER_JS % {"host": host}).encode(), "application/javascript"
+        if path.endswith(".woff2"):
+            return b"\0" * 40000, "font/woff2"
+        return b"", "text/plain"
+
+    def take(self):
+        """Return and reset the request counts"""
+        with self.lock:
+            counts = self.requests.copy()
+            self.requests.clear()
+        return counts
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+def run_once(app, server, request_filter, filtered):
+    from PyQt6.QtCore import QUrl, QEventLoop, QTimer
+    from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage
+
+    profile = QWebEngineProfile()  # Off the record, so nothing is cached between runs
+    if filtered:
+        request_filter.install(profile)
+    page = QWebEnginePage(profile)
+
+    server.take()
+    loop = QEventLoop()
+    page.loadFinished.connect(lambda ok: loop.quit())
+    start = time.perf_counter()
+    page.load(QUrl("http://%s/" % FIRST_PARTY))
+    QTimer.singleShot(30000, loop.quit)
+    loop.exec()
+    load_ms = (time.perf_counter() - start) * 1000.0
+    during_load = server.take()
+
+    return load_ms, during_load, page, profile
+
+
+def idle(app, seconds):
+    from PyQt6.QtCore import QEventLoop, QTimer
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Panel load benchmark with a local stand-in site")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--idle", type=float, default=3.0, help="seconds of idle time to count chatter")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtCore import Qt, QCoreApplication
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtNetwork import QNetworkProxy
+    # QtWebEngine is imported later (run_once), which needs this set before
+    # the QApplication is created
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication.instance() or QApplication([])
+
+    from ._addon import load
+    request_filter = load("request_filter")
+    request_filter.rules.reload_config()
+
+    server = StandInServer()
+    QNetworkProxy.setApplicationProxy(
+        QNetworkProxy(QNetworkProxy.ProxyType.HttpProxy, "127.0.0.1", server.port))
+
+    try:
+        for filtered in (False, True):
+            loads, requests, chatter = [], [], []
+            for _ in range(args.runs):
+                load_ms, during_load, page, profile = run_once(app, server, request_filter, filtered)
+                idle(app, args.idle)
+                after = server.take()
+                loads.append(load_ms)
+                requests.append(sum(during_load.values()))
+                chatter.append(sum(after.values()))
+                page.deleteLater()
+                profile.deleteLater()
+                app.processEvents()
+
+            loads.sort()
+            requests.sort()
+            chatter.sort()
+            print("%-16s load median %8.1f ms   requests %3d   chatter %3d in %.0fs"
+                  % ("request filter" if filtered else "no filter",
+                     loads[len(loads) // 2], requests[len(requests) // 2],
+                     chatter[len(chatter) // 2], args.idle))
+    finally:
+        server.close()
+
+    print()
+    print("Blocked by host (all filtered runs):")
+    for host, (allowed, blocked) in sorted(request_filter.rules.counts.items()):
+        if blocked:
+            print("  %-32s %d" % (host, blocked))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Headless reviewer soak benchmark
+
+Imports the whole add-on against the fake aqt environment and drives its
+reviewer hooks through a simulated review session: for every card the
+question and answer are shown (card_will_show, reviewer_did_show_question/
+answer), and every few cards the bubble sends webview messages.
+
+Reports:
+- time per flip (one side of a card) - mean, p50, p95, max
+- allocations (tracemalloc) - peak and net growth after warm-up
+- growth of the add-on's global state (containers in its modules and
+  registered hooks) after warm-up
+
+The soak pins the latency budget's full mode (see latency.py) by giving it
+a budget no flip can exceed: reduced mode skips card text extraction and the
+panel's JavaScript push, so a run that drifted into it would measure a
+different, cheaper code path. The result records the mode, and a baseline
+recorded in another mode is refused.
+
+The run fails when a metric regresses past the tolerance of the stored
+baseline (baselines/reviewer_soak.json), and also when there is no baseline
+to compare against, unless --no-baseline is passed. Baselines are
+machine-specific; record one with --update-baseline on the machine that
+runs the comparison.
+
+Requires PyQt6 and PyQt6-WebEngine to be importable (importing the add-on
+imports its panel, which loads QtWebEngine), which in turn needs the X11/ALSA
+client libraries QtWebEngine links against (libXdamage, libXrandr, libXtst,
+libxkbfile, libasound), even without a display. No running Anki or
+QApplication is needed.
+
+Usage:
+    python -m benchmarks.reviewer_soak [--cards 10000] [--update-baseline | --no-baseline]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from . import fake_aqt
+from ._addon import PACKAGE_NAME, load_package
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(HERE, "fixtures", "cards.json")
+BASELINE_PATH = os.path.join(HERE, "baselines", "reviewer_soak.json")
+
+WARMUP_FRACTION = 0.05
+MESSAGE_EVERY = 7  # Cards between simulated bubble messages
+
+# Messages the reviewer web view sends without the panel being involved
+BUBBLE_MESSAGES = [
+    "openevidence:tutorial_event:text_highlighted",
+    "openevidence:tutorial_event:shortcut_used",
+    "ans",
+]
+
+# Timing metrics are compared relatively, memory metrics with an absolute slack
+TIME_METRICS = ("flip_p50_us", "flip_p95_us")
+MEMORY_METRICS = ("alloc_growth_kb",)
+MEMORY_SLACK_KB = 64
+
+# Flip budget that keeps the latency budget in full mode for the whole soak
+FULL_MODE_BUDGET_MS = 1e9
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return [
+        fake_aqt.FakeCard(1000 + i, entry["question"], entry["answer"])
+        for i, entry in enumerate(entries)
+    ]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def global_state_sizes(aqt):
+    """Sizes of container globals in the add-on's modules, plus hook counts"""
+    sizes = {}
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == PACKAGE_NAME or name.startswith(PACKAGE_NAME + ".")):
+            continue
+        for attr, value in list(vars(module).items()):
+            if isinstance(value, (list, dict, set, tuple, deque)) and not attr.startswith("__"):
+                sizes["%s.%s" % (name, attr)] = len(value)
+    for name, hook in aqt.gui_hooks.hooks().items():
+        sizes["gui_hooks.%s" % name] = hook.count()
+    return sizes
+
+
+class Session:
+    """Drives the add-on's registered hooks like the reviewer does"""
+    def __init__(self, aqt, cards):
+        self.aqt = aqt
+        self.cards = cards
+        self.hooks = aqt.gui_hooks
+        self.reviewer = aqt.mw.reviewer
+
+    def show_side(self, card, side):
+        self.reviewer.state = side
+        self.reviewer.card = card
+        if side == "question":
+            html = self.hooks.card_will_show.filter(card.question(), card, "reviewQuestion")
+            self.hooks.reviewer_did_show_question(card)
+        else:
+            html = self.hooks.card_will_show.filter(card.answer(), card, "reviewAnswer")
+            self.hooks.reviewer_did_show_answer(card)
+        return html
+
+    def send_message(self, message):
+        return self.hooks.webview_did_receive_js_message.filter((False, None), message, None)
+
+    def run(self, count, flip_times=None):
+        """Review `count` cards; appends per-flip seconds to flip_times"""
+        clock = time.perf_counter
+        for i in range(count):
+            card = self.cards[i % len(self.cards)]
+            for side in ("question", "answer"):
+                start = clock()
+                self.show_side(card, side)
+                if flip_times is not None:
+                    flip_times.append(clock() - start)
+            if i % MESSAGE_EVERY == 0:
+                self.send_message(BUBBLE_MESSAGES[(i // MESSAGE_EVERY) % len(BUBBLE_MESSAGES)])
+
+
+def run_soak(cards_count):
+    aqt = fake_aqt.install()
+    config = aqt.mw.addonManager.getConfig(PACKAGE_NAME)
+    config["latency_budget_ms"] = FULL_MODE_BUDGET_MS
+    aqt.mw.addonManager.writeConfig(PACKAGE_NAME, config)
+    load_package()
+    budget = sys.modules[PACKAGE_NAME + ".latency"].budget
+    budget.reload_config()
+    session = Session(aqt, load_corpus())
+    warmup = max(1, int(cards_count * WARMUP_FRACTION))
+
+    # Pass 1: timing, without tracemalloc overhead
+    session.run(warmup)
+    flip_times = []
+    gc.collect()
+    session.run(cards_count - warmup, flip_times)
+
+    # Pass 2: allocations and global state growth
+    tracemalloc.start()
+    session.run(warmup)
+    gc.collect()
+    warm_sizes = global_state_sizes(aqt)
+    warm_current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    session.run(cards_count - warmup)
+    gc.collect()
+    end_current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_sizes = global_state_sizes(aqt)
+
+    growth = {
+        key: end_sizes[key] - warm_sizes.get(key, 0)
+        for key in end_sizes
+        if end_sizes[key] > warm_sizes.get(key, 0)
+    }
+    flips_us = [t * 1e6 for t in flip_times]
+    if budget.degraded or budget.mode_changes:
+        raise RuntimeError("latency budget left full mode during the soak")
+
+    return {
+        "cards": cards_count,
+        "flips": len(flips_us),
+        "flip_mean_us": round(sum(flips_us) / len(flips_us), 1),
+        "flip_p50_us": round(percentile(flips_us, 50), 1),
+        "flip_p95_us": round(percentile(flips_us, 95), 1),
+        "flip_max_us": round(max(flips_us), 1),
+        "alloc_peak_kb": round(peak / 1024.0, 1),
+        "alloc_growth_kb": round((end_current - warm_current) / 1024.0, 1),
+        "global_state_growth": growth,
+        "mode": "full",
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Return a list of regression messages"""
+    if baseline.get("mode") != result["mode"]:
+        return ["baseline was not recorded in %s mode - re-record it with --update-baseline"
+                % result["mode"]]
+    failures = []
+    for key in TIME_METRICS:
+        if key in baseline and result[key] > baseline[key] * (1 + tolerance):
+            failures.append("%s: %.1f us vs baseline %.1f us (+%d%% allowed)"
+                            % (key, result[key], baseline[key], tolerance * 100))
+    for key in MEMORY_METRICS:
+        if key in baseline and result[key] > baseline[key] * (1 + tolerance) + MEMORY_SLACK_KB:
+            failures.append("%s: %.1f KB vs baseline %.1f KB" % (key, result[key], baseline[key]))
+    for key, grew in result["global_state_growth"].items():
+        if grew > baseline.get("global_state_growth", {}).get(key, 0):
+            failures.append("global state %s grew by %d entries" % (key, grew))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless reviewer soak benchmark")
+    parser.add_argument("--cards", type=int, default=10000)
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed relative regression (default 0.3 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--no-baseline", action="store_true",
+                        help="only report the results, without comparing to a baseline")
+    args = parser.parse_args()
+
+    result = run_soak(args.cards)
+    print(json.dumps(result, indent=2))
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print("Baseline written to", args.baseline)
+        return 0
+
+    if args.no_baseline:
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline at %s - run with --update-baseline to record one, "
+              "or pass --no-baseline to only report" % args.baseline)
+        return 1
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    failures = compare(result, baseline, args.tolerance)
+    if failures:
+        print("REGRESSION:")
+        for failure in failures:
+            print("  " + failure)
+        return 1
+    print("OK - within %d%% of baseline" % (args.tolerance * 100))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Template list benchmark
+
+Opens the templates list (SettingsListView) with a large template library
+and times what users feel:
+
+- open       - building the view, laying it out and painting the first frame
+- paint      - painting one page of rows through the delegate into an image
+               (called directly, so an exception in paint() fails the run
+               instead of being lost in Qt's event loop)
+- scroll     - scrolling through the whole list, one page at a time
+- delete     - removing one template (config write + model update + repaint)
+- edit       - changing one template in the config and re-syncing the list
+
+Runs with the offscreen Qt platform against the fake aqt. Requires PyQt6.
+
+Usage:
+    python -m benchmarks.settings_list_bench [--templates 1000] [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from . import fake_aqt
+
+KEYS = ["Control", "Shift", "Alt", "Meta"]
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+def make_keybindings(count):
+    keybindings = []
+    for i in range(count):
+        keys = [KEYS[i % len(KEYS)], KEYS[(i // len(KEYS)) % len(KEYS)], LETTERS[i % len(LETTERS)]]
+        keybindings.append({
+            "name": "Template %d" % i,
+            "keys": list(dict.fromkeys(keys)),
+            "question_template": "Template %d: explain the mechanism of {front} in detail" % i,
+            "answer_template": "Question:\n{front}\n\nAnswer:\n{back}",
+        })
+    return keybindings
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def run_once(app, settings_list, count):
+    aqt = sys.modules["aqt"]
+    config = aqt.mw.addonManager.getConfig(__name__)
+    config["keybindings"] = make_keybindings(count)
+    aqt.mw.addonManager.writeConfig(__name__, config)
+    settings_list._model = None  # Start from an empty model, like a fresh session
+
+    results = {}
+    holder = {}
+
+    def open_view():
+        view = settings_list.SettingsListView(None)
+        view.resize(400, 700)
+        view.show()
+        app.processEvents()
+        holder["view"] = view
+    results["open"] = timed(open_view)
+    view = holder["view"]
+
+    def paint():
+        from PyQt6.QtGui import QImage, QPainter
+        from PyQt6.QtWidgets import QStyleOptionViewItem
+        list_view = view.list_view
+        delegate = list_view.itemDelegate()
+        model = list_view.model()
+        rows = min(model.rowCount(), list_view.viewport().height() // settings_list.ROW_HEIGHT + 1)
+        assert rows > 0, "templates list has no rows to paint"
+        image = QImage(list_view.viewport().size(), QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        try:
+            for row in range(rows):
+                index = model.index(row, 0)
+                option = QStyleOptionViewItem()
+                option.rect = list_view.visualRect(index)
+                delegate.paint(painter, option, index)
+        finally:
+            painter.end()
+    results["paint"] = timed(paint)
+
+    def scroll():
+        bar = view.list_view.verticalScrollBar()
+        position = 0
+        while position < bar.maximum():
+            position += bar.pageStep()
+            bar.setValue(position)
+            view.list_view.viewport().repaint()
+    results["scroll"] = timed(scroll)
+
+    def delete():
+        view.delete_keybinding(count // 2)
+        app.processEvents()
+    results["delete"] = timed(delete)
+
+    def edit():
+        config = aqt.mw.addonManager.getConfig(__name__)
+        config["keybindings"][10]["question_template"] = "Edited {front}"
+        aqt.mw.addonManager.writeConfig(__name__, config)
+        view.load_keybindings()
+        app.processEvents()
+    results["edit"] = timed(edit)
+
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Template list benchmark")
+    parser.add_argument("--templates", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    fake_aqt.install()
+    from ._addon import load
+    settings_list = load("settings_list")
+    # Deleting refreshes the panel through the package's dock_widget, which
+    # load() doesn't create (__init__.py isn't run)
+    sys.modules[settings_list.__package__].dock_widget = None
+
+    runs = [run_once(app, settings_list, args.templates) for _ in range(args.runs)]
+    print("%d templates, %d runs" % (args.templates, args.runs))
+    for metric in ("open", "paint", "scroll", "delete", "edit"):
+        samples = sorted(run[metric] for run in runs)
+        print("%-8s median %8.2f ms  (min %.2f, max %.2f)"
+              % (metric, samples[len(samples) // 2], samples[0], samples[-1]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Settings startup cost benchmark
+
+Measures what the settings UI costs and when it's paid. The settings views
+are built on the first gear click, so Anki's startup path only imports the
+`settings` module itself; before, it imported every settings view module and
+built SettingsHomeView while the panel was created.
+
+Each measurement runs in a fresh interpreter (so module caching doesn't hide
+import time), after Qt and the fake aqt are already imported:
+
+- startup import - `settings` as imported at startup now
+- eager import   - the settings view modules the old startup path imported
+- construction   - building SettingsHomeView (needs a QApplication; run
+                   with the offscreen Qt platform)
+
+Requires PyQt6.
+
+Usage:
+    python -m benchmarks.startup_bench [--runs 10]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Qt modules the settings views use, imported before timing starts
+QT_MODULES = ["PyQt6.QtCore", "PyQt6.QtGui", "PyQt6.QtWidgets", "PyQt6.QtSvg"]
+
+# Modules `from .settings import ...` used to pull in at startup
+EAGER_MODULES = ["settings_utils", "settings_home", "settings_editor", "settings_list"]
+
+MEASUREMENTS = [
+    ("startup", "Startup import (lazy settings)"),
+    ("eager", "Eager import of settings views"),
+    ("construct", "SettingsHomeView construction"),
+]
+
+
+def _prepare():
+    """Import Qt and the fake aqt so only the add-on's own code is timed"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    for module_name in QT_MODULES:
+        importlib.import_module(module_name)
+    from ._addon import load
+    return load
+
+
+def measure(kind):
+    """Run one measurement in this interpreter and return milliseconds"""
+    load = _prepare()
+
+    if kind == "startup":
+        start = time.perf_counter()
+        load("settings")
+        return (time.perf_counter() - start) * 1000.0
+
+    if kind == "eager":
+        start = time.perf_counter()
+        for module_name in EAGER_MODULES:
+            load(module_name)
+        return (time.perf_counter() - start) * 1000.0
+
+    if kind == "construct":
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([])
+        settings_home = load("settings_home")
+        start = time.perf_counter()
+        view = settings_home.SettingsHomeView(None)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        view.deleteLater()
+        app.processEvents()
+        return elapsed
+
+    raise ValueError("unknown measurement: %s" % kind)
+
+
+def run_child(kind):
+    output = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.startup_bench", "--child", kind],
+        cwd=ROOT,
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])["ms"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settings startup cost benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps({"ms": measure(args.child)}))
+        return 0
+
+    results = {}
+    for kind, label in MEASUREMENTS:
+        samples = sorted(run_child(kind) for _ in range(args.runs))
+        results[kind] = samples[len(samples) // 2]
+        print("%-34s median %8.2f ms  (min %.2f, max %.2f, %d runs)"
+              % (label, results[kind], samples[0], samples[-1], args.runs))
+
+    saved = results["eager"] + results["construct"] - results["startup"]
+    print()
+    print("Startup time saved: %.2f ms (paid on the first gear click instead)" % saved)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""
+Connectivity-aware loading for the OpenEvidence panel.
+
+When the panel's page fails to load (Anki started offline, a captive portal,
+flaky Wi-Fi), ConnectivityLoader replaces the broken page with a small
+native offline view and brings the page back by itself:
+
+- Retries wait with exponential backoff and jitter (RETRY_BASE_MS doubling
+  up to RETRY_MAX_MS, each delay picked at random from its upper half).
+- A retry first sends a HEAD request for the homepage with
+  QNetworkAccessManager. The page is only loaded again once that succeeds,
+  so failed retries never touch the renderer.
+- Where Qt has a QNetworkInformation backend, retries are skipped while the
+  system reports no network, and a retry runs at once when it reports the
+  network is back.
+
+If the network is reachable but resuming the saved conversation fails (see
+conversation_resume.py), the homepage is loaded instead. Loads that fail
+because the renderer crashed are left to RendererRecovery.
+"""
+
+import random
+import time
+
+try:
+    from PyQt6.QtCore import QObject, QTimer, QUrl, Qt
+    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
+    from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+except ImportError:
+    from PyQt5.QtCore import QObject, QTimer, QUrl, Qt
+    from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
+    from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+try:
+    from PyQt6.QtNetwork import QNetworkInformation
+except ImportError:
+    QNetworkInformation = None  # Qt < 6.1
+
+from .diagnostics import register_section
+from .renderer_recovery import HOME_URL
+
+RETRY_BASE_MS = 1000
+RETRY_MAX_MS = 60000
+PROBE_TIMEOUT_MS = 8000
+# A failed load followed this soon by another load was just interrupted
+ABORT_GRACE_MS = 250
+
+
+class ConnectivityStats:
+    """Offline episodes and retries, shared by every panel of the session"""
+    def __init__(self):
+        self.failed_loads = 0
+        self.episodes = 0
+        self.probes = 0
+        self.probe_failures = 0
+        self.network_events = 0
+        self.offline_since = None
+        self.last_offline_s = None
+        self.backend = None
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        if self.offline_since is not None:
+            status = "Offline for %.0f s" % (time.time() - self.offline_since)
+        else:
+            status = "Online"
+        rows = [
+            ("Status", status),
+            ("Network backend", self.backend or "None (probes only)"),
+            ("Failed loads", str(self.failed_loads)),
+            ("Offline episodes", str(self.episodes)),
+            ("Probes", "%d sent, %d failed" % (self.probes, self.probe_failures)),
+            ("Network back events", str(self.network_events)),
+        ]
+        if self.last_offline_s is not None:
+            rows.append(("Last episode", "%.0f s" % self.last_offline_s))
+        return rows
+
+
+stats = ConnectivityStats()
+
+_network_information = None
+
+
+def network_information():
+    """The QNetworkInformation instance, or None without a usable backend"""
+    global _network_information
+    if _network_information is None and QNetworkInformation is not None:
+        try:
+            if hasattr(QNetworkInformation, "loadDefaultBackend"):
+                loaded = QNetworkInformation.loadDefaultBackend()
+            else:
+                loaded = QNetworkInformation.load(QNetworkInformation.Feature.Reachability)
+            if loaded:
+                _network_information = QNetworkInformation.instance()
+                stats.backend = _network_information.backendName()
+        except Exception as e:
+            print(f"OpenEvidence: No network information backend: {e}")
+    return _network_information
+
+
+def _system_offline():
+    """True only when the system positively reports no network"""
+    info = network_information()
+    if info is None:
+        return False
+    try:
+        return info.reachability() == QNetworkInformation.Reachability.Disconnected
+    except:
+        return False
+
+
+class OfflineView(QWidget):
+    """Native placeholder shown instead of a page that failed to load"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("offlineView")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(32, 32, 32, 32)
+        layout.setSpacing(8)
+        layout.addStretch()
+
+        self.title = QLabel()
+        self.title.setObjectName("offlineTitle")
+        self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.title)
+
+        self.message = QLabel()
+        self.message.setObjectName("offlineMessage")
+        self.message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.message.setWordWrap(True)
+        layout.addWidget(self.message)
+
+        self.retry_button = QPushButton("Try again")
+        self.retry_button.setObjectName("primaryButton")
+        self.retry_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(self.retry_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        layout.addStretch()
+
+    def set_state(self, offline, seconds=None):
+        if offline:
+            self.title.setText("You're offline")
+            waiting = "OpenEvidence will load as soon as you're back online."
+        else:
+            self.title.setText("Can't reach OpenEvidence")
+            waiting = "It will load as soon as the site responds."
+        if seconds:
+            waiting += " Retrying in %d s." % seconds
+        elif seconds == 0:
+            waiting = "Checking the connection…"
+        self.message.setText(waiting)
+
+
+class ConnectivityLoader(QObject):
+    """Shows the offline view when the panel's page fails and reloads it when possible"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.offline = False
+        self.attempts = 0
+        self.retry_url = QUrl(HOME_URL)
+        self._load_seq = 0
+        self._probe = None
+        self._reachable = False     # Last probe got an answer
+        self._probed_load = False   # Current load was started after a good probe
+        self._retry_at = None
+
+        self.view = OfflineView(panel.web_container)
+        self.view.retry_button.clicked.connect(self.retry_now)
+        self.view.hide()
+        panel.web_container.layout().addWidget(self.view)
+
+        self.network = QNetworkAccessManager(self)
+
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self._retry)
+
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(1000)
+        self.countdown_timer.timeout.connect(self._update_countdown)
+
+        panel.web.loadStarted.connect(self._on_load_started)
+        panel.web.loadFinished.connect(self._on_load_finished)
+
+        info = network_information()
+        if info is not None:
+            info.reachabilityChanged.connect(self._on_reachability_changed)
+
+    def _on_load_started(self):
+        self._load_seq += 1
+
+    def _on_load_finished(self, ok):
+        if ok:
+            self._probed_load = False
+            if self.offline:
+                self._back_online()
+            return
+        recovery = getattr(self.panel, "renderer_recovery", None)
+        if recovery is not None and recovery.recovering:
+            return
+        seq = self._load_seq
+        QTimer.singleShot(ABORT_GRACE_MS, lambda: self._on_load_failed(seq))
+
+    def _on_load_failed(self, seq):
+        if seq != self._load_seq:
+            return  # Interrupted by a newer navigation, not a failure
+        stats.failed_loads += 1
+        url = self.panel.web.url()
+        if url.isValid() and url.host().endswith("openevidence.com"):
+            self.retry_url = QUrl(url)
+
+        resume = getattr(self.panel, "conversation_resume", None)
+        if self._probed_load and resume is not None and resume.resuming:
+            # The network is fine - it's the saved conversation that won't load
+            self._probed_load = False
+            self._load(resume.fall_back())
+            return
+        self._probed_load = False
+
+        if not self.offline:
+            self.offline = True
+            stats.episodes += 1
+            stats.offline_since = time.time()
+            print("OpenEvidence: Panel page failed to load, waiting for the network")
+        self._show_view()
+        self._schedule_retry()
+
+    def _show_view(self):
+        panel = self.panel
+        try:
+            panel.web.hide()
+            panel.loading_overlay.hide()
+        except:
+            pass
+        self.view.show()
+        self.view.raise_()
+
+    def _schedule_retry(self):
+        delay = min(RETRY_BASE_MS * (2 ** self.attempts), RETRY_MAX_MS)
+        delay = random.uniform(delay / 2.0, delay)
+        self.attempts += 1
+        self._retry_at = time.monotonic() + delay / 1000.0
+        self.retry_timer.start(int(delay))
+        self.countdown_timer.start()
+        self._update_countdown()
+
+    def _update_countdown(self):
+        if self._retry_at is None:
+            self.countdown_timer.stop()
+            return
+        seconds = max(1, int(round(self._retry_at - time.monotonic())))
+        self.view.set_state(_system_offline() or not self._reachable, seconds)
+
+    def retry_now(self):
+        """Retry at once (Try again button, or the network came back)"""
+        if not self.offline:
+            return
+        self.retry_timer.stop()
+        self._retry(force=True)
+
+    def _retry(self, force=False):
+        self._retry_at = None
+        self.countdown_timer.stop()
+        if self._probe is not None:
+            return
+        if not force and _system_offline():
+            # Nothing to probe with - wait for reachabilityChanged or the next retry
+            self._schedule_retry()
+            return
+        self.view.set_state(not self._reachable, 0)
+        self._send_probe()
+
+    def _send_probe(self):
+        stats.probes += 1
+        request = QNetworkRequest(QUrl(HOME_URL))
+        try:
+            request.setTransferTimeout(PROBE_TIMEOUT_MS)
+        except AttributeError:
+            pass  # Qt < 5.15: the OS connect timeout applies
+        self._probe = self.network.head(request)
+        self._probe.finished.connect(self._on_probe_finished)
+
+    def _on_probe_finished(self):
+        reply, self._probe = self._probe, None
+        if reply is None:
+            return
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        # Any HTTP answer means the site is reachable
+        self._reachable = reply.error() == QNetworkReply.NetworkError.NoError or status is not None
+        reply.deleteLater()
+        if not self.offline:
+            return
+
+        if self._reachable:
+            self._load(self.retry_url)
+        else:
+            stats.probe_failures += 1
+            self._schedule_retry()
+
+    def _load(self, url):
+        """Load the page again behind the usual loading overlay"""
+        self._probed_load = True
+        self.view.hide()
+        panel = self.panel
+        try:
+            panel.loading_overlay.show()
+            panel.loading_overlay.raise_()
+            panel.web.load(url)
+        except Exception as e:
+            print(f"OpenEvidence: Error reloading panel: {e}")
+
+    def _back_online(self):
+        self.offline = False
+        self.attempts = 0
+        self._retry_at = None
+        self.retry_timer.stop()
+        self.countdown_timer.stop()
+        self.view.hide()
+        if stats.offline_since is not None:
+            stats.last_offline_s = time.time() - stats.offline_since
+            print("OpenEvidence: Panel page loaded after %.0f s offline" % stats.last_offline_s)
+        stats.offline_since = None
+
+    def _on_reachability_changed(self, reachability):
+        if reachability == QNetworkInformation.Reachability.Online and self.offline:
+            stats.network_events += 1
+            self.retry_now()
+
+
+register_section("Connectivity", stats.diagnostics)
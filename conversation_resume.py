@@ -0,0 +1,122 @@
+"""
+Resume the last OpenEvidence conversation when Anki starts.
+
+The panel preloads OpenEvidence at startup. Without this, it always opened
+the homepage, and a user in the middle of a thread had to navigate back to
+it. ConversationResume follows the panel's urlChanged, saves the last
+conversation URL to the config ("last_conversation", written a moment
+after the URL settles, and only when it changed), and start_url() hands
+it to the preload next time. The preload then goes straight there with no
+extra navigation.
+
+A saved URL is only used until it's "expiry_hours" old (the
+"resume_conversation" config section). If it fails to load while the
+network is up, ConnectivityLoader (connectivity.py) calls fall_back() and
+the homepage is loaded instead; the URL is forgotten. Going back to the
+homepage forgets it too.
+"""
+
+import time
+
+try:
+    from PyQt6.QtCore import QObject, QTimer, QUrl
+except ImportError:
+    from PyQt5.QtCore import QObject, QTimer, QUrl
+
+from aqt import mw
+
+from .renderer_recovery import HOME_URL
+
+DEFAULT_EXPIRY_HOURS = 24
+SAVE_DELAY_MS = 2000
+
+# Site paths that aren't a conversation (sign-in flow and the like)
+NON_CONVERSATION_PREFIXES = ("/login", "/signup", "/sign-up", "/auth", "/logout", "/callback", "/api/")
+
+
+def _read_config():
+    try:
+        return mw.addonManager.getConfig(__name__) or {}
+    except:
+        return {}
+
+
+def is_conversation_url(url):
+    """True for an OpenEvidence page worth returning to (not the homepage)"""
+    if url.scheme() != "https" or not url.host().endswith("openevidence.com"):
+        return False
+    path = url.path() or "/"
+    return path != "/" and not path.lower().startswith(NON_CONVERSATION_PREFIXES)
+
+
+def start_url():
+    """URL the panel should preload: the saved conversation or the homepage"""
+    config = _read_config()
+    settings = config.get("resume_conversation", {})
+    saved = config.get("last_conversation") or {}
+    if not settings.get("enabled", True) or not saved.get("url"):
+        return QUrl(HOME_URL)
+
+    expiry_hours = float(settings.get("expiry_hours", DEFAULT_EXPIRY_HOURS))
+    age_hours = (time.time() - float(saved.get("saved_at", 0))) / 3600.0
+    url = QUrl(saved["url"])
+    if age_hours > expiry_hours or not url.isValid() or not is_conversation_url(url):
+        return QUrl(HOME_URL)
+    return url
+
+
+class ConversationResume(QObject):
+    """Saves the panel's conversation URL and falls back if resuming fails"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.start_url = start_url()
+        self.resuming = self.start_url.toString() != HOME_URL
+        self._saved_url = self.start_url.toString() if self.resuming else None
+        self._pending_url = None
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self._save)
+
+        panel.web.urlChanged.connect(self._on_url_changed)
+        panel.web.loadFinished.connect(self._on_load_finished)
+
+    def _on_url_changed(self, url):
+        if not url.host().endswith("openevidence.com"):
+            return
+        if is_conversation_url(url):
+            self._pending_url = url.toString()
+        elif (url.path() or "/") == "/":
+            self._pending_url = ""  # Back on the homepage - nothing to resume
+        else:
+            return
+        self.save_timer.start()
+
+    def _on_load_finished(self, ok):
+        if ok:
+            self.resuming = False
+
+    def fall_back(self):
+        """Give up on the saved conversation and return the homepage URL"""
+        print("OpenEvidence: Couldn't resume the last conversation, loading the homepage")
+        self.resuming = False
+        self._pending_url = ""
+        self._save()
+        return QUrl(HOME_URL)
+
+    def _save(self):
+        url = self._pending_url
+        self._pending_url = None
+        if url is None or url == (self._saved_url or ""):
+            return
+        try:
+            config = mw.addonManager.getConfig(__name__) or {}
+            if not config.get("resume_conversation", {}).get("enabled", True):
+                return
+            config["last_conversation"] = {"url": url, "saved_at": time.time()} if url else {}
+            mw.addonManager.writeConfig(__name__, config)
+            self._saved_url = url
+        except Exception as e:
+            print(f"OpenEvidence: Error saving conversation URL: {e}")
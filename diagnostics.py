@@ -0,0 +1,29 @@
+"""
+Diagnostics registry for the OpenEvidence add-on.
+
+Modules that track runtime health (latency, web view, network...) register a
+section here; the Diagnostics settings view renders whatever is registered.
+A provider returns a list of (label, value) rows and is only called when the
+view is opened or refreshed.
+"""
+
+from collections import OrderedDict
+
+_sections = OrderedDict()
+
+
+def register_section(title, provider):
+    """Register (or replace) a diagnostics section"""
+    _sections[title] = provider
+
+
+def collect():
+    """Return [(title, [(label, value), ...]), ...] for all registered sections"""
+    results = []
+    for title, provider in _sections.items():
+        try:
+            rows = provider() or []
+        except Exception as e:
+            rows = [("Error", str(e))]
+        results.append((title, rows))
+    return results
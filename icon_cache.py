@@ -0,0 +1,137 @@
+"""
+Shared SVG icon cache for the OpenEvidence add-on.
+
+Each SVG is parsed and rasterized once per (svg hash, size, color, device
+pixel ratio) and reused by every widget that shows it. The least recently
+used pixmaps are dropped once the cache is full, and the whole cache is
+cleared when Anki's theme or the set of screens changes.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt, QByteArray
+    from PyQt6.QtGui import QPixmap, QPainter, QColor, QIcon
+    from PyQt6.QtSvg import QSvgRenderer
+except ImportError:
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt, QByteArray
+    from PyQt5.QtGui import QPixmap, QPainter, QColor, QIcon
+    from PyQt5.QtSvg import QSvgRenderer
+
+from .diagnostics import register_section
+
+MAX_ENTRIES = 64
+
+_pixmaps = OrderedDict()   # (svg hash, width, height, color, dpr) -> QPixmap
+_svg_hashes = {}           # svg text -> hash, so SVGs aren't rehashed per lookup
+_invalidation_connected = False
+hits = 0
+misses = 0
+
+
+def _svg_hash(svg):
+    digest = _svg_hashes.get(svg)
+    if digest is None:
+        digest = _svg_hashes[svg] = hashlib.sha1(svg.encode()).hexdigest()
+    return digest
+
+
+def _device_pixel_ratio(widget=None):
+    try:
+        if widget is not None:
+            return widget.devicePixelRatioF()
+        return QApplication.primaryScreen().devicePixelRatio()
+    except:
+        return 1.0
+
+
+def _render(svg, width, height, color, dpr):
+    pixmap = QPixmap(int(round(width * dpr)), int(round(height * dpr)))
+    try:
+        pixmap.fill(Qt.GlobalColor.transparent)
+    except:
+        pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    QSvgRenderer(QByteArray(svg.encode())).render(painter)
+    if color:
+        # Tint: keep the icon's alpha, replace its color
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), QColor(color))
+    painter.end()
+
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+def svg_pixmap(svg, size, color=None, widget=None):
+    """
+    Pixmap of an SVG at a logical size (int or (width, height)).
+
+    Rendered at the device pixel ratio of `widget` (or the primary screen)
+    and tinted with `color` if given.
+    """
+    global hits, misses
+    _connect_invalidation()
+
+    width, height = size if isinstance(size, tuple) else (size, size)
+    dpr = _device_pixel_ratio(widget)
+    key = (_svg_hash(svg), width, height, color, dpr)
+
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None:
+        _pixmaps.move_to_end(key)
+        hits += 1
+        return pixmap
+
+    misses += 1
+    pixmap = _pixmaps[key] = _render(svg, width, height, color, dpr)
+    while len(_pixmaps) > MAX_ENTRIES:
+        _pixmaps.popitem(last=False)
+    return pixmap
+
+
+def svg_icon(svg, size, color=None, widget=None):
+    """QIcon of an SVG (see svg_pixmap)"""
+    return QIcon(svg_pixmap(svg, size, color, widget))
+
+
+def clear(*args):
+    """Drop all cached pixmaps"""
+    _pixmaps.clear()
+
+
+def _connect_invalidation():
+    """Clear the cache on theme and screen changes (once a QApplication exists)"""
+    global _invalidation_connected
+    if _invalidation_connected:
+        return
+    _invalidation_connected = True
+
+    try:
+        from aqt import gui_hooks
+        gui_hooks.theme_did_change.append(clear)
+    except:
+        pass
+
+    try:
+        app = QApplication.instance()
+        app.screenAdded.connect(clear)
+        app.screenRemoved.connect(clear)
+        app.primaryScreenChanged.connect(clear)
+    except:
+        pass
+
+
+def diagnostics():
+    """Rows for the Diagnostics view"""
+    return [
+        ("Cached icons", "%d of %d" % (len(_pixmaps), MAX_ENTRIES)),
+        ("Hits / misses", "%d / %d" % (hits, misses)),
+    ]
+
+
+register_section("Icon Cache", diagnostics)
@@ -0,0 +1,165 @@
+"""
+Live locator for OpenEvidence's chat inputs.
+
+Scripts that act on the panel's page (Add to Chat, Ask Question, the ready
+check, the tutorial's chat input target) all need the page's main search
+input or its follow-up input. Instead of each running broad selectors over
+the whole document, LOCATOR_JS installs window.ankiInputs in the page:
+
+- main()      - the main search input
+- followUp()  - the follow-up input of an active conversation
+- target()    - where new text goes: followUp() if there is one, else main()
+- thread()    - the container answers render into (not cached: only looked
+                up once per submitted question)
+
+Both inputs are looked up once and cached. A MutationObserver marks the
+cache stale only when an input/textarea is added, or a cached input is
+removed or has its placeholder changed, so lookups are a property read
+while the site streams answers.
+
+The selector rules live here (MAIN_INPUT_SELECTORS / FOLLOW_UP_SELECTORS /
+THREAD_SELECTORS) so they can be updated in one place when the site
+changes.
+"""
+
+import json
+
+try:
+    from PyQt6.QtWebEngineCore import QWebEngineScript
+except ImportError:
+    try:
+        from PyQt5.QtWebEngineWidgets import QWebEngineScript
+    except ImportError:
+        QWebEngineScript = None
+
+# In priority order: the first rule with a match wins
+MAIN_INPUT_SELECTORS = [
+    'input[placeholder*="medical"]',
+    'input[placeholder*="question"]',
+    'textarea',
+    'input[type="text"]',
+]
+FOLLOW_UP_SELECTORS = [
+    'input[placeholder*="follow-up"]',
+    'input[placeholder*="Follow-up"]',
+    'textarea[placeholder*="follow-up"]',
+]
+# Containers the conversation's answers render into
+THREAD_SELECTORS = [
+    '[role="log"]',
+    '[data-testid*="thread"]',
+    '[data-testid*="answer"]',
+    'main [class*="thread"]',
+    'main [class*="conversation"]',
+    'main article',
+]
+
+SCRIPT_NAME = "ankiInputLocator"
+
+LOCATOR_JS = """
+(function() {
+    if (window.ankiInputs) {
+        return;
+    }
+
+    var RULES = {
+        main: %(main)s,
+        followUp: %(follow_up)s,
+        thread: %(thread)s
+    };
+    var cache = { main: null, followUp: null };
+    var stale = true;
+    var scans = 0;
+
+    function find(selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var element = document.querySelector(selectors[i]);
+            if (element) {
+                return element;
+            }
+        }
+        return null;
+    }
+
+    function current(name) {
+        var element = cache[name];
+        if (stale || (element && !element.isConnected)) {
+            scans++;
+            cache.main = find(RULES.main);
+            cache.followUp = find(RULES.followUp);
+            stale = false;
+            element = cache[name];
+        }
+        return element;
+    }
+
+    function isInput(node) {
+        return node.nodeType === 1 && (node.tagName === 'INPUT' || node.tagName === 'TEXTAREA' ||
+            (node.firstElementChild && node.querySelector('input, textarea')));
+    }
+
+    var observer = new MutationObserver(function(mutations) {
+        if (stale) {
+            return;
+        }
+        for (var i = 0; i < mutations.length; i++) {
+            var mutation = mutations[i];
+            if (mutation.type === 'attributes') {
+                if (mutation.target === cache.main || mutation.target === cache.followUp ||
+                    isInput(mutation.target)) {
+                    stale = true;
+                    return;
+                }
+                continue;
+            }
+            for (var j = 0; j < mutation.addedNodes.length; j++) {
+                if (isInput(mutation.addedNodes[j])) {
+                    stale = true;
+                    return;
+                }
+            }
+            if (mutation.removedNodes.length &&
+                ((cache.main && !cache.main.isConnected) || (cache.followUp && !cache.followUp.isConnected))) {
+                stale = true;
+                return;
+            }
+        }
+    });
+    observer.observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['placeholder', 'type']
+    });
+
+    window.ankiInputs = {
+        main: function() { return current('main'); },
+        followUp: function() { return current('followUp'); },
+        target: function() { return current('followUp') || current('main'); },
+        thread: function() { return find(RULES.thread); },
+        stats: function() { return { scans: scans, stale: stale }; }
+    };
+})();
+""" % {
+    "main": json.dumps(MAIN_INPUT_SELECTORS),
+    "follow_up": json.dumps(FOLLOW_UP_SELECTORS),
+    "thread": json.dumps(THREAD_SELECTORS),
+}
+
+
+def install(page):
+    """Run LOCATOR_JS in every document the page loads, from its creation"""
+    if QWebEngineScript is None:
+        return False
+    try:
+        script = QWebEngineScript()
+        script.setName(SCRIPT_NAME)
+        script.setSourceCode(LOCATOR_JS)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setRunsOnSubFrames(False)
+        page.scripts().insert(script)
+        return True
+    except Exception as e:
+        print(f"OpenEvidence: Error installing input locator: {e}")
+        return False
@@ -0,0 +1,173 @@
+"""
+Shared keyboard chord matcher for the reviewer and panel web views.
+
+Both the reviewer's quick action shortcuts and the panel's template shortcuts
+use the same JavaScript matcher: every keydown is normalized once to a
+canonical chord string (e.g. "Control+Shift+S") and looked up in a table
+compiled from the configured bindings, so the cost of a keystroke does not
+depend on how many templates exist.
+"""
+
+import json
+
+# Canonical modifier order - chords are always written in this order,
+# followed by the regular key(s)
+MODIFIER_ORDER = ["Control", "Meta", "Control/Meta", "Alt", "Shift"]
+
+
+def canonical_chord(keys):
+    """Return the canonical chord string for a list of key names.
+
+    Two bindings with the same keys in a different order produce the same
+    chord, e.g. ["Shift", "Control", "S"] and ["Control", "Shift", "S"].
+    """
+    if not keys:
+        return ""
+    modifiers = [m for m in MODIFIER_ORDER if m in keys]
+    others = sorted(k for k in keys if k not in MODIFIER_ORDER)
+    return "+".join(modifiers + others)
+
+
+# JavaScript matcher. Installs window.ankiChord once per document.
+CHORD_MATCHER_JS = """
+(function() {
+    if (window.ankiChord) {
+        return;
+    }
+
+    var isMac = navigator.platform.toUpperCase().indexOf('MAC') >= 0;
+    var MODIFIER_ORDER = %(modifier_order)s;
+    var ALNUM_RE = /^[A-Za-z0-9]$/;
+    var CODE_RE = /^(Key|Digit)([A-Z0-9])$/;
+
+    // Canonical chord for a configured key list (mirrors key_matcher.canonical_chord)
+    function canonical(keys) {
+        if (!keys || keys.length === 0) return '';
+        var modifiers = [];
+        for (var i = 0; i < MODIFIER_ORDER.length; i++) {
+            if (keys.indexOf(MODIFIER_ORDER[i]) !== -1) modifiers.push(MODIFIER_ORDER[i]);
+        }
+        var others = [];
+        for (var j = 0; j < keys.length; j++) {
+            if (MODIFIER_ORDER.indexOf(keys[j]) === -1) others.push(keys[j]);
+        }
+        others.sort();
+        return modifiers.concat(others).join('+');
+    }
+
+    function hasControl(e) {
+        return isMac ? e.ctrlKey : (e.ctrlKey || e.metaKey);
+    }
+
+    // Modifier part of an event's chord, e.g. "Control+Shift+".
+    // On macOS the browser reports Cmd as metaKey and Control as ctrlKey;
+    // elsewhere both are treated as "Control/Meta" for cross-platform bindings.
+    function modifierPrefix(e) {
+        var prefix = '';
+        if (isMac) {
+            if (e.ctrlKey) prefix += 'Control+';
+            if (e.metaKey) prefix += 'Meta+';
+        } else if (e.ctrlKey || e.metaKey) {
+            prefix += 'Control/Meta+';
+        }
+        if (e.altKey) prefix += 'Alt+';
+        if (e.shiftKey) prefix += 'Shift+';
+        return prefix;
+    }
+
+    // The regular key as typed (e.key), e.g. "S" or "!"
+    function typedKey(e) {
+        return (e.key && e.key.length === 1) ? e.key.toUpperCase() : '';
+    }
+
+    // The physical letter/digit (e.code). On macOS, Control+T might give e.key as
+    // "Tab" (browser shortcut) but e.code as "KeyT", and Alt turns e.key into a symbol.
+    function physicalKey(e) {
+        var codeMatch = e.code ? CODE_RE.exec(e.code) : null;
+        return codeMatch ? codeMatch[2] : '';
+    }
+
+    function join(prefix, key) {
+        return key ? prefix + key : prefix.slice(0, -1);
+    }
+
+    // Normalize a keyboard event to its canonical chord string
+    function fromEvent(e) {
+        var key = typedKey(e);
+        if (!ALNUM_RE.test(key)) {
+            key = physicalKey(e) || key;
+        }
+        return join(modifierPrefix(e), key);
+    }
+
+    // Compile bindings ([{keys: [...]}, ...]) into a chord -> index table.
+    // The first binding wins when two share a chord.
+    function compile(bindings) {
+        var chords = Object.create(null);
+        var usesControl = false;
+        for (var i = 0; i < bindings.length; i++) {
+            var keys = bindings[i] && bindings[i].keys;
+            var chord = canonical(keys);
+            if (!chord) continue;
+            if (!(chord in chords)) chords[chord] = i;
+            if (keys.indexOf('Control') !== -1) usesControl = true;
+        }
+        return { chords: chords, usesControl: usesControl };
+    }
+
+    // A matcher caches the compiled table for the last bindings array it saw,
+    // so callers only pay for compilation when the bindings are replaced.
+    function createMatcher() {
+        var source = null;
+        var table = null;
+
+        function current(bindings) {
+            if (bindings !== source) {
+                source = bindings;
+                table = compile(bindings || []);
+            }
+            return table;
+        }
+
+        return {
+            // Index of the matching binding, or -1.
+            // Looks up the typed key first, then the physical key: at most two lookups.
+            match: function(e, bindings) {
+                var chords = current(bindings).chords;
+                var prefix = modifierPrefix(e);
+                var typed = typedKey(e);
+                var chord = join(prefix, typed);
+                var index = chords[chord];
+                if (index === undefined) {
+                    var physical = physicalKey(e);
+                    if (physical && physical !== typed) {
+                        chord = prefix + physical;
+                        index = chords[chord];
+                    }
+                }
+                if (window.ankiChordDebug) {
+                    console.log('Anki chord:', chord, index === undefined ? 'no match' : 'binding ' + index);
+                }
+                return index === undefined ? -1 : index;
+            },
+            // True if this is a Control combination and some binding uses Control
+            claimsControl: function(e, bindings) {
+                return current(bindings).usesControl && hasControl(e);
+            }
+        };
+    }
+
+    window.ankiChord = {
+        isMac: isMac,
+        canonical: canonical,
+        fromEvent: fromEvent,
+        compile: compile,
+        createMatcher: createMatcher
+    };
+})();
+""" % {"modifier_order": json.dumps(MODIFIER_ORDER)}
+
+
+def chord_matcher_script(debug=False):
+    """JavaScript that installs the chord matcher and sets its debug flag"""
+    return "window.ankiChordDebug = %s;\n%s" % ("true" if debug else "false", CHORD_MATCHER_JS)
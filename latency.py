@@ -0,0 +1,194 @@
+"""
+Reviewer latency budget for the OpenEvidence add-on.
+
+Every reviewer hook the add-on registers is timed, and the time it adds to
+each card flip is tracked as a rolling p50/p95. When the p95 flip cost goes
+over the configured budget ("latency_budget_ms"), the add-on switches to a
+reduced mode:
+
+- Card text is extracted lazily instead of on every flip
+- The panel's card texts are only pushed to JavaScript while the panel is visible
+
+While in reduced mode, every PROBE_INTERVAL-th flip runs in full mode to
+measure what full mode would cost now. Reduced mode is left once those probe
+flips are well below the budget, so the add-on doesn't flip back and forth.
+
+The budget is read once and cached, and re-read when the config is saved in
+Anki's add-on config editor (on_config_updated in __init__.py).
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from aqt import mw
+
+from .diagnostics import register_section
+
+DEFAULT_BUDGET_MS = 5.0
+WINDOW_SIZE = 200      # Samples kept per timer
+MIN_SAMPLES = 20       # Flips needed before entering reduced mode
+PROBE_INTERVAL = 20    # In reduced mode, every Nth flip runs in full mode
+MIN_PROBES = 20        # Probe flips needed before leaving reduced mode
+RECOVER_RATIO = 0.5    # Leave reduced mode below this fraction of the budget
+
+REVIEW_CONTEXTS = ("reviewQuestion", "reviewAnswer")
+
+
+class RollingTimer:
+    """Rolling window of durations in milliseconds"""
+    def __init__(self, size=WINDOW_SIZE):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, ms):
+        self.samples.append(ms)
+        self.count += 1
+
+    def clear(self):
+        self.samples.clear()
+
+    def percentile(self, pct):
+        """Nearest-rank percentile of the window (0.0 if empty)"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+        return ordered[index]
+
+    def __len__(self):
+        return len(self.samples)
+
+
+class LatencyBudget:
+    """Per-hook timers, per-flip totals and the reduced-mode switch"""
+    def __init__(self):
+        self.hooks = {}                # hook name -> RollingTimer
+        self.flips = RollingTimer()    # Flip cost in the current mode
+        self.probes = RollingTimer()   # Full-mode flip cost measured while reduced
+        self.degraded = False
+        self.probing = False           # Current flip runs in full mode as a probe
+        self.reason = ""
+        self.mode_changes = 0
+        self._budget_ms = None
+        self._flip_open = False
+        self._flip_ms = 0.0
+        self._flips_since_probe = 0
+
+    @property
+    def reduced(self):
+        """Whether the current flip should use the cheaper code paths"""
+        return self.degraded and not self.probing
+
+    @property
+    def budget_ms(self):
+        if self._budget_ms is None:
+            self.reload_config()
+        return self._budget_ms
+
+    def reload_config(self):
+        """Re-read the budget from config (cached so flips don't read config)"""
+        try:
+            config = mw.addonManager.getConfig(__name__) or {}
+            self._budget_ms = float(config.get("latency_budget_ms", DEFAULT_BUDGET_MS))
+        except:
+            self._budget_ms = DEFAULT_BUDGET_MS
+
+    def begin_flip(self):
+        """Start a new card flip, closing the previous one"""
+        if self._flip_open:
+            self._end_flip()
+        self._flip_open = True
+        self._flip_ms = 0.0
+        self.probing = False
+        if self.degraded:
+            self._flips_since_probe += 1
+            if self._flips_since_probe >= PROBE_INTERVAL:
+                self._flips_since_probe = 0
+                self.probing = True
+
+    @contextmanager
+    def measure(self, name, starts_flip=False, deferred=False):
+        """Time a block and attribute it to `name`.
+
+        Deferred work (run after the flip, e.g. lazy extraction) is kept out
+        of the flip time.
+        """
+        if starts_flip:
+            self.begin_flip()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000.0
+            timer = self.hooks.get(name)
+            if timer is None:
+                timer = self.hooks[name] = RollingTimer()
+            timer.add(ms)
+            if not deferred:
+                self._flip_ms += ms
+
+    def timed(self, name):
+        """Decorator form of measure() for hook callbacks"""
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                with self.measure(name):
+                    return func(*args, **kwargs)
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorator
+
+    def _end_flip(self):
+        if self.probing:
+            self.probes.add(self._flip_ms)
+        else:
+            self.flips.add(self._flip_ms)
+        self._evaluate()
+
+    def _evaluate(self):
+        budget = self.budget_ms
+        if not self.degraded:
+            if len(self.flips) >= MIN_SAMPLES and self.flips.percentile(95) > budget:
+                self._set_degraded(True, "p95 flip cost %.1f ms is over the %.1f ms budget"
+                                   % (self.flips.percentile(95), budget))
+        elif len(self.probes) >= MIN_PROBES and self.probes.percentile(95) < budget * RECOVER_RATIO:
+            self._set_degraded(False, "")
+
+    def _set_degraded(self, degraded, reason):
+        self.degraded = degraded
+        self.reason = reason
+        self.mode_changes += 1
+        # Judge the new mode on its own samples
+        self.flips.clear()
+        self.probes.clear()
+        self._flips_since_probe = 0
+        if degraded:
+            print(f"OpenEvidence: Switching to reduced reviewer mode ({reason})")
+        else:
+            print("OpenEvidence: Reviewer latency back within budget, leaving reduced mode")
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        rows = [
+            ("Budget", "%.1f ms per flip" % self.budget_ms),
+            ("Mode", "Reduced - " + self.reason if self.degraded else "Full"),
+        ]
+        if self.degraded:
+            rows.append(("Reduced mode", "Lazy card text extraction, panel updates skipped while hidden"))
+            rows.append(("Full-mode probes", "p95 %.2f ms (%d probes)"
+                         % (self.probes.percentile(95), len(self.probes))))
+        rows.append(("Flip cost", "p50 %.2f ms, p95 %.2f ms (%d flips)"
+                     % (self.flips.percentile(50), self.flips.percentile(95), self.flips.count)))
+        for name in sorted(self.hooks):
+            timer = self.hooks[name]
+            rows.append((name, "p50 %.2f ms, p95 %.2f ms (%d calls)"
+                         % (timer.percentile(50), timer.percentile(95), timer.count)))
+        rows.append(("Mode changes", str(self.mode_changes)))
+        return rows
+
+
+# Shared instance used by the reviewer hooks
+budget = LatencyBudget()
+
+register_section("Reviewer Latency", budget.diagnostics)
@@ -28,10 +28,34 @@ zip -r ../openevidence_ai.ankiaddon \
     settings_editor.py \
     settings_list.py \
     settings_quick_actions.py \
+    settings_diagnostics.py \
+    diagnostics.py \
+    latency.py \
     key_recorder.py \
+    key_matcher.py \
+    icon_cache.py \
+    request_filter.py \
+    renderer_recovery.py \
+    page_watchdog.py \
+    input_locator.py \
+    pending_actions.py \
+    auto_submit.py \
+    conversation_resume.py \
+    connectivity.py \
+    sync_pause.py \
+    resource_monitor.py \
+    page_lifecycle.py \
+    theme.py \
     utils.py \
     reviewer_highlight.py \
     tutorial.py \
+    tutorial_dispatch.py \
+    tutorial_manager.py \
+    tutorial_tracker.py \
+    tutorial_helpers.py \
+    tutorial_steps.py \
+    tutorial_coach_mark.py \
+    tutorial_overlay.py \
     manifest.json \
     config.json \
     README.md \
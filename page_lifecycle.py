@@ -0,0 +1,45 @@
+"""
+QWebEnginePage lifecycle helpers shared by the panel's helpers.
+
+Chromium can freeze a hidden page (timers and tasks stop, memory stays) or
+discard it (the renderer's memory is released and the page reloads when it
+is made active again). sync_pause.py, resource_monitor.py and
+page_watchdog.py go through these helpers, which do nothing on Qt
+versions without lifecycle states (before 5.14).
+"""
+
+try:
+    from PyQt6.QtWebEngineCore import QWebEnginePage
+except ImportError:
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+
+def lifecycle_state(name):
+    """A QWebEnginePage.LifecycleState member ("Active", "Frozen",
+    "Discarded"), or None before Qt 5.14"""
+    states = getattr(QWebEnginePage, "LifecycleState", None)
+    return getattr(states, name, None) if states is not None else None
+
+
+def set_lifecycle_state(page, name):
+    """Move a page to a lifecycle state; False if it couldn't be done"""
+    state = lifecycle_state(name)
+    if state is None:
+        return False
+    try:
+        page.setLifecycleState(state)
+    except Exception as e:
+        print(f"OpenEvidence: Couldn't set the panel page to {name}: {e}")
+        return False
+    return True
+
+
+def is_active(page):
+    """Whether the page is running (always True before Qt 5.14)"""
+    active = lifecycle_state("Active")
+    if active is None:
+        return True
+    try:
+        return page.lifecycleState() == active
+    except:
+        return True
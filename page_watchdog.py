@@ -0,0 +1,287 @@
+"""
+Responsiveness watchdog for the OpenEvidence panel's web page.
+
+Actions sent to the page with runJavaScript (Add to Chat, Ask Question, the
+ready check) only run once the page's main thread is free. If the site is
+stuck on a long task they queue up silently. While the panel is visible,
+PageWatchdog sends a tiny heartbeat script every few seconds and times it in
+two parts:
+
+- page   - from sending until the script ran in the page (renderer busy:
+           site slowness)
+- return - from the script running until Python got the result (Anki's main
+           thread busy: add-on or Anki slowness)
+
+Each part is kept as a histogram for the Diagnostics view. Only one
+heartbeat is in flight at a time. If it hasn't come back after
+"unresponsive_ms", the page is flagged unresponsive and the user is told.
+If it's still stuck "reload_after_ms" later and "auto_reload" is on, the
+page is reloaded.
+
+The heartbeat timer only runs while the panel is shown (it's started and
+stopped on the panel's Show/Hide events), and no heartbeat is sent while
+the page isn't in the Active lifecycle state (frozen or discarded by
+sync_pause.py or resource_monitor.py).
+"""
+
+import time
+
+try:
+    from PyQt6.QtCore import QObject, QTimer, QEvent
+except ImportError:
+    from PyQt5.QtCore import QObject, QTimer, QEvent
+
+from aqt import mw
+
+from .diagnostics import register_section
+from .page_lifecycle import is_active
+
+DEFAULT_HEARTBEAT_MS = 5000
+DEFAULT_UNRESPONSIVE_MS = 10000
+DEFAULT_RELOAD_AFTER_MS = 30000
+
+# Histogram bucket upper bounds in ms (the last bucket is open-ended)
+BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+HEARTBEAT_JS = "Date.now()"
+
+
+class LatencyHistogram:
+    """Counts of latencies per bucket"""
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        index = len(BUCKETS_MS)
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th percentile"""
+        if not self.total:
+            return 0.0
+        rank = pct / 100.0 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self):
+        """'p50 <= 10 ms, p95 <= 250 ms, max 312 ms' style summary"""
+        if not self.total:
+            return "No samples"
+        return "p50 <= %d ms, p95 <= %d ms, max %d ms" % (
+            self.percentile(50), self.percentile(95), self.max_ms)
+
+    def buckets(self):
+        """Non-empty buckets as (label, count)"""
+        rows = []
+        lower = 0
+        for i, count in enumerate(self.counts):
+            if i < len(BUCKETS_MS):
+                label = "%d-%d ms" % (lower, BUCKETS_MS[i])
+                lower = BUCKETS_MS[i]
+            else:
+                label = "> %d ms" % lower
+            if count:
+                rows.append((label, count))
+        return rows
+
+
+class WatchdogStats:
+    """Heartbeat histograms and counters, shared by every panel of the session"""
+    def __init__(self):
+        self.page = LatencyHistogram()
+        self.callback = LatencyHistogram()
+        self.sent = 0
+        self.unresponsive = False
+        self.unresponsive_since = None
+        self.episodes = 0
+        self.reloads = 0
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        if self.unresponsive:
+            status = "Unresponsive for %.0f s" % (time.time() - self.unresponsive_since)
+        else:
+            status = "Responsive"
+        rows = [
+            ("Status", status),
+            ("Heartbeats", "%d sent, %d answered" % (self.sent, self.page.total)),
+            ("Page (site)", self.page.summary()),
+            ("Return (Anki)", self.callback.summary()),
+            ("Unresponsive episodes", str(self.episodes)),
+            ("Watchdog reloads", str(self.reloads)),
+        ]
+        for label, count in self.page.buckets():
+            rows.append(("Page " + label, str(count)))
+        return rows
+
+
+stats = WatchdogStats()
+
+
+class PageWatchdog(QObject):
+    """Heartbeats a panel's page while it's visible and reloads it if it hangs"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self._seq = 0
+        self._pending = None       # (seq, sent wall time in ms) of the heartbeat in flight
+        self.reload_config()
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(self.heartbeat_ms)
+        self.heartbeat_timer.timeout.connect(self._send_heartbeat)
+        if panel.isVisible():
+            self.heartbeat_timer.start()
+
+        self.deadline_timer = QTimer(self)
+        self.deadline_timer.setSingleShot(True)
+        self.deadline_timer.timeout.connect(self._on_deadline)
+
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.timeout.connect(self._reload)
+
+        # A navigation drops the page's pending scripts
+        panel.web.loadStarted.connect(self._reset)
+        panel.installEventFilter(self)
+
+    def reload_config(self):
+        """Read the "page_watchdog" config section"""
+        try:
+            config = (mw.addonManager.getConfig(__name__) or {}).get("page_watchdog", {})
+        except:
+            config = {}
+        self.heartbeat_ms = int(config.get("heartbeat_ms", DEFAULT_HEARTBEAT_MS))
+        self.unresponsive_ms = int(config.get("unresponsive_ms", DEFAULT_UNRESPONSIVE_MS))
+        self.reload_after_ms = int(config.get("reload_after_ms", DEFAULT_RELOAD_AFTER_MS))
+        self.auto_reload = bool(config.get("auto_reload", True))
+
+    @property
+    def responsive(self):
+        return not stats.unresponsive
+
+    def _page_shown(self):
+        """Only heartbeat a loaded page the user can see"""
+        panel = self.panel
+        recovery = getattr(panel, "renderer_recovery", None)
+        if recovery is not None and recovery.recovering:
+            return False
+        return panel.isVisible() and panel.web.isVisible() and is_active(panel.web.page())
+
+    def _send_heartbeat(self):
+        if self._pending is not None or not self._page_shown():
+            return
+
+        self._seq += 1
+        seq = self._seq
+        self._pending = (seq, time.time() * 1000.0)
+        stats.sent += 1
+        try:
+            self.panel.web.page().runJavaScript(HEARTBEAT_JS, lambda result: self._on_heartbeat(seq, result))
+        except Exception as e:
+            print(f"OpenEvidence: Heartbeat failed: {e}")
+            self._pending = None
+            return
+        if not stats.unresponsive:
+            self.deadline_timer.start(self.unresponsive_ms)
+
+    def _on_heartbeat(self, seq, result):
+        if self._pending is None or self._pending[0] != seq:
+            return  # From before a reload
+        sent_ms = self._pending[1]
+        self._pending = None
+        self.deadline_timer.stop()
+
+        now_ms = time.time() * 1000.0
+        if isinstance(result, (int, float)):
+            ran_ms = min(max(float(result), sent_ms), now_ms)
+            stats.page.add(ran_ms - sent_ms)
+            stats.callback.add(now_ms - ran_ms)
+        else:
+            stats.page.add(now_ms - sent_ms)
+
+        if stats.unresponsive:
+            print("OpenEvidence: Panel page is responding again after %.0f s"
+                  % (time.time() - stats.unresponsive_since))
+            self._clear_unresponsive()
+
+    def _on_deadline(self):
+        if self._pending is None or stats.unresponsive:
+            return
+        if not is_active(self.panel.web.page()):
+            self._pending = None  # Frozen or discarded since it was sent
+            return
+        stats.unresponsive = True
+        stats.unresponsive_since = time.time() - self.unresponsive_ms / 1000.0
+        stats.episodes += 1
+        print("OpenEvidence: Panel page is not responding")
+
+        if self.auto_reload:
+            message = "OpenEvidence is not responding - it will be reloaded if it doesn't recover"
+            self.reload_timer.start(self.reload_after_ms)
+        else:
+            message = "OpenEvidence is not responding"
+        try:
+            from aqt.utils import tooltip
+            tooltip(message, period=4000)
+        except:
+            pass
+
+    def _reload(self):
+        if not stats.unresponsive:
+            return
+        stats.reloads += 1
+        print("OpenEvidence: Reloading unresponsive panel page")
+        try:
+            self.panel.web.reload()
+        except Exception as e:
+            print(f"OpenEvidence: Error reloading panel: {e}")
+
+    def _clear_unresponsive(self):
+        stats.unresponsive = False
+        stats.unresponsive_since = None
+        self.reload_timer.stop()
+
+    def _reset(self):
+        self._pending = None
+        self.deadline_timer.stop()
+        if stats.unresponsive:
+            self._clear_unresponsive()
+
+    def eventFilter(self, obj, event):
+        # Heartbeat only while the panel is shown
+        if obj is self.panel:
+            if event.type() == QEvent.Type.Show:
+                if not self.heartbeat_timer.isActive():
+                    self.heartbeat_timer.start()
+            elif event.type() == QEvent.Type.Hide:
+                self.heartbeat_timer.stop()
+                # A hidden page may be frozen - don't time out its heartbeat
+                self._pending = None
+                self.deadline_timer.stop()
+        return False
+
+    def check_before_action(self):
+        """Tell the user when an action is sent to a page that isn't responding"""
+        if stats.unresponsive:
+            try:
+                from aqt.utils import tooltip
+                tooltip("OpenEvidence is busy - this will run once the page responds", period=3000)
+            except:
+                pass
+        return self.responsive
+
+
+register_section("Panel Responsiveness", stats.diagnostics)
@@ -6,17 +6,15 @@ from aqt.qt import *
 try:
     from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                                   QDockWidget, QStackedWidget)
-    from PyQt6.QtCore import Qt, QUrl, QTimer, QByteArray, QSize
-    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QCursor, QColor
-    from PyQt6.QtSvg import QSvgRenderer
+    from PyQt6.QtCore import Qt, QTimer, QSize
+    from PyQt6.QtGui import QCursor, QColor
     from PyQt6.QtWebEngineWidgets import QWebEngineView
     from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage
 except ImportError:
     from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                                   QDockWidget, QStackedWidget)
-    from PyQt5.QtCore import Qt, QUrl, QTimer, QByteArray, QSize
-    from PyQt5.QtGui import QIcon, QPixmap, QPainter, QCursor, QColor
-    from PyQt5.QtSvg import QSvgRenderer
+    from PyQt5.QtCore import Qt, QTimer, QSize
+    from PyQt5.QtGui import QCursor, QColor
     try:
         from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEnginePage
         try:
@@ -35,9 +33,40 @@ except ImportError:
             QWebEnginePage = None
             QWebEngineProfile = None
 
-from .settings import SettingsHomeView, SettingsListView, SettingsEditorView
+from .key_matcher import chord_matcher_script
+from .icon_cache import svg_icon, svg_pixmap
+from . import theme
+from . import request_filter
+from .renderer_recovery import RendererRecovery
+from .page_watchdog import PageWatchdog
+from .pending_actions import queue as pending_actions
+from . import input_locator
+from .conversation_resume import ConversationResume
+from .connectivity import ConnectivityLoader
+from .sync_pause import SyncPause
+from .resource_monitor import ResourceMonitor
+from .tutorial_dispatch import tutorial_event, tutorial_target_rect
 import os
 
+# Settings views are built on the first gear click (their modules are only
+# imported then) and released after this long back in the web view
+SETTINGS_RELEASE_MS = 5 * 60 * 1000
+
+
+# Page ready check: the document is fully loaded and OpenEvidence's search
+# input or logo exists. Starts with the input locator (a no-op when the
+# page already has it) so actions sent after the check can rely on it.
+READY_CHECK_JS = input_locator.LOCATOR_JS + """
+(function() {
+    if (document.readyState === 'complete') {
+        if (window.ankiInputs.main() || document.querySelector('img, svg')) {
+            return true;
+        }
+    }
+    return false;
+})();
+"""
+
 
 # Custom WebEnginePage to intercept console messages for tutorial events
 class TutorialAwarePage(QWebEnginePage):
@@ -47,17 +76,19 @@ class TutorialAwarePage(QWebEnginePage):
         """Override to catch special tutorial messages from JavaScript"""
         # Check for our special tutorial trigger messages
         if message == "ANKI_TUTORIAL:shortcut_used":
-            try:
-                from .tutorial import tutorial_event
-                tutorial_event("shortcut_used")
-            except:
-                pass
+            tutorial_event("shortcut_used")
         elif message == "ANKI_TUTORIAL:template_used":
+            tutorial_event("template_used")
+        elif message.startswith("ANKI_SUBMIT:"):
             try:
-                from .tutorial import tutorial_event
-                tutorial_event("template_used")
+                from .auto_submit import handle_result
+                handle_result(message.replace("ANKI_SUBMIT:", "", 1))
             except:
                 pass
+            return
+        elif message.startswith("ANKI_TUTORIAL_RECT:"):
+            tutorial_target_rect("panel", message.replace("ANKI_TUTORIAL_RECT:", "", 1))
+            return
         # Call parent implementation for normal logging
         super().javaScriptConsoleMessage(level, message, lineNumber, sourceID)
 
@@ -104,6 +135,12 @@ def get_persistent_profile():
             # If setting custom paths fails, continue with default paths
             pass
 
+        # Block analytics and third-party bloat (see request_filter)
+        try:
+            request_filter.install(_persistent_profile)
+        except Exception as e:
+            print(f"OpenEvidence: Failed to install request filter: {e}")
+
         return _persistent_profile
     except Exception as e:
         # If anything fails, return None and use default behavior
@@ -136,37 +173,17 @@ class CustomTitleBar(QWidget):
         </svg>
         """
 
-        # Render SVG at higher resolution for crisp display
-        svg_bytes_back = QByteArray(back_icon_svg.encode())
-        renderer_back = QSvgRenderer(svg_bytes_back)
-        pixmap_back = QPixmap(48, 48)
-        try:
-            pixmap_back.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap_back.fill(Qt.transparent)
-        painter_back = QPainter(pixmap_back)
-        renderer_back.render(painter_back)
-        painter_back.end()
-
-        self.back_button.setIcon(QIcon(pixmap_back))
+        # Rasterized once and shared (see icon_cache)
+        self.back_button.setIcon(svg_icon(back_icon_svg, 14))
         self.back_button.setIconSize(QSize(14, 14))
 
-        self.back_button.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.12);
-            }
-        """)
+        self.back_button.setObjectName("titleBarButton")
         self.back_button.clicked.connect(self.go_back)
         layout.addWidget(self.back_button)
 
         # Title label
         self.title_label = QLabel("OpenEvidence")
-        self.title_label.setStyleSheet("color: rgba(255, 255, 255, 0.9); font-size: 13px; font-weight: 500;")
+        self.title_label.setObjectName("titleBarTitle")
         layout.addWidget(self.title_label)
 
         # Add stretch to push buttons to the right
@@ -184,31 +201,11 @@ class CustomTitleBar(QWidget):
         </svg>
         """
 
-        # Render SVG at higher resolution for crisp display
-        svg_bytes = QByteArray(float_icon_svg.encode())
-        renderer = QSvgRenderer(svg_bytes)
-        pixmap = QPixmap(48, 48)
-        try:
-            pixmap.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        self.float_button.setIcon(QIcon(pixmap))
+        # Rasterized once and shared (see icon_cache)
+        self.float_button.setIcon(svg_icon(float_icon_svg, 14))
         self.float_button.setIconSize(QSize(14, 14))
 
-        self.float_button.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.12);
-            }
-        """)
+        self.float_button.setObjectName("titleBarButton")
         self.float_button.clicked.connect(self.toggle_floating)
         layout.addWidget(self.float_button)
 
@@ -224,31 +221,11 @@ class CustomTitleBar(QWidget):
         </svg>
         """
 
-        # Render SVG at higher resolution for crisp display
-        svg_bytes_settings = QByteArray(settings_icon_svg.encode())
-        renderer_settings = QSvgRenderer(svg_bytes_settings)
-        pixmap_settings = QPixmap(48, 48)
-        try:
-            pixmap_settings.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap_settings.fill(Qt.transparent)
-        painter_settings = QPainter(pixmap_settings)
-        renderer_settings.render(painter_settings)
-        painter_settings.end()
-
-        self.settings_button.setIcon(QIcon(pixmap_settings))
+        # Rasterized once and shared (see icon_cache)
+        self.settings_button.setIcon(svg_icon(settings_icon_svg, 14))
         self.settings_button.setIconSize(QSize(14, 14))
 
-        self.settings_button.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.12);
-            }
-        """)
+        self.settings_button.setObjectName("titleBarButton")
         self.settings_button.clicked.connect(self.toggle_settings)
         layout.addWidget(self.settings_button)
 
@@ -264,36 +241,16 @@ class CustomTitleBar(QWidget):
         </svg>
         """
 
-        # Render SVG at higher resolution for crisp display
-        svg_bytes_close = QByteArray(close_icon_svg.encode())
-        renderer_close = QSvgRenderer(svg_bytes_close)
-        pixmap_close = QPixmap(48, 48)
-        try:
-            pixmap_close.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap_close.fill(Qt.transparent)
-        painter_close = QPainter(pixmap_close)
-        renderer_close.render(painter_close)
-        painter_close.end()
-
-        self.close_button.setIcon(QIcon(pixmap_close))
+        # Rasterized once and shared (see icon_cache)
+        self.close_button.setIcon(svg_icon(close_icon_svg, 14))
         self.close_button.setIconSize(QSize(14, 14))
 
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(239, 68, 68, 0.2);
-            }
-        """)
+        self.close_button.setObjectName("titleBarClose")
         self.close_button.clicked.connect(self.dock_widget.hide)
         layout.addWidget(self.close_button)
 
-        # Set background color for title bar - modern dark gray
-        self.setStyleSheet("background: #2a2a2a; border-bottom: 1px solid rgba(255, 255, 255, 0.06);")
+        # Modern dark gray background (styled by the shared theme, see theme.py)
+        self.setObjectName("titleBar")
 
     def toggle_floating(self):
         self.dock_widget.setFloating(not self.dock_widget.isFloating())
@@ -305,11 +262,7 @@ class CustomTitleBar(QWidget):
             panel.toggle_settings_view()
 
             # Notify tutorial that settings was opened
-            try:
-                from .tutorial import tutorial_event
-                tutorial_event("settings_opened")
-            except:
-                pass
+            tutorial_event("settings_opened")
 
     def go_back(self):
         """Context-aware back navigation"""
@@ -359,7 +312,6 @@ class OpenEvidencePanel(QWidget):
 
         # Create loading overlay first (so it's on top in z-order)
         self.loading_overlay = QWebEngineView(self.web_container)
-        self.loading_overlay.setStyleSheet("QWebEngineView { background: #1e1e1e; }")
         
         # Loading HTML with rolling dots animation
         loading_html = """
@@ -436,6 +388,9 @@ class OpenEvidencePanel(QWidget):
             page = TutorialAwarePage(persistent_profile, self.web)
             self.web.setPage(page)
 
+        # Track the chat inputs from document creation on
+        input_locator.install(self.web.page())
+
         # Configure settings for faster loading and better preloading
         if QWebEngineSettings:
             try:
@@ -447,8 +402,6 @@ class OpenEvidencePanel(QWidget):
             except:
                 pass
 
-        self.web.setStyleSheet("QWebEngineView { background: #1e1e1e; }")
-        
         # Set explicit size to ensure Qt allocates resources and starts loading immediately
         self.web.setMinimumSize(300, 400)
         
@@ -463,18 +416,39 @@ class OpenEvidencePanel(QWidget):
 
         # Connect to load finished to check if page is ready
         self.web.loadFinished.connect(self.on_page_load_finished)
+        self.web.loadStarted.connect(lambda: pending_actions.page_unready(self))
+
+        # Reload (and restore the conversation) if the renderer process dies
+        self.renderer_recovery = RendererRecovery(self)
+
+        # Heartbeat the page while visible and reload it if it hangs
+        self.page_watchdog = PageWatchdog(self)
+
+        # Remember the conversation so the next start can go straight back to it
+        self.conversation_resume = ConversationResume(self)
+
+        # Show a native offline view for failed loads and reload when back online
+        self.connectivity = ConnectivityLoader(self)
+
+        # Stay out of the way of Anki's sync (defer the load or freeze the page)
+        self.sync_pause = SyncPause(self)
+
+        # Sample the renderer's memory/CPU and act on memory pressure
+        self.resource_monitor = ResourceMonitor(self)
         
         # Start loading OpenEvidence immediately (even though panel is hidden)
         # This enables preloading: the page loads in the background while Anki starts,
         # so it's ready instantly when the user clicks the book icon
-        self.web.load(QUrl("https://www.openevidence.com/"))
+        self.sync_pause.load(self.conversation_resume.start_url)
 
-        # Create settings home view (main settings hub)
-        self.settings_view = SettingsHomeView(self)
+        # Settings views (index 1) are created on demand - see show_home_view()
+        self.settings_view = None
+        self.settings_release_timer = QTimer(self)
+        self.settings_release_timer.setSingleShot(True)
+        self.settings_release_timer.timeout.connect(self._release_settings_views)
 
         # Add views to stacked widget
         self.stacked_widget.addWidget(self.web_container)  # Index 0
-        self.stacked_widget.addWidget(self.settings_view)  # Index 1
 
         # Start with web view
         self.stacked_widget.setCurrentIndex(0)
@@ -482,7 +456,8 @@ class OpenEvidencePanel(QWidget):
     def on_page_load_finished(self, ok):
         """Called when page HTML is loaded - check if fully ready"""
         if not ok:
-            # Load failed, hide overlay anyway
+            # Load failed, hide overlay anyway (the offline view takes over,
+            # see ConnectivityLoader)
             if hasattr(self, 'loading_overlay'):
                 self.loading_overlay.hide()
             return
@@ -493,27 +468,9 @@ class OpenEvidencePanel(QWidget):
 
     def _check_page_ready(self):
         """Check if page is ready (called after small delay)"""
-        # Check if page is truly ready (all resources loaded)
-        check_ready_js = """
-        (function() {
-            // Check if document is fully loaded and OpenEvidence elements exist
-            if (document.readyState === 'complete') {
-                // Check for OpenEvidence specific elements that indicate page is ready
-                var searchInput = document.querySelector('input[placeholder*="medical"], input[placeholder*="question"], textarea');
-                var logo = document.querySelector('img, svg');
-
-                // If we found key elements, page is ready
-                if (searchInput || logo) {
-                    return true;
-                }
-            }
-            return false;
-        })();
-        """
-
         # Check if page is ready with error handling
         try:
-            self.web.page().runJavaScript(check_ready_js, self.handle_ready_check)
+            self.web.page().runJavaScript(READY_CHECK_JS, self.handle_ready_check)
         except Exception as e:
             print(f"OpenEvidence: Error checking page ready: {e}")
             # Fallback - just hide loader and show web view
@@ -529,19 +486,12 @@ class OpenEvidencePanel(QWidget):
                 self.loading_overlay.hide()
             self.web.show()
             self.inject_shift_key_listener()
+            # Deliver highlight actions that arrived while the page was loading
+            pending_actions.page_ready(self)
         else:
             # Not ready yet, check again after a short delay
             QTimer.singleShot(200, lambda: self.web.page().runJavaScript(
-                """
-                (function() {
-                    if (document.readyState === 'complete') {
-                        var searchInput = document.querySelector('input[placeholder*="medical"], input[placeholder*="question"], textarea');
-                        var logo = document.querySelector('img, svg');
-                        if (searchInput || logo) return true;
-                    }
-                    return false;
-                })();
-                """,
+                READY_CHECK_JS,
                 self.handle_ready_check
             ))
 
@@ -563,6 +513,7 @@ class OpenEvidencePanel(QWidget):
             # Import here to avoid circular import at module level
             from .settings import SettingsEditorView, SettingsListView, SettingsHomeView
             from .settings_quick_actions import QuickActionsSettingsView
+            from .settings_diagnostics import DiagnosticsSettingsView
 
             if isinstance(current_widget, SettingsEditorView):
                 # In editor view, discard changes and go back to templates list view
@@ -571,38 +522,25 @@ class OpenEvidencePanel(QWidget):
                 else:
                     self.show_templates_view()
                 # Notify tutorial
-                try:
-                    from .tutorial import tutorial_event
-                    tutorial_event("settings_back_to_templates")
-                except:
-                    pass
+                tutorial_event("settings_back_to_templates")
             elif isinstance(current_widget, SettingsListView):
                 # In templates list view, go back to settings home
                 self.show_home_view()
                 # Notify tutorial
-                try:
-                    from .tutorial import tutorial_event
-                    tutorial_event("settings_back_to_home")
-                except:
-                    pass
+                tutorial_event("settings_back_to_home")
             elif isinstance(current_widget, QuickActionsSettingsView):
                 # In quick actions view, go back to settings home
                 self.show_home_view()
                 # Notify tutorial
-                try:
-                    from .tutorial import tutorial_event
-                    tutorial_event("settings_back_to_home")
-                except:
-                    pass
+                tutorial_event("settings_back_to_home")
+            elif isinstance(current_widget, DiagnosticsSettingsView):
+                # In diagnostics view, go back to settings home
+                self.show_home_view()
             elif isinstance(current_widget, SettingsHomeView):
                 # In settings home, go back to web view
                 self.show_web_view()
                 # Notify tutorial
-                try:
-                    from .tutorial import tutorial_event
-                    tutorial_event("panel_web_view")
-                except:
-                    pass
+                tutorial_event("panel_web_view")
             else:
                 # Default: go to web view
                 self.show_web_view()
@@ -624,6 +562,19 @@ class OpenEvidencePanel(QWidget):
         """Show the web view"""
         self.stacked_widget.setCurrentIndex(0)
         self._update_title_bar(False)
+        # Free the settings views if they aren't opened again for a while
+        if self.stacked_widget.widget(1) is not None:
+            self.settings_release_timer.start(SETTINGS_RELEASE_MS)
+
+    def _release_settings_views(self):
+        """Delete the settings view while the web view is showing"""
+        if self.stacked_widget.currentIndex() != 0:
+            return
+        current_widget = self.stacked_widget.widget(1)
+        if current_widget:
+            self.stacked_widget.removeWidget(current_widget)
+            current_widget.deleteLater()
+        self.settings_view = None
 
     def show_home_view(self):
         """Show the settings home view"""
@@ -701,17 +652,46 @@ class OpenEvidencePanel(QWidget):
         self.stacked_widget.setCurrentIndex(1)
         self._update_title_bar(True)
 
+    def show_diagnostics_view(self):
+        """Show the diagnostics view"""
+        # Get current widget at index 1
+        current_widget = self.stacked_widget.widget(1)
+
+        # Import here to avoid circular import at module level
+        from .settings_diagnostics import DiagnosticsSettingsView
+
+        # If it's already a DiagnosticsSettingsView, refresh it and show it
+        if current_widget and isinstance(current_widget, DiagnosticsSettingsView):
+            current_widget.refresh()
+            self.stacked_widget.setCurrentIndex(1)
+            self._update_title_bar(True)
+            return
+
+        # Otherwise, remove whatever is there and create new diagnostics view
+        if current_widget:
+            self.stacked_widget.removeWidget(current_widget)
+            current_widget.deleteLater()
+
+        # Create new diagnostics view
+        self.settings_view = DiagnosticsSettingsView(self)
+        self.stacked_widget.addWidget(self.settings_view)
+        self.stacked_widget.setCurrentIndex(1)
+        self._update_title_bar(True)
+
     def show_list_view(self):
         """Show the settings list view (alias for show_templates_view for backward compatibility)"""
         self.show_templates_view()
 
     def show_editor_view(self, keybinding, index):
         """Show the settings editor view"""
+        from .settings import SettingsEditorView
+
         editor_view = SettingsEditorView(self, keybinding, index)
         # Remove settings list and add editor
-        old_settings = self.settings_view
-        self.stacked_widget.removeWidget(old_settings)
-        old_settings.deleteLater()
+        old_settings = self.stacked_widget.widget(1)
+        if old_settings:
+            self.stacked_widget.removeWidget(old_settings)
+            old_settings.deleteLater()
         self.stacked_widget.addWidget(editor_view)
         self.stacked_widget.setCurrentIndex(1)
         self._update_title_bar(True)
@@ -722,7 +702,8 @@ class OpenEvidencePanel(QWidget):
         self.update_keybindings_in_js()
 
         # Only inject the listener once - it will read from window.ankiKeybindings
-        listener_js = """
+        config = mw.addonManager.getConfig(__name__) or {}
+        listener_js = chord_matcher_script(config.get("debug_logging", False)) + """
         (function() {
             // Only inject if not already injected
             if (window.ankiKeybindingListenerInjected) {
@@ -733,44 +714,9 @@ class OpenEvidencePanel(QWidget):
             console.log('Anki: Injecting custom keybinding listener for OpenEvidence');
             window.ankiKeybindingListenerInjected = true;
 
-            // Helper to check if pressed keys match keybinding
-            function keysMatch(event, requiredKeys) {
-                var pressedKeys = {};
-
-                if (event.shiftKey) pressedKeys['Shift'] = true;
-                
-                // On macOS, browser events have the keys correct:
-                // - event.metaKey = Cmd key (⌘) → should match "Meta"
-                // - event.ctrlKey = Control key (⌃) → should match "Control"
-                // On other platforms, treat them the same for cross-platform compatibility
-                var isMac = navigator.platform.toUpperCase().indexOf('MAC') >= 0;
-                if (isMac) {
-                    if (event.ctrlKey) pressedKeys['Control'] = true;
-                    if (event.metaKey) pressedKeys['Meta'] = true;
-                } else {
-                    if (event.ctrlKey || event.metaKey) pressedKeys['Control/Meta'] = true;
-                }
-                
-                if (event.altKey) pressedKeys['Alt'] = true;
-
-                // Add regular key if present
-                if (event.key && event.key.length === 1) {
-                    pressedKeys[event.key.toUpperCase()] = true;
-                }
-
-                // Check if all required keys are pressed
-                for (var i = 0; i < requiredKeys.length; i++) {
-                    if (!pressedKeys[requiredKeys[i]]) {
-                        return false;
-                    }
-                }
-
-                // Check we don't have extra modifier keys
-                var expectedCount = requiredKeys.length;
-                var actualCount = Object.keys(pressedKeys).length;
-
-                return actualCount === expectedCount;
-            }
+            // Shared chord matcher - compiles window.ankiKeybindings once per update
+            var keybindingMatcher = window.ankiChord.createMatcher();
+            var NO_KEYBINDINGS = [];
 
             // Helper to insert text at cursor position
             function fillInputField(activeElement, text) {
@@ -826,58 +772,36 @@ class OpenEvidencePanel(QWidget):
 
             // Listen for keyboard shortcuts on the entire document
             document.addEventListener('keydown', function(event) {
-                // Check if the ACTIVE ELEMENT is specifically the OpenEvidence search input
-                var activeElement = document.activeElement;
-
-                // Make sure we're in an input/textarea element
-                var isInputElement = activeElement && (
-                    activeElement.tagName === 'INPUT' ||
-                    activeElement.tagName === 'TEXTAREA'
-                );
-
-                // Make sure it's specifically the OpenEvidence search box
-                var isOpenEvidenceSearchBox = false;
-                if (isInputElement) {
-                    var placeholder = activeElement.placeholder || '';
-                    var type = activeElement.type || '';
-
-                    isOpenEvidenceSearchBox = (
-                        placeholder.toLowerCase().includes('medical') ||
-                        placeholder.toLowerCase().includes('question') ||
-                        type === 'text' ||
-                        activeElement.tagName === 'TEXTAREA'
-                    );
-                }
-
-                // Only proceed if in OpenEvidence search box
-                if (!isInputElement || !isOpenEvidenceSearchBox) {
+                // Only the OpenEvidence chat inputs take keybindings - the
+                // same elements input_locator.py's window.ankiInputs finds
+                var activeElement = event.target;
+                var inputs = window.ankiInputs;
+                if (!inputs || !activeElement ||
+                    (activeElement !== inputs.main() && activeElement !== inputs.followUp())) {
                     return;
                 }
 
                 // Read keybindings from global variable (updated from Python)
-                var keybindings = window.ankiKeybindings || [];
+                var keybindings = window.ankiKeybindings || NO_KEYBINDINGS;
 
-                // Check each keybinding
-                for (var i = 0; i < keybindings.length; i++) {
-                    var binding = keybindings[i];
-
-                    if (keysMatch(event, binding.keys)) {
-                        console.log('Anki: Keybinding "' + binding.name + '" triggered');
-                        event.preventDefault();
+                // Only the first matching keybinding is triggered
+                var i = keybindingMatcher.match(event, keybindings);
+                if (i === -1) {
+                    return;
+                }
 
-                        // Get the appropriate text for this keybinding
-                        if (window.ankiCardTexts && window.ankiCardTexts[i]) {
-                            fillInputField(activeElement, window.ankiCardTexts[i]);
-                            console.log('Anki: Filled search box with card text using React-compatible events');
+                console.log('Anki: Keybinding "' + keybindings[i].name + '" triggered');
+                event.preventDefault();
 
-                            // Notify tutorial that shortcut was used (via console message)
-                            console.log('ANKI_TUTORIAL:shortcut_used');
-                        } else {
-                            console.log('Anki: No card text available for this keybinding');
-                        }
+                // Get the appropriate text for this keybinding
+                if (window.ankiCardTexts && window.ankiCardTexts[i]) {
+                    fillInputField(activeElement, window.ankiCardTexts[i]);
+                    console.log('Anki: Filled search box with card text using React-compatible events');
 
-                        break; // Only trigger first matching keybinding
-                    }
+                    // Notify tutorial that shortcut was used (via console message)
+                    console.log('ANKI_TUTORIAL:shortcut_used');
+                } else {
+                    console.log('Anki: No card text available for this keybinding');
                 }
             }, true);
         })();
@@ -994,23 +918,8 @@ class OnboardingWidget(QWidget):
 
     def set_icon_from_svg(self, label, svg_str, size=20, color=None):
         """Helper to set SVG icon to a label"""
-        # Render at high resolution (4x scale) for crisp display on Retina/HighDPI
-        render_size = size * 4
-
-        svg_bytes = QByteArray(svg_str.encode())
-        renderer = QSvgRenderer(svg_bytes)
-        pixmap = QPixmap(render_size, render_size)
-        try:
-            pixmap.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        # Set scalable contents on label so it downscales the high-res pixmap
-        label.setPixmap(pixmap)
+        # Shared, device-pixel-ratio aware pixmap (rasterized once per size/color)
+        label.setPixmap(svg_pixmap(svg_str, size, color, label))
         label.setScaledContents(True)
 
     def setup_ui(self):
@@ -1042,20 +951,13 @@ class OnboardingWidget(QWidget):
         # Container with responsive width
         container = QWidget()
         container.setMaximumWidth(380)
-        container.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Title/Headline
         title = QLabel("OpenEvidence AI")
-        title.setStyleSheet("""
-            font-size: 32px;
-            font-weight: 700;
-            color: #FFFFFF;
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            margin: 0px 0px 16px 0px;
-        """)
+        title.setObjectName("onboardingTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -1064,11 +966,7 @@ class OnboardingWidget(QWidget):
 
         # Creator name
         creator = QLabel("Created by Luke Pettit")
-        creator.setStyleSheet("""
-            font-size: 14px;
-            color: #777777;
-            font-weight: 500;
-        """)
+        creator.setObjectName("onboardingCreator")
         creator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(creator)
 
@@ -1078,20 +976,7 @@ class OnboardingWidget(QWidget):
         # Next button
         next_btn = QPushButton("Next →")
         next_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        next_btn.setStyleSheet("""
-            QPushButton {
-                background: #3498db;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                padding: 16px;
-            }
-            QPushButton:hover {
-                background: #5dade2;
-            }
-        """)
+        next_btn.setObjectName("onboardingNext")
         next_btn.clicked.connect(self.go_to_page2)
         layout.addWidget(next_btn)
 
@@ -1109,20 +994,13 @@ class OnboardingWidget(QWidget):
         # Container with responsive width
         container = QWidget()
         container.setMaximumWidth(380)
-        container.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Headline
         headline = QLabel("Unlock Unlimited Requests")
-        headline.setStyleSheet("""
-            font-size: 26px;
-            font-weight: 700;
-            color: #FFFFFF;
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            margin: 0px 0px 8px 0px;
-        """)
+        headline.setObjectName("onboardingHeadline")
         headline.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(headline)
 
@@ -1132,13 +1010,7 @@ class OnboardingWidget(QWidget):
         # Body text
         body = QLabel("Give us a free star on GitHub to get unlimited requests on our add-on for free.")
         body.setWordWrap(True)
-        body.setStyleSheet("""
-            font-size: 15px;
-            color: #BBBBBB;
-            font-weight: 400;
-            line-height: 1.5;
-            padding-left: 2px;
-        """)
+        body.setObjectName("onboardingBody")
         body.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(body)
 
@@ -1148,19 +1020,8 @@ class OnboardingWidget(QWidget):
         # CHECKBOX ROW - custom widget using QPushButton for layout control
         self.star_btn = QPushButton()
         self.star_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.star_btn.setObjectName("starButton")
         self.star_btn.setFixedHeight(54)
-        self.star_btn.setStyleSheet("""
-            QPushButton {
-                background: #2b2b2b;
-                border: 1px solid #444444;
-                border-radius: 8px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-                border-color: #666666;
-            }
-        """)
 
         # Layout for the button content
         btn_layout = QHBoxLayout(self.star_btn)
@@ -1170,7 +1031,6 @@ class OnboardingWidget(QWidget):
         # 1. Checkbox Icon
         self.checkbox_label = QLabel()
         self.checkbox_label.setFixedSize(20, 20)
-        self.checkbox_label.setStyleSheet("background: transparent; border: none;")
         self.checkbox_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
         # SVG for empty checkbox
@@ -1182,7 +1042,7 @@ class OnboardingWidget(QWidget):
 
         # 2. Text
         self.star_text = QLabel("Star on GitHub")
-        self.star_text.setStyleSheet("color: #FFFFFF; font-size: 15px; font-weight: 500; border: none; background: transparent;")
+        self.star_text.setObjectName("starText")
         self.star_text.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         btn_layout.addWidget(self.star_text)
 
@@ -1192,7 +1052,6 @@ class OnboardingWidget(QWidget):
         # 4. Arrow Icon
         self.arrow_label = QLabel()
         self.arrow_label.setFixedSize(20, 20)
-        self.arrow_label.setStyleSheet("background: transparent; border: none;")
         self.arrow_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
         # SVG for external link arrow
@@ -1215,21 +1074,11 @@ class OnboardingWidget(QWidget):
         bottom_layout.setContentsMargins(0, 0, 0, 0)
         bottom_layout.setSpacing(8)
 
-        # BIG NEXT BUTTON - Grayed out "locked" state
+        # BIG NEXT BUTTON - Grayed out "locked" state (the theme's :disabled look)
         self.continue_btn = QPushButton("Next →")
+        self.continue_btn.setObjectName("onboardingNext")
         self.continue_btn.setCursor(QCursor(Qt.CursorShape.ForbiddenCursor))
         self.continue_btn.setEnabled(False)
-        self.continue_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #666666;
-                border: 1px solid #444444;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                padding: 16px;
-            }
-        """)
         self.continue_btn.clicked.connect(self.on_continue_clicked)
         bottom_layout.addWidget(self.continue_btn)
 
@@ -1241,17 +1090,7 @@ class OnboardingWidget(QWidget):
         
         self.skip_link = QLabel("Continue with limited access")
         self.skip_link.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.skip_link.setStyleSheet("""
-            QLabel {
-                color: #555555;
-                font-size: 10px;
-                background: transparent;
-                border: none;
-            }
-            QLabel:hover {
-                color: #777777;
-            }
-        """)
+        self.skip_link.setObjectName("skipLink")
         
         # Make it clickable
         def skip_clicked(event):
@@ -1329,15 +1168,8 @@ class OnboardingWidget(QWidget):
             # Re-enable button but cursor changes
             self.star_btn.setEnabled(True)
             self.star_btn.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
-            # Remove hover effect by setting same background
-            self.star_btn.setStyleSheet("""
-                QPushButton {
-                    background: #2b2b2b;
-                    border: 1px solid #444444;
-                    border-radius: 8px;
-                    text-align: left;
-                }
-            """)
+            # Remove hover effect (the theme's done state)
+            theme.set_state(self.star_btn, "done", True)
 
             # Update icons/text for checked state
 
@@ -1351,20 +1183,6 @@ class OnboardingWidget(QWidget):
             # Update Continue Button to UNLOCKED state (Bright Blue)
             self.continue_btn.setEnabled(True)
             self.continue_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            self.continue_btn.setStyleSheet("""
-                QPushButton {
-                    background: #3498db;
-                    color: #FFFFFF;
-                    border: none;
-                    border-radius: 8px;
-                    font-size: 16px;
-                    font-weight: 600;
-                    padding: 16px;
-                }
-                QPushButton:hover {
-                    background: #5dade2;
-                }
-            """)
 
     def on_continue_clicked(self):
         """Continue after starring (only enabled after star is clicked)"""
@@ -0,0 +1,264 @@
+"""
+Pending-action queue for highlight actions sent to the OpenEvidence panel.
+
+"Add to Chat" and "Ask Question" can arrive before the panel's page is
+ready: right after Anki starts, while onboarding is still showing, or while
+the page reloads. Instead of running their scripts against whatever DOM
+exists (and losing the selection), actions are queued here and delivered in
+order once the panel signals the page is ready (see
+OpenEvidencePanel.handle_ready_check).
+
+- Identical actions (same kind and text) still waiting are merged
+- Actions expire after ACTION_TTL_MS and are reported as failed
+- An action whose script can't find the input yet is retried every
+  RETRY_MS until it expires
+- Each action's status (queued, delivered, failed) is shown in the
+  reviewer's highlight bubble
+
+An action script must return 'ok' once it's done, or 'no_input' if the
+page's input isn't mounted yet. A script that keeps working after it
+returns (auto_submit.py's accept/submit/confirm steps) returns 'started'
+instead: the queue then holds every later action until the caller reports
+the outcome with finished(token), or the action's result timeout passes,
+so the next action can't overwrite the input mid-submit.
+"""
+
+import json
+import time
+from collections import deque
+
+try:
+    from PyQt6.QtCore import QTimer
+except ImportError:
+    from PyQt5.QtCore import QTimer
+
+from aqt import mw
+
+from .diagnostics import register_section
+
+ACTION_TTL_MS = 60000
+RETRY_MS = 500
+RESULT_TIMEOUT_MS = 20000   # Default wait for a 'started' action's outcome
+
+STATUS_MESSAGES = {
+    ("add_context", "queued"): "Waiting for OpenEvidence to load…",
+    ("add_context", "delivered"): "Added to OpenEvidence",
+    ("ask_query", "queued"): "Question will be sent when OpenEvidence is ready…",
+}
+FAILED_MESSAGE = "Couldn't reach OpenEvidence - please try again"
+
+
+def show_status(message, kind):
+    """Show a status message in the reviewer's highlight bubble"""
+    if not message:
+        return
+    js = ("window.ankiHighlightBubble && window.ankiHighlightBubble.showStatus && "
+          "window.ankiHighlightBubble.showStatus(%s, %s);" % (json.dumps(message), json.dumps(kind)))
+    try:
+        if mw.reviewer and mw.reviewer.web:
+            mw.reviewer.web.eval(js)
+    except:
+        pass
+
+
+class PendingAction:
+    """One queued action and the script that delivers it"""
+    def __init__(self, kind, text, js_code, token=None, result_timeout_ms=RESULT_TIMEOUT_MS):
+        self.kind = kind
+        self.key = (kind, text)
+        self.js_code = js_code
+        self.token = token
+        self.result_timeout_ms = result_timeout_ms
+        self.started = False       # Script returned 'started', outcome pending
+        self.created = time.monotonic()
+
+    def age_ms(self, now=None):
+        return ((now or time.monotonic()) - self.created) * 1000.0
+
+
+class PendingActionQueue:
+    """In-order delivery of highlight actions to the panel's page"""
+    def __init__(self):
+        self.actions = deque()
+        self.panel = None
+        self.ready = False
+        self._in_flight = None
+        self.delivered = 0
+        self.merged = 0
+        self.expired = 0
+        self.retries = 0
+        self.result_timeouts = 0
+        self.max_wait_ms = 0.0
+        self._timer = None
+        self._result_timer = None
+
+    def _schedule(self, ms):
+        """Run flush() again in `ms` (or sooner if already scheduled)"""
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if self._timer.isActive() and self._timer.remainingTime() <= ms:
+            return
+        self._timer.start(int(ms))
+
+    def _wait_for_result(self, ms):
+        """Give up on the started action's outcome after `ms`"""
+        if self._result_timer is None:
+            self._result_timer = QTimer()
+            self._result_timer.setSingleShot(True)
+            self._result_timer.timeout.connect(self._on_result_timeout)
+        self._result_timer.start(int(ms))
+
+    def submit(self, kind, text, js_code, token=None, result_timeout_ms=RESULT_TIMEOUT_MS):
+        """Queue an action and deliver it now if the page is ready
+
+        token identifies an action whose script returns 'started', for
+        finished()."""
+        self._drop_expired()
+        for action in self.actions:
+            if action.key == (kind, text):
+                self.merged += 1
+                return
+        if self._in_flight is not None and self._in_flight.key == (kind, text):
+            self.merged += 1
+            return
+
+        action = PendingAction(kind, text, js_code, token, result_timeout_ms)
+        self.actions.append(action)
+        if not self.ready:
+            self._report(action, "queued")
+        self.flush()
+
+    def page_ready(self, panel):
+        """The panel's page can take actions now"""
+        self.panel = panel
+        self.ready = True
+        self.flush()
+
+    def page_unready(self, panel):
+        """The panel's page is (re)loading"""
+        if panel is self.panel or self.panel is None:
+            self.ready = False
+            action, self._in_flight = self._in_flight, None  # Its result (if any) is ignored
+            if action is not None and action.started:
+                # It may have been submitted already - never send it twice
+                self._settle(action)
+                print(f"OpenEvidence: Page reloaded before the {action.kind} action finished")
+
+    def flush(self):
+        """Deliver queued actions in order, one at a time"""
+        self._drop_expired()
+        if not self.actions or self._in_flight is not None:
+            return
+        if not self.ready or self.panel is None:
+            # Check back when the oldest action expires, so it's reported
+            # even if the page never gets ready
+            self._schedule(max(0.0, ACTION_TTL_MS - self.actions[0].age_ms()) + 50)
+            return
+
+        action = self.actions[0]
+        self._in_flight = action
+        try:
+            self.panel.web.page().runJavaScript(action.js_code, lambda result: self._on_result(action, result))
+        except Exception as e:
+            print(f"OpenEvidence: Error delivering action: {e}")
+            self._in_flight = None
+            self.ready = False
+
+    def _on_result(self, action, result):
+        if action is not self._in_flight:
+            return  # Sent to a page that has since reloaded
+        self._in_flight = None
+
+        if result == "ok":
+            self._settle(action)
+            self.delivered += 1
+            self.max_wait_ms = max(self.max_wait_ms, action.age_ms())
+            self._report(action, "delivered")
+            self.flush()
+        elif result == "started":
+            # Hold the queue until finished() reports the outcome
+            action.started = True
+            self._in_flight = action
+            self._wait_for_result(action.result_timeout_ms)
+        elif result == "no_input":
+            # Page is up but the input isn't mounted yet
+            self.retries += 1
+            self._schedule(RETRY_MS)
+        else:
+            # Script didn't run (page navigated away or renderer gone) -
+            # wait for the next ready signal
+            self.ready = False
+            self.flush()
+
+    def finished(self, token, delivered=True, retry_ms=None):
+        """Outcome of the started action with this token
+
+        With retry_ms the action stays first in line and its script runs
+        again after retry_ms. Returns False if the queue isn't waiting on
+        that action (it timed out or the page reloaded)."""
+        action = self._in_flight
+        if action is None or not action.started or action.token != token:
+            return False
+        self._in_flight = None
+        action.started = False
+        self._result_timer.stop()
+        if retry_ms is not None:
+            self.retries += 1
+            self._schedule(retry_ms)
+            return True
+        self._settle(action)
+        if delivered:
+            self.delivered += 1
+            self.max_wait_ms = max(self.max_wait_ms, action.age_ms())
+        self.flush()
+        return True
+
+    def _on_result_timeout(self):
+        action = self._in_flight
+        if action is None or not action.started:
+            return
+        self._in_flight = None
+        self.result_timeouts += 1
+        print(f"OpenEvidence: No outcome for the {action.kind} action, moving on")
+        self._settle(action)
+        self.flush()
+
+    def _settle(self, action):
+        """Take a finished action off the queue"""
+        if self.actions and self.actions[0] is action:
+            self.actions.popleft()
+
+    def _drop_expired(self):
+        now = time.monotonic()
+        while (self.actions and self.actions[0].age_ms(now) > ACTION_TTL_MS
+               and self.actions[0] is not self._in_flight):
+            action = self.actions.popleft()
+            self.expired += 1
+            print(f"OpenEvidence: Dropped expired {action.kind} action")
+            self._report(action, "failed")
+
+    def _report(self, action, status):
+        if status == "failed":
+            show_status(FAILED_MESSAGE, "failed")
+        else:
+            show_status(STATUS_MESSAGES.get((action.kind, status), ""), status)
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        return [
+            ("Page ready", "Yes" if self.ready else "No"),
+            ("Waiting", str(len(self.actions))),
+            ("Delivered", str(self.delivered)),
+            ("Merged duplicates", str(self.merged)),
+            ("Expired", str(self.expired)),
+            ("Retries", str(self.retries)),
+            ("Outcome timeouts", str(self.result_timeouts)),
+            ("Longest wait", "%.1f s" % (self.max_wait_ms / 1000.0)),
+        ]
+
+
+queue = PendingActionQueue()
+
+register_section("Pending Actions", queue.diagnostics)
@@ -0,0 +1,167 @@
+"""
+Renderer crash recovery for the OpenEvidence panel.
+
+If the panel's Chromium render process dies (crash, or killed by the OOM
+killer), QWebEnginePage emits renderProcessTerminated and the view goes
+blank. RendererRecovery puts the loading overlay back and reloads the last
+OpenEvidence URL the panel was on. The panel's normal load path then
+re-injects the keybinding listener and card texts.
+
+Reloads back off exponentially while the renderer keeps dying (a crash
+loop), starting from RETRY_BASE_MS. The backoff resets once the page has
+stayed up for HEALTHY_MS. Crash counts and reasons are kept for the
+Diagnostics view.
+"""
+
+import time
+from collections import Counter, deque
+
+try:
+    from PyQt6.QtCore import QObject, QTimer, QUrl
+except ImportError:
+    from PyQt5.QtCore import QObject, QTimer, QUrl
+
+from .diagnostics import register_section
+
+HOME_URL = "https://www.openevidence.com/"
+RETRY_BASE_MS = 500
+RETRY_MAX_MS = 30000
+MAX_ATTEMPTS = 10          # Consecutive failed reloads before giving up
+HEALTHY_MS = 60000         # Page up this long = crash loop is over
+RECENT_CRASHES = 5         # Crashes listed in the Diagnostics view
+
+
+def _status_name(status):
+    """'killed', 'crashed', 'abnormal' or 'normal' for a termination status"""
+    name = getattr(status, "name", None) or str(status)
+    return name.split(".")[-1].replace("TerminationStatus", "").lower()
+
+
+class RecoveryStats:
+    """Crash and recovery counters, shared by every panel of the session"""
+    def __init__(self):
+        self.crashes = 0
+        self.recoveries = 0
+        self.reasons = Counter()
+        self.recent = deque(maxlen=RECENT_CRASHES)  # (time, reason, exit code)
+        self.last_recovery_ms = None
+        self.gave_up = False
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        rows = [("Renderer crashes", str(self.crashes))]
+        if self.crashes:
+            rows.append(("Reasons", ", ".join("%s: %d" % item for item in self.reasons.most_common())))
+            rows.append(("Recoveries", str(self.recoveries)))
+            if self.last_recovery_ms is not None:
+                rows.append(("Last recovery", "%.1f s" % (self.last_recovery_ms / 1000.0)))
+            if self.gave_up:
+                rows.append(("Status", "Gave up after %d reloads - reopen Anki" % MAX_ATTEMPTS))
+            for when, reason, exit_code in reversed(self.recent):
+                rows.append((time.strftime("%H:%M:%S", time.localtime(when)),
+                             "%s (exit code %s)" % (reason, exit_code)))
+        return rows
+
+
+stats = RecoveryStats()
+
+
+class RendererRecovery(QObject):
+    """Watches a panel's web view and reloads it when its renderer dies"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.last_url = QUrl(HOME_URL)
+        self.recovering = False
+        self.attempts = 0          # Reloads since the last healthy page
+        self._crashed_at = None
+
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self._reload)
+
+        self.healthy_timer = QTimer(self)
+        self.healthy_timer.setSingleShot(True)
+        self.healthy_timer.setInterval(HEALTHY_MS)
+        self.healthy_timer.timeout.connect(self._mark_healthy)
+
+        web = panel.web
+        web.urlChanged.connect(self._remember_url)
+        web.loadFinished.connect(self._on_load_finished)
+        web.page().renderProcessTerminated.connect(self._on_terminated)
+
+    def _remember_url(self, url):
+        """Keep the last OpenEvidence URL (the conversation) to restore it"""
+        if url.scheme() in ("http", "https") and url.host().endswith("openevidence.com"):
+            self.last_url = QUrl(url)
+
+    def _on_terminated(self, status, exit_code):
+        reason = _status_name(status)
+        if reason == "normal":
+            return  # Page closed on purpose (e.g. Anki shutting down)
+
+        stats.crashes += 1
+        stats.reasons[reason] += 1
+        stats.recent.append((time.time(), reason, exit_code))
+        print(f"OpenEvidence: Panel renderer terminated ({reason}, exit code {exit_code}), recovering")
+
+        self.healthy_timer.stop()
+        if not self.recovering:
+            self._crashed_at = time.perf_counter()
+        self.recovering = True
+        self._show_overlay()
+        self._schedule_reload()
+
+    def _schedule_reload(self):
+        if self.retry_timer.isActive():
+            return  # A crash mid-load reports both a failed load and termination
+        if self.attempts >= MAX_ATTEMPTS:
+            stats.gave_up = True
+            self.recovering = False
+            print("OpenEvidence: Panel renderer keeps crashing, giving up")
+            return
+        delay = min(RETRY_BASE_MS * (2 ** self.attempts), RETRY_MAX_MS)
+        self.attempts += 1
+        self.retry_timer.start(delay)
+
+    def _reload(self):
+        try:
+            self.panel.web.load(self.last_url)
+        except Exception as e:
+            print(f"OpenEvidence: Error reloading panel: {e}")
+            self._schedule_reload()
+
+    def _on_load_finished(self, ok):
+        if not self.recovering:
+            if ok and self.attempts:
+                self.healthy_timer.start()
+            return
+
+        if not ok:
+            # Network not back yet or the renderer died again - try later
+            self._show_overlay()
+            self._schedule_reload()
+            return
+
+        self.recovering = False
+        stats.recoveries += 1
+        stats.gave_up = False
+        if self._crashed_at is not None:
+            stats.last_recovery_ms = (time.perf_counter() - self._crashed_at) * 1000.0
+        self.healthy_timer.start()
+
+    def _mark_healthy(self):
+        self.attempts = 0
+
+    def _show_overlay(self):
+        """Cover the blank view with the loader until the page is ready again"""
+        panel = self.panel
+        try:
+            panel.web.hide()
+            panel.loading_overlay.show()
+            panel.loading_overlay.raise_()
+        except:
+            pass
+
+
+register_section("Panel Renderer", stats.diagnostics)
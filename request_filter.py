@@ -0,0 +1,264 @@
+"""
+Request filter for the OpenEvidence panel.
+
+A QWebEngineUrlRequestInterceptor on the panel's "openevidence" profile
+blocks analytics beacons, tag managers, session-replay scripts and other
+third-party bloat before it's fetched, so the panel doesn't compete with the
+reviewer for bandwidth and CPU.
+
+Rules, first match wins:
+
+1. Main frame navigations are never blocked
+2. Hosts in the allow list (and their subdomains) are allowed
+3. Hosts in the block list (and their subdomains) are blocked
+4. Resource types in "block_resource_types" are blocked everywhere
+5. Resource types in "block_third_party_resource_types" are blocked unless
+   the host is a first-party (OpenEvidence) host
+
+The defaults below can be extended in the add-on config ("request_filter"):
+extra "block_hosts"/"allow_hosts" are added to the built-in lists, and the
+resource type lists replace the defaults when given. Anything in the allow
+list wins over the built-in block list, so a host can be unblocked there.
+
+Blocked and allowed requests are counted per host for the Diagnostics view.
+"""
+
+from aqt import mw
+
+try:
+    from PyQt6.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+except ImportError:
+    try:
+        from PyQt5.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+    except ImportError:
+        QWebEngineUrlRequestInterceptor = None
+        QWebEngineUrlRequestInfo = None
+
+from .diagnostics import register_section
+
+FIRST_PARTY_HOSTS = ["openevidence.com"]
+
+# Sign-in providers and anything else the site needs to work
+DEFAULT_ALLOW_HOSTS = [
+    "accounts.google.com",
+    "appleid.apple.com",
+    "login.microsoftonline.com",
+    "challenges.cloudflare.com",
+    "js.stripe.com",
+]
+
+# Analytics, tag managers, session replay, ad and social trackers
+DEFAULT_BLOCK_HOSTS = [
+    "google-analytics.com",
+    "analytics.google.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "amplitude.com",
+    "heapanalytics.com",
+    "hotjar.com",
+    "hotjar.io",
+    "fullstory.com",
+    "clarity.ms",
+    "logrocket.io",
+    "lr-ingest.io",
+    "mouseflow.com",
+    "posthog.com",
+    "datadoghq-browser-agent.com",
+    "browser-intake-datadoghq.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "bat.bing.com",
+    "analytics.tiktok.com",
+]
+
+DEFAULT_BLOCK_RESOURCE_TYPES = ["ping", "csp_report", "prefetch"]
+DEFAULT_BLOCK_THIRD_PARTY_RESOURCE_TYPES = ["font"]
+
+# Config name -> QWebEngineUrlRequestInfo.ResourceType member
+RESOURCE_TYPES = {
+    "main_frame": "ResourceTypeMainFrame",
+    "sub_frame": "ResourceTypeSubFrame",
+    "stylesheet": "ResourceTypeStylesheet",
+    "script": "ResourceTypeScript",
+    "image": "ResourceTypeImage",
+    "font": "ResourceTypeFontResource",
+    "sub_resource": "ResourceTypeSubResource",
+    "object": "ResourceTypeObject",
+    "media": "ResourceTypeMedia",
+    "worker": "ResourceTypeWorker",
+    "shared_worker": "ResourceTypeSharedWorker",
+    "prefetch": "ResourceTypePrefetch",
+    "favicon": "ResourceTypeFavicon",
+    "xhr": "ResourceTypeXhr",
+    "ping": "ResourceTypePing",
+    "service_worker": "ResourceTypeServiceWorker",
+    "csp_report": "ResourceTypeCspReport",
+    "plugin_resource": "ResourceTypePluginResource",
+    "websocket": "ResourceTypeWebSocket",
+}
+
+MAX_CACHED_DECISIONS = 2048
+TOP_HOSTS = 10  # Hosts listed in the Diagnostics view
+
+
+def _host_suffixes(host):
+    """'a.b.example.com' -> 'a.b.example.com', 'b.example.com', 'example.com', 'com'"""
+    parts = host.split(".")
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+
+class RequestRules:
+    """Block/allow decisions and per-host counters (no Qt needed)"""
+    def __init__(self):
+        self.enabled = True
+        self.allow_hosts = set(DEFAULT_ALLOW_HOSTS)
+        self.block_hosts = set(DEFAULT_BLOCK_HOSTS)
+        self.first_party_hosts = set(FIRST_PARTY_HOSTS)
+        self.block_types = set(DEFAULT_BLOCK_RESOURCE_TYPES)
+        self.block_third_party_types = set(DEFAULT_BLOCK_THIRD_PARTY_RESOURCE_TYPES)
+        self.counts = {}       # host -> [allowed, blocked]
+        self.allowed = 0
+        self.blocked = 0
+        self._decisions = {}   # (host, resource type) -> (blocked, reason)
+
+    def reload_config(self):
+        """Re-read the "request_filter" config section"""
+        try:
+            config = (mw.addonManager.getConfig(__name__) or {}).get("request_filter", {})
+        except:
+            config = {}
+
+        self.enabled = bool(config.get("enabled", True))
+        self.allow_hosts = set(DEFAULT_ALLOW_HOSTS) | set(h.lower() for h in config.get("allow_hosts", []))
+        self.block_hosts = set(DEFAULT_BLOCK_HOSTS) | set(h.lower() for h in config.get("block_hosts", []))
+        self.block_types = set(config.get("block_resource_types", DEFAULT_BLOCK_RESOURCE_TYPES))
+        self.block_third_party_types = set(
+            config.get("block_third_party_resource_types", DEFAULT_BLOCK_THIRD_PARTY_RESOURCE_TYPES))
+        self._decisions.clear()
+
+    def _matches(self, host, hosts):
+        return any(suffix in hosts for suffix in _host_suffixes(host))
+
+    def decide(self, host, resource_type):
+        """Return (blocked, reason) for a request; resource_type is a config name"""
+        key = (host, resource_type)
+        decision = self._decisions.get(key)
+        if decision is not None:
+            return decision
+
+        if resource_type == "main_frame":
+            decision = (False, "navigation")
+        elif self._matches(host, self.allow_hosts):
+            decision = (False, "allow list")
+        elif self._matches(host, self.block_hosts):
+            decision = (True, "block list")
+        elif resource_type in self.block_types:
+            decision = (True, resource_type)
+        elif resource_type in self.block_third_party_types and not self._matches(host, self.first_party_hosts):
+            decision = (True, "third-party " + resource_type)
+        else:
+            decision = (False, "default")
+
+        if len(self._decisions) >= MAX_CACHED_DECISIONS:
+            self._decisions.clear()
+        self._decisions[key] = decision
+        return decision
+
+    def check(self, host, resource_type):
+        """Decide and count a request; returns True if it should be blocked"""
+        host = (host or "").lower()
+        blocked = self.enabled and self.decide(host, resource_type)[0]
+
+        counts = self.counts.get(host)
+        if counts is None:
+            counts = self.counts[host] = [0, 0]
+        if blocked:
+            counts[1] += 1
+            self.blocked += 1
+        else:
+            counts[0] += 1
+            self.allowed += 1
+        return blocked
+
+    def reset_counts(self):
+        self.counts.clear()
+        self.allowed = 0
+        self.blocked = 0
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        if QWebEngineUrlRequestInterceptor is None:
+            return [("Status", "Unavailable (no QWebEngineUrlRequestInterceptor)")]
+
+        rows = [
+            ("Status", "On" if self.enabled else "Off (request_filter.enabled)"),
+            ("Requests", "%d allowed, %d blocked" % (self.allowed, self.blocked)),
+        ]
+        busiest = sorted(self.counts.items(), key=lambda item: -(item[1][0] + item[1][1]))
+        for host, (allowed, blocked) in busiest[:TOP_HOSTS]:
+            rows.append((host or "(no host)", "%d allowed, %d blocked" % (allowed, blocked)))
+        if len(busiest) > TOP_HOSTS:
+            rows.append(("Other hosts", str(len(busiest) - TOP_HOSTS)))
+        return rows
+
+
+rules = RequestRules()
+
+
+if QWebEngineUrlRequestInterceptor is not None:
+    class RequestInterceptor(QWebEngineUrlRequestInterceptor):
+        """Applies `rules` to every request made by the panel's profile"""
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._type_names = {}
+            for name, member in RESOURCE_TYPES.items():
+                try:
+                    value = getattr(QWebEngineUrlRequestInfo.ResourceType, member)
+                except AttributeError:
+                    try:
+                        value = getattr(QWebEngineUrlRequestInfo, member)  # PyQt5
+                    except AttributeError:
+                        continue  # Not in this Qt version
+                self._type_names[value] = name
+
+        def interceptRequest(self, info):
+            try:
+                resource_type = self._type_names.get(info.resourceType(), "unknown")
+                if rules.check(info.requestUrl().host(), resource_type):
+                    info.block(True)
+            except Exception as e:
+                print(f"OpenEvidence: Request filter error: {e}")
+else:
+    RequestInterceptor = None
+
+# Keep the interceptor alive for the profile's lifetime
+_interceptor = None
+
+
+def install(profile):
+    """Install the request filter on a QWebEngineProfile; returns True on success"""
+    global _interceptor
+    if RequestInterceptor is None or profile is None:
+        return False
+
+    rules.reload_config()
+    if _interceptor is None:
+        _interceptor = RequestInterceptor()
+
+    try:
+        profile.setUrlRequestInterceptor(_interceptor)
+    except AttributeError:
+        # Qt < 5.13
+        profile.setRequestInterceptor(_interceptor)
+    return True
+
+
+register_section("Request Filter", rules.diagnostics)
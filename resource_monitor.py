@@ -0,0 +1,235 @@
+"""
+Resource monitor for the OpenEvidence panel's renderer process.
+
+Every "sample_ms" ResourceMonitor reads the panel renderer's PID
+(QWebEnginePage.renderProcessPid) and samples its resident memory and CPU
+time from /proc. The PID is re-read on every sample, so a renderer that
+was restarted after a crash is picked up. The latest, peak and average
+numbers are shown in the Diagnostics view.
+
+Memory thresholds from the "resource_monitor" config section trigger
+actions, mildest first (0 turns one off):
+
+- freeze_hidden_mb  - freeze the page while the panel is hidden, so the
+                      site's timers and polling stop growing it
+- discard_hidden_mb - discard the page while the panel is hidden: Chromium
+                      releases the renderer's memory and the page reloads
+                      when the panel is shown again
+- reload_mb         - hard limit: reload the page once memory has stayed
+                      above this for "reload_after_samples" samples in a row,
+                      even while the panel is visible
+
+Frozen and discarded pages are made active again when the panel is shown
+(see page_lifecycle.py). Reloads are rate limited to one per
+ACTION_COOLDOWN_S.
+
+/proc only exists on Linux; elsewhere the monitor reports it's unavailable
+and does nothing.
+"""
+
+import os
+import time
+
+try:
+    from PyQt6.QtCore import QObject, QTimer, QEvent
+except ImportError:
+    from PyQt5.QtCore import QObject, QTimer, QEvent
+
+from aqt import mw
+
+from .diagnostics import register_section
+from .page_lifecycle import set_lifecycle_state
+
+DEFAULT_SAMPLE_MS = 30000
+ACTION_COOLDOWN_S = 600
+
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+except (AttributeError, ValueError, OSError):
+    CLOCK_TICKS = 100
+
+
+def read_rss_mb(pid):
+    """Resident memory of a process in MB, from /proc/<pid>/status"""
+    with open("/proc/%d/status" % pid) as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024.0
+    return None
+
+
+def read_cpu_seconds(pid):
+    """User + system CPU time of a process in seconds, from /proc/<pid>/stat"""
+    with open("/proc/%d/stat" % pid) as f:
+        # The command name can contain spaces - fields start after its ')'
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / float(CLOCK_TICKS)
+
+
+class ResourceStats:
+    """Renderer samples and policy actions, shared by every panel of the session"""
+    def __init__(self):
+        self.available = True
+        self.pid = None
+        self.samples = 0
+        self.rss_mb = None
+        self.peak_rss_mb = 0.0
+        self.cpu_percent = None
+        self.cpu_seconds = 0.0     # CPU time used by renderers seen so far
+        self.first_sample = None
+        self.actions = {"freeze": 0, "discard": 0, "reload": 0}
+        self.last_action = None    # (time, action, rss)
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        if not self.available:
+            return [("Status", "Not available on this platform")]
+        if not self.samples:
+            return [("Status", "No samples yet")]
+        rows = [
+            ("Renderer PID", str(self.pid)),
+            ("Memory", "%.0f MB (peak %.0f MB)" % (self.rss_mb, self.peak_rss_mb)),
+            ("CPU", "%.1f%%" % self.cpu_percent if self.cpu_percent is not None else "-"),
+        ]
+        elapsed = time.time() - self.first_sample
+        if elapsed > 0:
+            rows.append(("CPU (session average)", "%.1f%%" % (100.0 * self.cpu_seconds / elapsed)))
+        rows.append(("Samples", str(self.samples)))
+        rows.append(("Actions", "frozen %(freeze)d, discarded %(discard)d, reloaded %(reload)d"
+                     % self.actions))
+        if self.last_action is not None:
+            when, action, rss = self.last_action
+            rows.append(("Last action", "%s at %s (%.0f MB)"
+                         % (action, time.strftime("%H:%M", time.localtime(when)), rss)))
+        return rows
+
+
+stats = ResourceStats()
+
+
+class ResourceMonitor(QObject):
+    """Samples a panel's renderer and applies the memory-pressure policy"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self._last_cpu = None      # (pid, cpu seconds, wall time)
+        self._over_reload = 0      # Samples in a row above reload_mb
+        self._last_action_at = {}
+        self.suspended = None      # "freeze" / "discard" while the page is held by us
+        self.reload_config()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.sample_ms)
+        self.timer.timeout.connect(self.sample)
+        if self.enabled:
+            self.timer.start()
+        panel.installEventFilter(self)
+
+    def reload_config(self):
+        """Read the "resource_monitor" config section"""
+        try:
+            config = (mw.addonManager.getConfig(__name__) or {}).get("resource_monitor", {})
+        except:
+            config = {}
+        self.enabled = bool(config.get("enabled", True))
+        self.sample_ms = int(config.get("sample_ms", DEFAULT_SAMPLE_MS))
+        self.freeze_hidden_mb = float(config.get("freeze_hidden_mb", 800))
+        self.discard_hidden_mb = float(config.get("discard_hidden_mb", 1200))
+        self.reload_mb = float(config.get("reload_mb", 1500))
+        self.reload_after_samples = int(config.get("reload_after_samples", 4))
+
+    def sample(self):
+        try:
+            pid = self.panel.web.page().renderProcessPid()
+        except:
+            pid = 0
+        if not pid:
+            return  # No renderer yet, page discarded (or Qt < 5.15)
+
+        try:
+            rss_mb = read_rss_mb(pid)
+            cpu_seconds = read_cpu_seconds(pid)
+        except FileNotFoundError:
+            if not os.path.isdir("/proc"):
+                stats.available = False
+                self.timer.stop()
+            return  # Renderer exited between reading the PID and /proc
+        except Exception as e:
+            print(f"OpenEvidence: Error sampling panel renderer: {e}")
+            return
+        if rss_mb is None:
+            return
+
+        now = time.time()
+        if stats.first_sample is None:
+            stats.first_sample = now
+        if self._last_cpu is not None and self._last_cpu[0] == pid:
+            used = cpu_seconds - self._last_cpu[1]
+            stats.cpu_seconds += used
+            stats.cpu_percent = 100.0 * used / max(now - self._last_cpu[2], 0.001)
+        else:
+            stats.cpu_percent = None  # New renderer - no interval yet
+        self._last_cpu = (pid, cpu_seconds, now)
+
+        stats.pid = pid
+        stats.samples += 1
+        stats.rss_mb = rss_mb
+        stats.peak_rss_mb = max(stats.peak_rss_mb, rss_mb)
+        self._apply_policy(rss_mb)
+
+    def _apply_policy(self, rss_mb):
+        hidden = not self.panel.isVisible()
+
+        if self.reload_mb and rss_mb >= self.reload_mb:
+            self._over_reload += 1
+        else:
+            self._over_reload = 0
+        if self._over_reload >= self.reload_after_samples and self._cooled_down("reload"):
+            self._over_reload = 0
+            self._record("reload", rss_mb)
+            self._resume()
+            try:
+                self.panel.web.reload()
+            except Exception as e:
+                print(f"OpenEvidence: Error reloading panel: {e}")
+            return
+
+        if not hidden:
+            return
+        page = self.panel.web.page()
+        if (self.discard_hidden_mb and rss_mb >= self.discard_hidden_mb
+                and self.suspended != "discard"):
+            # Discarding needs an active or frozen page, and frees the renderer
+            if set_lifecycle_state(page, "Discarded"):
+                self.suspended = "discard"
+                self._record("discard", rss_mb)
+        elif self.freeze_hidden_mb and rss_mb >= self.freeze_hidden_mb and self.suspended is None:
+            if set_lifecycle_state(page, "Frozen"):
+                self.suspended = "freeze"
+                self._record("freeze", rss_mb)
+
+    def _resume(self):
+        """Make a page we froze or discarded active again"""
+        if self.suspended is not None:
+            self.suspended = None
+            set_lifecycle_state(self.panel.web.page(), "Active")
+
+    def _cooled_down(self, action):
+        last = self._last_action_at.get(action)
+        return last is None or time.time() - last >= ACTION_COOLDOWN_S
+
+    def _record(self, action, rss_mb):
+        now = time.time()
+        self._last_action_at[action] = now
+        stats.actions[action] += 1
+        stats.last_action = (now, action, rss_mb)
+        print(f"OpenEvidence: Panel renderer at {rss_mb:.0f} MB, {action.replace('_', ' ')}")
+
+    def eventFilter(self, obj, event):
+        # Resume (or, if discarded, reload) the page as soon as the panel is shown
+        if obj is self.panel and event.type() == QEvent.Type.Show:
+            self._resume()
+        return False
+
+
+register_section("Panel Resources", stats.diagnostics)
@@ -5,6 +5,9 @@ Shows a floating action bar when text is highlighted on flashcards
 
 from aqt import mw, gui_hooks
 
+from .key_matcher import chord_matcher_script
+from .latency import budget, REVIEW_CONTEXTS
+
 
 # JavaScript code to inject into the reviewer
 HIGHLIGHT_BUBBLE_JS = """
@@ -17,59 +20,28 @@ HIGHLIGHT_BUBBLE_JS = """
     console.log('Anki: Injecting highlight bubble for OpenEvidence');
 
     let bubble = null;
-    let currentState = 'default'; // 'default' or 'input'
+    let currentState = 'default'; // 'default', 'input' or 'status'
     let selectedText = '';
     let cmdKeyHeld = false;
     let contextText = ''; // Store context text for the pill
 
-    // Completely rewritten key matching - more aggressive approach
-    function checkShortcut(e, configKeys) {
-        if (!configKeys || configKeys.length === 0) return false;
-
-        var isMac = navigator.platform.toUpperCase().indexOf('MAC') >= 0;
-        var pressedKeys = {};
-
-        // Build pressed keys map
-        if (e.shiftKey) pressedKeys['Shift'] = true;
-        if (e.altKey) pressedKeys['Alt'] = true;
-        
-        if (isMac) {
-            if (e.ctrlKey) pressedKeys['Control'] = true;
-            if (e.metaKey) pressedKeys['Meta'] = true;
-        } else {
-            if (e.ctrlKey || e.metaKey) pressedKeys['Control/Meta'] = true;
-        }
-
-        // Get the regular key - try multiple methods for reliability
-        // On macOS, Control+T might give e.key as "Tab" (browser shortcut) but e.code as "KeyT"
-        var regularKey = null;
-        
-        // First try e.key if it's a single character
-        if (e.key && e.key.length === 1 && /^[A-Za-z0-9]$/.test(e.key)) {
-            regularKey = e.key.toUpperCase();
-        } 
-        // Fallback to e.code for more reliable detection (especially for Control combinations)
-        else if (e.code) {
-            // Match patterns like "KeyT", "KeyA", "Digit1", etc.
-            var codeMatch = e.code.match(/^(Key|Digit)([A-Z0-9])$/);
-            if (codeMatch) {
-                regularKey = codeMatch[2];
-            }
-        }
-
-        if (regularKey) {
-            pressedKeys[regularKey] = true;
-        }
-
-        // Check if all required keys are present
-        for (var i = 0; i < configKeys.length; i++) {
-            if (!pressedKeys[configKeys[i]]) {
-                return false;
-            }
+    // Quick action bindings in the shape the shared chord matcher expects.
+    // Rebuilt only when Python replaces the config objects, so the matcher
+    // keeps its compiled table between keystrokes.
+    let quickActionSources = [undefined, undefined];
+    let quickActionBindings = [];
+    const quickActionMatcher = window.ankiChord.createMatcher();
+
+    function getQuickActionBindings() {
+        const cfg = window.quickActionsConfig || {};
+        if (cfg.askQuestion !== quickActionSources[0] || cfg.addToChat !== quickActionSources[1]) {
+            quickActionSources = [cfg.askQuestion, cfg.addToChat];
+            quickActionBindings = [
+                { action: 'askQuestion', keys: (cfg.askQuestion && cfg.askQuestion.keys) || ['Meta', 'R'] },
+                { action: 'addToChat', keys: (cfg.addToChat && cfg.addToChat.keys) || ['Meta', 'F'] }
+            ];
         }
-
-        // Verify exact count match
-        return Object.keys(pressedKeys).length === configKeys.length;
+        return quickActionBindings;
     }
 
     // Handle shortcut actions
@@ -82,11 +54,8 @@ HIGHLIGHT_BUBBLE_JS = """
         
         if (text && text.length > 0) {
             selectedText = text;
-            const range = selection.getRangeAt(0);
-            const rect = range.getBoundingClientRect();
-            bubble.style.display = 'block';
-            renderInputState();
-            setTimeout(() => positionBubble(rect), 0);
+            const rect = selection.getRangeAt(0).getBoundingClientRect();
+            openInputAt(anchorFromRect(rect));
             
             // Notify tutorial that shortcut was used
             try {
@@ -94,7 +63,7 @@ HIGHLIGHT_BUBBLE_JS = """
             } catch (err) {
                 // Ignore if pycmd not available
             }
-        } else if (currentState === 'default' || bubble.style.display === 'none') {
+        } else if (currentState === 'default' || !isBubbleVisible()) {
             selectedText = '';
             const centerRect = {
                 left: window.innerWidth / 2,
@@ -104,9 +73,7 @@ HIGHLIGHT_BUBBLE_JS = """
                 width: 0,
                 height: 0
             };
-            bubble.style.display = 'block';
-            renderInputState();
-            setTimeout(() => positionBubble(centerRect), 0);
+            openInputAt(anchorFromRect(centerRect));
         }
     }
 
@@ -137,57 +104,27 @@ HIGHLIGHT_BUBBLE_JS = """
         }
     }, true);
 
-    // Main keyboard shortcut handler - completely rewritten
+    // Main keyboard shortcut handler
     // Use capture phase with highest priority on window (not document)
     window.addEventListener('keydown', function(e) {
-        // Get shortcuts from config
-        var askQuestionKeys = (window.quickActionsConfig && window.quickActionsConfig.askQuestion && window.quickActionsConfig.askQuestion.keys) || ['Meta', 'R'];
-        var addToChatKeys = (window.quickActionsConfig && window.quickActionsConfig.addToChat && window.quickActionsConfig.addToChat.keys) || ['Meta', 'F'];
+        const bindings = getQuickActionBindings();
 
-        // Early check: if Control key is pressed and it's part of our shortcuts, prevent default immediately
-        var isMac = navigator.platform.toUpperCase().indexOf('MAC') >= 0;
-        var hasControl = isMac ? e.ctrlKey : (e.ctrlKey || e.metaKey);
-        
-        if (hasControl) {
-            // Check if this Control combination matches any of our shortcuts
-            var askHasControl = askQuestionKeys.indexOf('Control') !== -1;
-            var chatHasControl = addToChatKeys.indexOf('Control') !== -1;
-            
-            if (askHasControl || chatHasControl) {
-                // Prevent default early for Control combinations to stop browser shortcuts
-                e.preventDefault();
-            }
+        // Prevent default early for Control combinations to stop browser shortcuts
+        if (quickActionMatcher.claimsControl(e, bindings)) {
+            e.preventDefault();
         }
 
-        // Debug logging
-        console.log('Quick Actions keydown:', {
-            key: e.key,
-            code: e.code,
-            ctrlKey: e.ctrlKey,
-            metaKey: e.metaKey,
-            shiftKey: e.shiftKey,
-            altKey: e.altKey,
-            askQuestionKeys: askQuestionKeys,
-            addToChatKeys: addToChatKeys,
-            checkResult: {
-                ask: checkShortcut(e, askQuestionKeys),
-                chat: checkShortcut(e, addToChatKeys)
-            }
-        });
-
-        // Check Ask Question shortcut
-        if (checkShortcut(e, askQuestionKeys)) {
-            console.log('Ask Question match!');
-            handleAskQuestion(e);
-            return false;  // Return false as additional prevention
+        const index = quickActionMatcher.match(e, bindings);
+        if (index === -1) {
+            return;
         }
 
-        // Check Add to Chat shortcut
-        if (checkShortcut(e, addToChatKeys)) {
-            console.log('Add to Chat match!');
+        if (bindings[index].action === 'askQuestion') {
+            handleAskQuestion(e);
+        } else {
             handleAddToChatShortcut(e);
-            return false;  // Return false as additional prevention
         }
+        return false;  // Return false as additional prevention
     }, true);  // Capture phase - intercept before anyone else
 
     document.addEventListener('keyup', (e) => {
@@ -201,239 +138,346 @@ HIGHLIGHT_BUBBLE_JS = """
         cmdKeyHeld = false;
     });
 
-    // Create the bubble element
-    function createBubble() {
-        const div = document.createElement('div');
-        div.id = 'anki-highlight-bubble';
-        div.style.cssText = `
+    // Stylesheet for the bubble's closed shadow root. Card templates can't
+    // restyle anything in here, and hover/show/hide style changes only
+    // invalidate the shadow tree instead of the whole card.
+    const BUBBLE_CSS = `
+        :host {
+            all: initial;
             position: absolute;
+            top: 0;
+            left: 0;
+            z-index: 9999;
+            contain: layout style paint;
+        }
+        .bubble {
+            display: none;
             background: #1e1e1e;
             border-radius: 6px;
             border: 1px solid #4b5563;
             padding: 4px;
             box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.3), 0 4px 6px -2px rgba(0, 0, 0, 0.2);
-            z-index: 9999;
-            display: none;
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
             font-size: 12px;
             color: #ffffff;
             line-height: 1;
             min-height: auto;
             overflow: hidden;
-        `;
-        document.body.appendChild(div);
+            cursor: default;
+            user-select: none;
+            touch-action: none;
+        }
+        .bubble.visible {
+            display: block;
+        }
+        .bubble.dragging {
+            cursor: grabbing;
+        }
+        button {
+            font-family: inherit;
+            margin: 0;
+        }
+        .actions {
+            display: flex;
+            align-items: center;
+            gap: 1px;
+            line-height: 1;
+            margin: 0;
+            padding: 0;
+        }
+        .action-btn {
+            background: transparent;
+            border: none;
+            color: #ffffff;
+            padding: 2px 8px;
+            cursor: pointer;
+            border-radius: 3px;
+            font-size: 12px;
+            font-weight: 500;
+            transition: all 0.15s ease;
+            white-space: nowrap;
+            display: inline-flex;
+            align-items: center;
+            gap: 6px;
+            line-height: 1;
+        }
+        .action-btn:hover {
+            background-color: #374151;
+        }
+        .shortcut {
+            font-size: 10px;
+            color: #9ca3af;
+            font-weight: 400;
+        }
+        .status {
+            padding: 4px 8px;
+            font-size: 12px;
+            font-weight: 500;
+            line-height: 1.2;
+            white-space: nowrap;
+        }
+        .status.queued {
+            color: #93c5fd;
+        }
+        .status.failed {
+            color: #fca5a5;
+        }
+        .divider {
+            width: 1px;
+            height: 14px;
+            background-color: #4b5563;
+            margin: 0;
+        }
+        .input-state {
+            display: flex;
+            flex-direction: column;
+            padding: 0px;
+            gap: 0px;
+            min-width: 280px;
+            max-width: 380px;
+            position: relative;
+        }
+        .input-row {
+            display: flex;
+            align-items: flex-start;
+            gap: 4px;
+            padding: 7px 6px 6px 8px;
+        }
+        #question-input {
+            background: transparent;
+            border: none;
+            color: #ffffff;
+            padding: 0;
+            font-size: 13px;
+            font-weight: 500;
+            outline: none;
+            flex: 1;
+            font-family: inherit;
+            resize: none;
+            overflow-y: auto;
+            min-height: 10px;
+            max-height: 100px;
+            line-height: 1.3;
+            word-wrap: break-word;
+            margin: 0;
+            user-select: text;
+        }
+        #close-btn {
+            background: transparent;
+            border: none;
+            color: #9ca3af;
+            cursor: pointer;
+            font-size: 13px;
+            padding: 0;
+            width: 18px;
+            height: 18px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: all 0.15s ease;
+            line-height: 1;
+            flex-shrink: 0;
+            margin-left: auto;
+            margin-right: -1px;
+        }
+        #close-btn:hover {
+            color: #ffffff;
+        }
+        .footer-row {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin: 0;
+            padding: 0 6px 6px 8px;
+        }
+        #context-pill {
+            display: flex;
+            align-items: center;
+            gap: 6px;
+            background: rgba(255, 255, 255, 0.05);
+            border: 1px dashed rgba(255, 255, 255, 0.2);
+            border-radius: 12px;
+            padding: 2px 8px;
+            height: 20px;
+            box-sizing: border-box;
+            font-size: 10px;
+            color: #9ca3af;
+            cursor: pointer;
+            transition: all 0.15s ease;
+            max-width: 180px;
+            white-space: nowrap;
+            overflow: hidden;
+        }
+        #context-pill.active {
+            border-style: solid;
+            border-color: rgba(59, 130, 246, 0.6);
+            color: #e5e7eb;
+            background: rgba(59, 130, 246, 0.1);
+            box-shadow: 0 0 8px rgba(59, 130, 246, 0.4);
+        }
+        #context-text {
+            overflow: hidden;
+            text-overflow: ellipsis;
+            line-height: 1.2;
+        }
+        #context-clear {
+            display: none;
+            background: transparent;
+            border: none;
+            color: inherit;
+            cursor: pointer;
+            font-size: 10px;
+            padding: 0;
+            width: 10px;
+            height: 10px;
+            flex-shrink: 0;
+            line-height: 1;
+            opacity: 0.7;
+        }
+        #context-pill.active #context-clear {
+            display: block;
+        }
+        #submit-btn {
+            background: #3b82f6;
+            border: none;
+            color: #ffffff;
+            padding: 0;
+            cursor: pointer;
+            border-radius: 50%;
+            font-size: 13px;
+            font-weight: 600;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: all 0.15s ease;
+            width: 19px;
+            height: 19px;
+            flex-shrink: 0;
+        }
+        #submit-btn:hover {
+            background-color: #2563eb;
+        }
+    `;
+
+    let host = null;  // Light-DOM host element attached to the card's body
+
+    // Create the bubble inside a closed shadow root
+    function createBubble() {
+        host = document.createElement('div');
+        host.id = 'anki-highlight-bubble';
+        // :host rules lose to card CSS that matches the host (e.g. a
+        // template's div { position: relative }), so the properties that
+        // place the bubble are set inline and marked important
+        const HOST_STYLE = {
+            display: 'block',
+            position: 'absolute',
+            top: '0',
+            left: '0',
+            margin: '0',
+            'z-index': '9999'
+        };
+        for (const name in HOST_STYLE) {
+            host.style.setProperty(name, HOST_STYLE[name], 'important');
+        }
+        const root = host.attachShadow({ mode: 'closed' });
+
+        const style = document.createElement('style');
+        style.textContent = BUBBLE_CSS;
+        root.appendChild(style);
+
+        const div = document.createElement('div');
+        div.className = 'bubble';
+        root.appendChild(div);
+
+        document.body.appendChild(host);
         return div;
     }
 
+    function isBubbleVisible() {
+        return bubble.classList.contains('visible');
+    }
+
+    function setBubbleVisible(visible) {
+        bubble.classList.toggle('visible', visible);
+    }
+
+    // True if the event came from inside the bubble. Events from a closed
+    // shadow root are retargeted to the host outside of it.
+    function isFromBubble(e) {
+        return e.target === host || bubble.contains(e.target);
+    }
+
+    // Keep mouse events on bubble controls from reaching document-level handlers
+    function stopMouseBubbling(element) {
+        element.addEventListener('mouseup', (e) => {
+            e.stopPropagation();
+        });
+        element.addEventListener('mousedown', (e) => {
+            e.stopPropagation();
+        });
+    }
+
     // Render default state with two buttons and divider
     function renderDefaultState() {
         currentState = 'default';
         bubble.innerHTML = `
-            <div style="display: flex; align-items: center; gap: 1px; line-height: 1; margin: 0; padding: 0;">
-                <button id="add-to-chat-btn" style="
-                    background: transparent;
-                    border: none;
-                    color: #ffffff;
-                    padding: 2px 8px;
-                    cursor: pointer;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    font-weight: 500;
-                    transition: all 0.15s ease;
-                    white-space: nowrap;
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    display: inline-flex;
-                    align-items: center;
-                    gap: 6px;
-                    line-height: 1;
-                    margin: 0;
-                ">
+            <div class="actions">
+                <button id="add-to-chat-btn" class="action-btn">
                     <span>Add to Chat</span>
-                    <span style="font-size: 10px; color: #9ca3af; font-weight: 400;">${window.quickActionsConfig?.addToChat?.display || '⌘F'}</span>
+                    <span class="shortcut" data-action="addToChat"></span>
                 </button>
-                <div style="width: 1px; height: 14px; background-color: #4b5563; margin: 0;"></div>
-                <button id="ask-question-btn" style="
-                    background: transparent;
-                    border: none;
-                    color: #ffffff;
-                    padding: 2px 8px;
-                    cursor: pointer;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    font-weight: 500;
-                    transition: all 0.15s ease;
-                    white-space: nowrap;
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    display: inline-flex;
-                    align-items: center;
-                    gap: 6px;
-                    line-height: 1;
-                    margin: 0;
-                ">
+                <div class="divider"></div>
+                <button id="ask-question-btn" class="action-btn">
                     <span>Ask Question</span>
-                    <span style="font-size: 10px; color: #9ca3af; font-weight: 400;">${window.quickActionsConfig?.askQuestion?.display || '⌘R'}</span>
+                    <span class="shortcut" data-action="askQuestion"></span>
                 </button>
             </div>
         `;
+        refreshShortcutLabels();
 
-        // Add hover effects
         const addToChatBtn = bubble.querySelector('#add-to-chat-btn');
         const askQuestionBtn = bubble.querySelector('#ask-question-btn');
 
-        addToChatBtn.addEventListener('mouseenter', () => {
-            addToChatBtn.style.backgroundColor = '#374151';
-        });
-        addToChatBtn.addEventListener('mouseleave', () => {
-            addToChatBtn.style.backgroundColor = 'transparent';
-        });
-
-        askQuestionBtn.addEventListener('mouseenter', () => {
-            askQuestionBtn.style.backgroundColor = '#374151';
-        });
-        askQuestionBtn.addEventListener('mouseleave', () => {
-            askQuestionBtn.style.backgroundColor = 'transparent';
-        });
-
         // Add click handlers
         addToChatBtn.addEventListener('click', (e) => {
             e.stopPropagation();
             handleAddToChat();
         });
-        // Prevent mouseup/mousedown from bubbling to document level
-        addToChatBtn.addEventListener('mouseup', (e) => {
-            e.stopPropagation();
-        });
-        addToChatBtn.addEventListener('mousedown', (e) => {
-            e.stopPropagation();
-        });
+        stopMouseBubbling(addToChatBtn);
 
         askQuestionBtn.addEventListener('click', (e) => {
             e.stopPropagation();
             renderInputState();
         });
-        // Prevent mouseup/mousedown from bubbling to document level
-        askQuestionBtn.addEventListener('mouseup', (e) => {
-            e.stopPropagation();
-        });
-        askQuestionBtn.addEventListener('mousedown', (e) => {
-            e.stopPropagation();
-        });
+        stopMouseBubbling(askQuestionBtn);
+    }
+
+    // Update the shortcut hints shown on the action buttons
+    function refreshShortcutLabels() {
+        const cfg = window.quickActionsConfig || {};
+        const labels = bubble.querySelectorAll('.shortcut');
+        for (let i = 0; i < labels.length; i++) {
+            const action = labels[i].getAttribute('data-action');
+            const fallback = action === 'addToChat' ? '⌘F' : '⌘R';
+            labels[i].textContent = (cfg[action] && cfg[action].display) || fallback;
+        }
     }
 
     function renderInputState() {
         currentState = 'input';
         bubble.innerHTML = `
-            <div style="
-                display: flex;
-                flex-direction: column;
-                padding: 0px;
-                gap: 0px;
-                min-width: 280px;
-                max-width: 380px;
-                position: relative;
-            ">
-                <div style="display: flex; align-items: flex-start; gap: 4px; padding: 7px 6px 6px 8px;">
-                    <textarea
-                        id="question-input"
-                        placeholder="Ask a question..."
-                        rows="1"
-                        style="
-                            background: transparent;
-                            border: none;
-                            color: #ffffff;
-                            padding: 0;
-                            font-size: 13px;
-                            font-weight: 500;
-                            outline: none;
-                            flex: 1;
-                            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                            resize: none;
-                            overflow-y: auto;
-                            min-height: 10px;
-                            max-height: 100px;
-                            line-height: 1.3;
-                            word-wrap: break-word;
-                            margin: 0;
-                        "
-                    ></textarea>
-                    <button id="close-btn" style="
-                        background: transparent;
-                        border: none;
-                        color: #9ca3af;
-                        cursor: pointer;
-                        font-size: 13px;
-                        padding: 0;
-                        width: 18px;
-                        height: 18px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        transition: all 0.15s ease;
-                        line-height: 1;
-                        flex-shrink: 0;
-                        margin: 0;
-                        margin-left: auto;
-                        margin-right: -1px;
-                    ">✕</button>
+            <div class="input-state">
+                <div class="input-row">
+                    <textarea id="question-input" placeholder="Ask a question..." rows="1"></textarea>
+                    <button id="close-btn">✕</button>
                 </div>
 
-                <div style="display: flex; justify-content: space-between; align-items: center; margin: 0; padding: 0 6px 6px 8px;">
-                    <div id="context-pill" style="
-                        display: flex;
-                        align-items: center;
-                        gap: 6px;
-                        background: rgba(255, 255, 255, 0.05);
-                        border: 1px dashed rgba(255, 255, 255, 0.2);
-                        border-radius: 12px;
-                        padding: 2px 8px;
-                        height: 20px;
-                        box-sizing: border-box;
-                        font-size: 10px;
-                        color: #9ca3af;
-                        cursor: pointer;
-                        transition: all 0.15s ease;
-                        max-width: 180px;
-                        white-space: nowrap;
-                        overflow: hidden;
-                    ">
-                        <span id="context-text" style="
-                            overflow: hidden;
-                            text-overflow: ellipsis;
-                            line-height: 1.2;
-                        ">Select text +</span>
-                        <button id="context-clear" style="
-                            display: none;
-                            background: transparent;
-                            border: none;
-                            color: inherit;
-                            cursor: pointer;
-                            font-size: 10px;
-                            padding: 0;
-                            width: 10px;
-                            height: 10px;
-                            flex-shrink: 0;
-                            line-height: 1;
-                            opacity: 0.7;
-                        ">✕</button>
+                <div class="footer-row">
+                    <div id="context-pill">
+                        <span id="context-text">Select text +</span>
+                        <button id="context-clear">✕</button>
                     </div>
-                    <button id="submit-btn" style="
-                        background: #3b82f6;
-                        border: none;
-                        color: #ffffff;
-                        padding: 0;
-                        cursor: pointer;
-                        border-radius: 50%;
-                        font-size: 13px;
-                        font-weight: 600;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        transition: all 0.15s ease;
-                        width: 19px;
-                        height: 19px;
-                        flex-shrink: 0;
-                        margin: 0;
-                    "><svg width="10" height="11" viewBox="0 0 10 11" fill="none" xmlns="http://www.w3.org/2000/svg"><path d="M5 1.5V9.5M5 1.5L2 4.5M5 1.5L8 4.5" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/></svg></button>
+                    <button id="submit-btn"><svg width="10" height="11" viewBox="0 0 10 11" fill="none" xmlns="http://www.w3.org/2000/svg"><path d="M5 1.5V9.5M5 1.5L2 4.5M5 1.5L8 4.5" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/></svg></button>
                 </div>
             </div>
         `;
@@ -454,28 +498,14 @@ HIGHLIGHT_BUBBLE_JS = """
         // Update context pill based on contextText
         function updateContextPill() {
             if (contextText) {
-                // State B: Active (Selection)
+                // State B: Active (Selection) - glow effect comes from the .active class
                 const truncated = contextText.length > 9 ? contextText.substring(0, 9) + '...' : contextText;
                 contextTextSpan.textContent = '"' + truncated + '"';
-                contextClearBtn.style.display = 'block';
-
-                // Style changes with glow effect to show selection
-                contextPill.style.borderStyle = 'solid';
-                contextPill.style.borderColor = 'rgba(59, 130, 246, 0.6)';
-                contextPill.style.color = '#e5e7eb';
-                contextPill.style.background = 'rgba(59, 130, 246, 0.1)';
-                contextPill.style.boxShadow = '0 0 8px rgba(59, 130, 246, 0.4)';
+                contextPill.classList.add('active');
             } else {
                 // State A: Empty (Default)
                 contextTextSpan.textContent = 'Select text +';
-                contextClearBtn.style.display = 'none';
-
-                // Reset styles
-                contextPill.style.borderStyle = 'dashed';
-                contextPill.style.borderColor = 'rgba(255, 255, 255, 0.2)';
-                contextPill.style.color = '#9ca3af';
-                contextPill.style.background = 'rgba(255, 255, 255, 0.05)';
-                contextPill.style.boxShadow = 'none';
+                contextPill.classList.remove('active');
             }
         }
 
@@ -507,46 +537,19 @@ HIGHLIGHT_BUBBLE_JS = """
             }
         });
 
-        // Hover effect for submit button
-        submitBtn.addEventListener('mouseenter', () => {
-            submitBtn.style.backgroundColor = '#2563eb';
-        });
-        submitBtn.addEventListener('mouseleave', () => {
-            submitBtn.style.backgroundColor = '#3b82f6';
-        });
-
-        // Hover effect for close button
-        closeBtn.addEventListener('mouseenter', () => {
-            closeBtn.style.color = '#ffffff';
-        });
-        closeBtn.addEventListener('mouseleave', () => {
-            closeBtn.style.color = '#9ca3af';
-        });
-
         // Close button handler
         closeBtn.addEventListener('click', (e) => {
             e.stopPropagation();
             hideBubble();
         });
-        closeBtn.addEventListener('mouseup', (e) => {
-            e.stopPropagation();
-        });
-        closeBtn.addEventListener('mousedown', (e) => {
-            e.stopPropagation();
-        });
+        stopMouseBubbling(closeBtn);
 
         // Click handler for submit button
         submitBtn.addEventListener('click', (e) => {
             e.stopPropagation();
             handleSubmitQuestion();
         });
-        // Prevent mouseup/mousedown from bubbling to document level
-        submitBtn.addEventListener('mouseup', (e) => {
-            e.stopPropagation();
-        });
-        submitBtn.addEventListener('mousedown', (e) => {
-            e.stopPropagation();
-        });
+        stopMouseBubbling(submitBtn);
 
         // Context pill click handler (State A: show hint)
         contextPill.addEventListener('click', (e) => {
@@ -568,29 +571,12 @@ HIGHLIGHT_BUBBLE_JS = """
             e.stopPropagation();
             clearContext();
         });
-        contextClearBtn.addEventListener('mouseup', (e) => {
-            e.stopPropagation();
-        });
-        contextClearBtn.addEventListener('mousedown', (e) => {
-            e.stopPropagation();
-        });
-
-        // Listen for text selection while bubble is open
-        const selectionHandler = () => {
-            const selection = window.getSelection();
-            const text = selection.toString().trim();
-            if (text && text.length > 0 && currentState === 'input') {
-                contextText = text;
-                updateContextPill();
-            }
-        };
-        document.addEventListener('mouseup', selectionHandler);
+        stopMouseBubbling(contextClearBtn);
 
-        // Clean up listener when bubble is hidden
-        const originalHideBubble = hideBubble;
-        window.hideBubbleWithCleanup = function() {
-            document.removeEventListener('mouseup', selectionHandler);
-            originalHideBubble();
+        // Text selected while the bubble is open becomes the context
+        inputSelectionListener = (text) => {
+            contextText = text;
+            updateContextPill();
         };
     }
 
@@ -619,47 +605,83 @@ HIGHLIGHT_BUBBLE_JS = """
         }
     }
 
-    // Position the bubble above or below the selection
-    function positionBubble(rect) {
-        const bubbleHeight = bubble.offsetHeight;
-        const bubbleWidth = bubble.offsetWidth;
-        const padding = 20; // Vertical padding between selection and bubble
+    // Layout state. Everything the write phase needs is cached here so
+    // positioning and dragging never read layout after writing styles.
+    let bubbleX = 0;           // Document position of the bubble
+    let bubbleY = 0;
+    let bubbleWidth = 0;       // Last border-box size from the ResizeObserver
+    let bubbleHeight = 0;
+    let anchor = null;         // Selection rect (plus scroll/viewport snapshot) the bubble is placed against
+
+    // Frame pipeline state
+    let frameRequested = false;
+    let selectionDirty = false;
+    let clickedOutsideBubble = false;  // Set by a mouseup outside the bubble
+    let pendingRender = null;       // 'input' when a shortcut opened the input state
+    let dragTarget = null;          // Latest drag position, applied once per frame
+    let pointerSelecting = false;
+    let inputSelectionListener = null;
+
+    // Snapshot a viewport rect in document coordinates. Read phase only.
+    function anchorFromRect(rect) {
+        return {
+            left: rect.left,
+            right: rect.right,
+            top: rect.top,
+            bottom: rect.bottom,
+            scrollX: window.scrollX,
+            scrollY: window.scrollY,
+            viewportWidth: window.innerWidth,
+            viewportHeight: window.innerHeight
+        };
+    }
 
-        // Position horizontally based on the end (right edge) of the selection
-        // Align bubble's right edge near the selection's right edge
-        let left = rect.right - bubbleWidth;
+    // Move the bubble to document coordinates. The host is absolutely
+    // positioned at 0,0 and moved with a transform, so no layout is needed.
+    function moveBubbleTo(x, y) {
+        bubbleX = x;
+        bubbleY = y;
+        host.style.setProperty('transform', 'translate(' + x + 'px, ' + y + 'px)', 'important');
+    }
 
-        // Keep bubble within viewport horizontal bounds with some margin
+    // Position the bubble below (or above) the anchor. Write phase only -
+    // uses the cached bubble size.
+    function applyAnchor() {
+        if (!anchor) return;
+        const padding = 20; // Vertical padding between selection and bubble
         const margin = 10;
+
+        // Align bubble's right edge near the selection's right edge,
+        // keeping it within the viewport
+        let left = anchor.right - bubbleWidth;
         if (left < margin) {
             left = margin;
         }
-        if (left + bubbleWidth > window.innerWidth - margin) {
-            left = window.innerWidth - bubbleWidth - margin;
+        if (left + bubbleWidth > anchor.viewportWidth - margin) {
+            left = anchor.viewportWidth - bubbleWidth - margin;
         }
 
-        // Default: Position below the selection
-        let top = rect.bottom + padding;
-
-        // Check: Would it go off the bottom of the screen?
-        if (top + bubbleHeight > window.innerHeight) {
-            // Flip: Position above the selection instead
-            top = rect.top - bubbleHeight - padding;
+        // Default: below the selection; flip above if it would go off screen
+        let top = anchor.bottom + padding;
+        if (top + bubbleHeight > anchor.viewportHeight) {
+            top = anchor.top - bubbleHeight - padding;
         }
 
-        bubble.style.left = left + window.scrollX + 'px';
-        bubble.style.top = top + window.scrollY + 'px';
+        moveBubbleTo(left + anchor.scrollX, top + anchor.scrollY);
+    }
+
+    function placeBubble(newAnchor) {
+        anchor = newAnchor;
+        applyAnchor();
     }
 
-    // Show the bubble
-    function showBubble(rect, text) {
+    // Show the bubble in its default state. Write phase only.
+    function showBubble(newAnchor, text) {
         selectedText = text;
         renderDefaultState();
-        bubble.style.display = 'block';
+        setBubbleVisible(true);
+        placeBubble(newAnchor);
 
-        // Position after render so we have accurate dimensions
-        setTimeout(() => positionBubble(rect), 0);
-        
         // Notify tutorial that text was highlighted (Quick Action bar is showing)
         try {
             pycmd('openevidence:tutorial_event:text_highlighted');
@@ -668,96 +690,155 @@ HIGHLIGHT_BUBBLE_JS = """
         }
     }
 
+    // Open the input state at an anchor on the next frame
+    function openInputAt(newAnchor) {
+        anchor = newAnchor;
+        pendingRender = 'input';
+        requestFrame();
+    }
+
     // Hide the bubble
     function hideBubble() {
-        bubble.style.display = 'none';
+        setBubbleVisible(false);
         currentState = 'default';
         contextText = ''; // Clear context when bubble is hidden
+        inputSelectionListener = null;
+        anchor = null;
+        pendingRender = null;
     }
 
-    // Drag functionality
-    let isDragging = false;
-    let dragOffsetX = 0;
-    let dragOffsetY = 0;
-
-    function startDrag(e) {
-        // Don't start drag on buttons, inputs, or textareas
-        if (e.target.tagName === 'BUTTON' || e.target.tagName === 'INPUT' || e.target.tagName === 'TEXTAREA') {
+    // Show a short delivery status from Python (see pending_actions.py) in
+    // the bubble at the top right of the card. A bubble the user is
+    // working with is left alone.
+    let statusTimer = null;
+    function showStatus(message, kind) {
+        if (isBubbleVisible() && currentState !== 'status') {
             return;
         }
-
-        isDragging = true;
-        const rect = bubble.getBoundingClientRect();
-        dragOffsetX = e.clientX - rect.left;
-        dragOffsetY = e.clientY - rect.top;
-        bubble.style.cursor = 'grabbing';
-        e.preventDefault();
+        currentState = 'status';
+        const status = document.createElement('div');
+        status.className = 'status ' + (kind || '');
+        status.textContent = message;
+        bubble.replaceChildren(status);
+        setBubbleVisible(true);
+        placeBubble(anchorFromRect({
+            left: window.innerWidth,
+            right: window.innerWidth,
+            top: -10,
+            bottom: -10
+        }));
+
+        clearTimeout(statusTimer);
+        statusTimer = setTimeout(() => {
+            if (currentState === 'status') {
+                hideBubble();
+            }
+        }, kind === 'queued' ? 4000 : 2000);
     }
 
-    function drag(e) {
-        if (!isDragging) return;
+    // Read the current selection. Rects are only measured when the bubble
+    // will actually be shown for it.
+    function readSelection() {
+        const selection = window.getSelection();
+        const text = selection.toString().trim();
+        if (!text || !cmdKeyHeld || selection.rangeCount === 0) {
+            return { text: text, anchor: null };
+        }
 
-        const newLeft = e.clientX - dragOffsetX;
-        const newTop = e.clientY - dragOffsetY;
+        // One getClientRects() call gives both the full selection bounds and
+        // the rect of the last line, where the selection ends
+        const rects = selection.getRangeAt(0).getClientRects();
+        if (rects.length === 0) {
+            return { text: text, anchor: null };
+        }
+        let left = Infinity, top = Infinity, right = -Infinity, bottom = -Infinity;
+        for (let i = 0; i < rects.length; i++) {
+            const r = rects[i];
+            if (r.left < left) left = r.left;
+            if (r.top < top) top = r.top;
+            if (r.right > right) right = r.right;
+            if (r.bottom > bottom) bottom = r.bottom;
+        }
+        const endRect = rects[rects.length - 1];
+        return {
+            text: text,
+            anchor: anchorFromRect({
+                left: left,
+                right: endRect.right || right,
+                top: top,
+                bottom: bottom
+            })
+        };
+    }
 
-        bubble.style.left = newLeft + 'px';
-        bubble.style.top = newTop + 'px';
+    // Act on a selection read this frame. Write phase only.
+    function applySelection(info, clickedOutside) {
+        if (info.anchor) {
+            // Only show bubble if Command/Meta key is held AND text is selected
+            showBubble(info.anchor, info.text);
+        } else if (info.text && currentState === 'input' && inputSelectionListener) {
+            inputSelectionListener(info.text);
+        } else if (clickedOutside && currentState === 'default') {
+            // Hide bubble if in default state and clicking outside
+            hideBubble();
+        }
     }
 
-    function stopDrag() {
-        if (isDragging) {
-            isDragging = false;
-            bubble.style.cursor = 'default';
+    function requestFrame() {
+        if (!frameRequested) {
+            frameRequested = true;
+            requestAnimationFrame(runFrame);
         }
     }
 
-    // Add drag event listeners to the bubble
-    document.addEventListener('mousedown', (e) => {
-        if (bubble.contains(e.target) && bubble.style.display !== 'none') {
-            startDrag(e);
+    // One pass per frame: all layout reads first, then all style writes
+    function runFrame() {
+        frameRequested = false;
+
+        // Read phase
+        let selectionInfo = null;
+        const clickedOutside = clickedOutsideBubble;
+        if (selectionDirty) {
+            selectionInfo = readSelection();
         }
-    });
+        selectionDirty = false;
+        clickedOutsideBubble = false;
 
-    document.addEventListener('mousemove', drag);
-    document.addEventListener('mouseup', stopDrag);
+        // Write phase
+        if (selectionInfo) {
+            applySelection(selectionInfo, clickedOutside);
+        }
+        if (pendingRender === 'input') {
+            pendingRender = null;
+            renderInputState();
+            setBubbleVisible(true);
+            applyAnchor();
+        }
+        if (dragTarget) {
+            moveBubbleTo(dragTarget.x, dragTarget.y);
+            dragTarget = null;
+        }
+    }
+
+    // Selection changes: mouse selections are read once the button is
+    // released, keyboard selections (Shift+arrows) as they change
+    document.addEventListener('mousedown', () => {
+        pointerSelecting = true;
+    });
 
-    // Handle mouseup event
     document.addEventListener('mouseup', (e) => {
-        // Small delay to allow selection to complete
-        setTimeout(() => {
-            const selection = window.getSelection();
-            const text = selection.toString().trim();
+        pointerSelecting = false;
+        selectionDirty = true;
+        if (!isFromBubble(e)) {
+            clickedOutsideBubble = true;
+        }
+        requestFrame();
+    });
 
-            // Only show bubble if Command/Meta key is held AND text is selected
-            if (text && text.length > 0 && cmdKeyHeld) {
-                // Get selection range
-                const range = selection.getRangeAt(0);
-
-                // For multi-line selections, get the END position specifically
-                const endRange = document.createRange();
-                endRange.setStart(range.endContainer, range.endOffset);
-                endRange.setEnd(range.endContainer, range.endOffset);
-                const endRect = endRange.getBoundingClientRect();
-
-                // Use the full selection rect but with the end position for horizontal alignment
-                const rect = range.getBoundingClientRect();
-                const combinedRect = {
-                    left: rect.left,
-                    right: endRect.right || rect.right,
-                    top: rect.top,
-                    bottom: rect.bottom,
-                    width: rect.width,
-                    height: rect.height
-                };
-
-                showBubble(combinedRect, text);
-            } else {
-                // No text selected - hide bubble if in default state and clicking outside
-                if (currentState === 'default' && !bubble.contains(e.target)) {
-                    hideBubble();
-                }
-            }
-        }, 10);
+    document.addEventListener('selectionchange', () => {
+        if (pointerSelecting) return;
+        selectionDirty = true;
+        requestFrame();
     });
 
     // Note: Bubble no longer auto-hides when clicking outside
@@ -765,6 +846,63 @@ HIGHLIGHT_BUBBLE_JS = """
 
     // Create the bubble on load
     bubble = createBubble();
+
+    // The bubble's size is reported after layout, so positioning never has
+    // to measure it. Re-anchor when the size changes (new state, textarea growth).
+    new ResizeObserver((entries) => {
+        const entry = entries[entries.length - 1];
+        const box = entry.borderBoxSize && entry.borderBoxSize[0];
+        bubbleWidth = box ? box.inlineSize : entry.contentRect.width;
+        bubbleHeight = box ? box.blockSize : entry.contentRect.height;
+        applyAnchor();
+    }).observe(bubble);
+
+    // Drag functionality. Pointer capture keeps move/up events on the bubble
+    // even when the pointer leaves it; moves are applied once per frame.
+    let isDragging = false;
+    let dragOffsetX = 0;
+    let dragOffsetY = 0;
+
+    bubble.addEventListener('pointerdown', (e) => {
+        // Don't start drag on buttons, inputs, or textareas
+        if (!isBubbleVisible() || e.button !== 0 || e.target.closest('button, input, textarea')) {
+            return;
+        }
+
+        isDragging = true;
+        anchor = null;  // The user's position wins over the selection anchor
+        dragOffsetX = e.pageX - bubbleX;
+        dragOffsetY = e.pageY - bubbleY;
+        bubble.setPointerCapture(e.pointerId);
+        bubble.classList.add('dragging');
+        e.preventDefault();
+    });
+
+    bubble.addEventListener('pointermove', (e) => {
+        if (!isDragging) return;
+        dragTarget = { x: e.pageX - dragOffsetX, y: e.pageY - dragOffsetY };
+        requestFrame();
+    });
+
+    function stopDrag() {
+        if (isDragging) {
+            isDragging = false;
+            bubble.classList.remove('dragging');
+        }
+    }
+    bubble.addEventListener('pointerup', stopDrag);
+    bubble.addEventListener('lostpointercapture', stopDrag);
+
+    // Small API for Python (the shadow root is closed, so the DOM can't be queried)
+    window.ankiHighlightBubble = {
+        refreshShortcuts: refreshShortcutLabels,
+        isVisible: isBubbleVisible,
+        show: function(rect, text) {
+            showBubble(anchorFromRect(rect), text);
+        },
+        hide: hideBubble,
+        showStatus: showStatus
+    };
     console.log('Anki: Highlight bubble ready');
 })();
 """
@@ -831,13 +969,22 @@ def inject_highlight_bubble(html, card, context):
         </script>
         """
 
-        # Add the config and JavaScript to the card HTML
+        # Add the config, the shared chord matcher and the bubble JavaScript to the card HTML
         html += config_js
+        html += f"<script>{chord_matcher_script(config.get('debug_logging', False))}</script>"
         html += f"<script>{HIGHLIGHT_BUBBLE_JS}</script>"
 
     return html
 
 
+def timed_inject_highlight_bubble(html, card, context):
+    """inject_highlight_bubble, timed as the start of a reviewer card flip"""
+    if context not in REVIEW_CONTEXTS:
+        return inject_highlight_bubble(html, card, context)
+    with budget.measure("inject_highlight_bubble", starts_flip=True):
+        return inject_highlight_bubble(html, card, context)
+
+
 def setup_highlight_hooks():
     """Register the highlight bubble injection hook"""
-    gui_hooks.card_will_show.append(inject_highlight_bubble)
+    gui_hooks.card_will_show.append(timed_inject_highlight_bubble)
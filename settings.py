@@ -3,19 +3,33 @@ Settings UI for the OpenEvidence add-on.
 Contains the drill-down settings interface with list and editor views.
 
 This module re-exports all settings components from their individual modules
-for backward compatibility.
+for backward compatibility. The modules are imported on first attribute
+access, so importing this module doesn't load the settings UI.
 """
 
-# Import all settings components from their individual modules
-from .settings_utils import ElidedLabel
-from .settings_home import SettingsHomeView
-from .settings_editor import SettingsEditorView
-from .settings_list import SettingsListView
+import importlib
+
+# Component name -> module that defines it
+_COMPONENTS = {
+    'ElidedLabel': '.settings_utils',
+    'SettingsHomeView': '.settings_home',
+    'SettingsEditorView': '.settings_editor',
+    'SettingsListView': '.settings_list',
+}
 
 # Export all components for backward compatibility
-__all__ = [
-    'ElidedLabel',
-    'SettingsHomeView',
-    'SettingsEditorView',
-    'SettingsListView',
-]
+__all__ = list(_COMPONENTS)
+
+
+def __getattr__(name):
+    """Import a settings component's module the first time it's used"""
+    module_name = _COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
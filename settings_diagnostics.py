@@ -0,0 +1,116 @@
+"""
+Settings Diagnostics View - Runtime health of the add-on (latency, modes, counters).
+"""
+
+try:
+    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QCursor
+except ImportError:
+    from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QCursor
+
+from .diagnostics import collect
+
+
+class DiagnosticsSettingsView(QWidget):
+    """Read-only view of the sections registered in diagnostics.py"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_panel = parent
+        self.setup_ui()
+
+    def setup_ui(self):
+        # Main layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        # Scrollable content area
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setObjectName("settingsScroll")
+
+        content = QWidget()
+        content.setObjectName("settingsContent")
+        content_layout = QVBoxLayout(content)
+        content_layout.setContentsMargins(16, 16, 16, 16)
+        content_layout.setSpacing(16)
+
+        # Header
+        header = QLabel("Diagnostics")
+        header.setObjectName("viewTitle")
+        content_layout.addWidget(header)
+
+        # Sections are rebuilt on refresh
+        self.sections_container = QWidget()
+        self.sections_layout = QVBoxLayout(self.sections_container)
+        self.sections_layout.setContentsMargins(0, 0, 0, 0)
+        self.sections_layout.setSpacing(16)
+        content_layout.addWidget(self.sections_container)
+
+        content_layout.addStretch()
+
+        scroll.setWidget(content)
+        layout.addWidget(scroll)
+
+        # Bottom section with Refresh button
+        bottom_section = QWidget()
+        bottom_section.setObjectName("settingsFooter")
+        bottom_layout = QVBoxLayout(bottom_section)
+        bottom_layout.setContentsMargins(16, 12, 16, 12)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        refresh_btn.setObjectName("secondaryButton")
+        refresh_btn.setFixedHeight(44)
+        refresh_btn.clicked.connect(self.refresh)
+        bottom_layout.addWidget(refresh_btn)
+
+        layout.addWidget(bottom_section)
+
+        self.refresh()
+
+    def refresh(self):
+        """Re-collect all diagnostics sections"""
+        while self.sections_layout.count():
+            item = self.sections_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+        for title, rows in collect():
+            self.sections_layout.addWidget(self._create_section(title, rows))
+
+    def _create_section(self, title, rows):
+        """Create a titled block of label/value rows"""
+        section = QWidget()
+        section_layout = QVBoxLayout(section)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        section_layout.setSpacing(6)
+
+        title_label = QLabel(title)
+        title_label.setObjectName("sectionLabel")
+        section_layout.addWidget(title_label)
+
+        for label, value in rows:
+            row = QWidget()
+            row_layout = QHBoxLayout(row)
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            row_layout.setSpacing(12)
+
+            name_label = QLabel(label)
+            name_label.setObjectName("diagnosticName")
+            name_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+            row_layout.addWidget(name_label)
+
+            value_label = QLabel(str(value))
+            value_label.setObjectName("diagnosticValue")
+            value_label.setWordWrap(True)
+            value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
+            value_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            row_layout.addWidget(value_label, 1)
+
+            section_layout.addWidget(row)
+
+        return section
@@ -16,7 +16,9 @@ except ImportError:
     from PyQt5.QtGui import QCursor
 
 from .settings_utils import ElidedLabel
+from .theme import set_state
 from .key_recorder import KeyRecorderMixin
+from .key_matcher import canonical_chord
 
 
 class SettingsEditorView(KeyRecorderMixin, QWidget):
@@ -46,21 +48,22 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         # Scrollable content area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { background: #1e1e1e; border: none; }")
+        scroll.setObjectName("settingsScroll")
 
         content = QWidget()
-        content.setStyleSheet("background: #1e1e1e;")
+        content.setObjectName("settingsContent")
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(16, 16, 16, 16)
         content_layout.setSpacing(20)
 
         # Section 1: Key Recorder
         key_label = QLabel("Shortcut Key")
-        key_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold;")
+        key_label.setObjectName("sectionLabel")
         content_layout.addWidget(key_label)
 
         self.key_display = QPushButton()
         self.key_display.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.key_display.setObjectName("keyDisplay")
         self.key_display.setFixedHeight(60)
         self._update_key_display()
         self.key_display.clicked.connect(self.start_recording)
@@ -69,34 +72,14 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         # Section 2: Front Side Template
         # Row 1: Header (Label only)
         q_label = QLabel("Front Side Template")
-        q_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold; margin-top: 12px;")
+        q_label.setObjectName("sectionLabel")
+        q_label.setProperty("spaced", True)
         content_layout.addWidget(q_label)
 
         # Row 2: Input
         self.question_template = QTextEdit()
         self.question_template.setPlainText(self.keybinding.get("question_template", ""))
-        self.question_template.setStyleSheet("""
-            QTextEdit {
-                background-color: #2c2c2c;
-                border: 1px solid #374151;
-                border-radius: 6px;
-                padding: 8px;
-                color: white;
-                font-size: 13px;
-                font-family: Menlo, Monaco, 'Courier New', monospace;
-            }
-            QScrollBar:vertical {
-                width: 8px;
-                background: transparent;
-            }
-            QScrollBar::handle:vertical {
-                background: #4b5563;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.question_template.setObjectName("templateEdit")
         self.question_template.setMinimumHeight(100)
         content_layout.addWidget(self.question_template)
 
@@ -106,27 +89,14 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         q_footer_layout.setContentsMargins(0, 4, 0, 0)
 
         q_help = ElidedLabel("Only {front} is available.")
-        q_help.setStyleSheet("color: #6b7280; font-size: 11px;")
+        q_help.setObjectName("helpText")
         q_footer_layout.addWidget(q_help, 1)  # Stretch factor 1 to absorb flexible space
 
         q_front_chip = QPushButton("+ {front}")
         q_front_chip.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         q_front_chip.setFixedHeight(24)
         q_front_chip.setMinimumWidth(75)
-        q_front_chip.setStyleSheet("""
-            QPushButton {
-                background: #374151;
-                color: #ffffff;
-                border: none;
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #4b5563;
-            }
-        """)
+        q_front_chip.setObjectName("variableChip")
         q_front_chip.clicked.connect(lambda: self.insert_variable(self.question_template, "{front}"))
         q_footer_layout.addWidget(q_front_chip)
 
@@ -135,34 +105,14 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         # Section 3: Back Side Template
         # Row 1: Header (Label only)
         a_label = QLabel("Back Side Template")
-        a_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold; margin-top: 12px;")
+        a_label.setObjectName("sectionLabel")
+        a_label.setProperty("spaced", True)
         content_layout.addWidget(a_label)
 
         # Row 2: Input
         self.answer_template = QTextEdit()
         self.answer_template.setPlainText(self.keybinding.get("answer_template", ""))
-        self.answer_template.setStyleSheet("""
-            QTextEdit {
-                background-color: #2c2c2c;
-                border: 1px solid #374151;
-                border-radius: 6px;
-                padding: 8px;
-                color: white;
-                font-size: 13px;
-                font-family: Menlo, Monaco, 'Courier New', monospace;
-            }
-            QScrollBar:vertical {
-                width: 8px;
-                background: transparent;
-            }
-            QScrollBar::handle:vertical {
-                background: #4b5563;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.answer_template.setObjectName("templateEdit")
         self.answer_template.setMinimumHeight(100)
         content_layout.addWidget(self.answer_template)
 
@@ -172,27 +122,14 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         a_footer_layout.setContentsMargins(0, 4, 0, 0)
 
         a_help = ElidedLabel("Both {front} and {back} are available.")
-        a_help.setStyleSheet("color: #6b7280; font-size: 11px;")
+        a_help.setObjectName("helpText")
         a_footer_layout.addWidget(a_help, 1)  # Stretch factor 1 to absorb flexible space
 
         a_front_chip = QPushButton("+ {front}")
         a_front_chip.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         a_front_chip.setFixedHeight(24)
         a_front_chip.setMinimumWidth(75)
-        a_front_chip.setStyleSheet("""
-            QPushButton {
-                background: #374151;
-                color: #ffffff;
-                border: none;
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #4b5563;
-            }
-        """)
+        a_front_chip.setObjectName("variableChip")
         a_front_chip.clicked.connect(lambda: self.insert_variable(self.answer_template, "{front}"))
         a_footer_layout.addWidget(a_front_chip)
 
@@ -200,20 +137,7 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         a_back_chip.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         a_back_chip.setFixedHeight(24)
         a_back_chip.setMinimumWidth(75)
-        a_back_chip.setStyleSheet("""
-            QPushButton {
-                background: #374151;
-                color: #ffffff;
-                border: none;
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #4b5563;
-            }
-        """)
+        a_back_chip.setObjectName("variableChip")
         a_back_chip.clicked.connect(lambda: self.insert_variable(self.answer_template, "{back}"))
         a_footer_layout.addWidget(a_back_chip)
 
@@ -226,16 +150,17 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
 
         # Bottom section with Save button
         bottom_section = QWidget()
-        bottom_section.setStyleSheet("background: #1e1e1e; border-top: 1px solid rgba(255, 255, 255, 0.06);")
+        bottom_section.setObjectName("settingsFooter")
         bottom_layout = QVBoxLayout(bottom_section)
         bottom_layout.setContentsMargins(16, 12, 16, 12)
 
         # Save button (disabled by default until changes are made)
+        # (the theme styles the disabled state, so toggling it needs no restyle)
         self.save_btn = QPushButton("Save")
+        self.save_btn.setObjectName("primaryButton")
         self.save_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.save_btn.setFixedHeight(44)
         self.save_btn.setEnabled(False)  # Disabled by default
-        self._update_save_button_style()
         self.save_btn.clicked.connect(self.save_and_go_back)
         bottom_layout.addWidget(self.save_btn)
 
@@ -252,34 +177,6 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         self.question_template.textChanged.connect(self._on_change)
         self.answer_template.textChanged.connect(self._on_change)
 
-    def _update_save_button_style(self):
-        """Update save button appearance based on enabled state"""
-        if self.save_btn.isEnabled():
-            self.save_btn.setStyleSheet("""
-                QPushButton {
-                    background: #3b82f6;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: #2563eb;
-                }
-            """)
-        else:
-            self.save_btn.setStyleSheet("""
-                QPushButton {
-                    background: #333333;
-                    color: #666666;
-                    border: 1px solid #444444;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-            """)
-
     def insert_variable(self, text_edit, variable):
         """Insert a variable at the current cursor position in a QTextEdit"""
         cursor = text_edit.textCursor()
@@ -302,7 +199,6 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
 
         # Enable/disable save button
         self.save_btn.setEnabled(has_changes)
-        self._update_save_button_style()
 
     def _update_key_display(self):
         """Update the key display button appearance"""
@@ -311,48 +207,17 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         keys = self.keybinding.get("keys", [])
         if self.recording_keys:
             text = "Press any key combination..."
-            style = """
-                QPushButton {
-                    background: #2c2c2c;
-                    color: #3b82f6;
-                    border: 2px solid #3b82f6;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 500;
-                }
-            """
+            state = "recording"
         elif keys:
             # Display keycaps
             text = format_keys_verbose(keys)
-            style = """
-                QPushButton {
-                    background: #2c2c2c;
-                    color: #ffffff;
-                    border: 1px solid #374151;
-                    border-radius: 8px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    border-color: #4b5563;
-                }
-            """
+            state = "set"
         else:
             text = "Click to set shortcut"
-            style = """
-                QPushButton {
-                    background: #2c2c2c;
-                    color: #9ca3af;
-                    border: 1px dashed #374151;
-                    border-radius: 8px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    border-color: #4b5563;
-                }
-            """
+            state = "empty"
 
         self.key_display.setText(text)
-        self.key_display.setStyleSheet(style)
+        set_state(self.key_display, "state", state)
 
     def start_recording(self):
         """Start recording key presses"""
@@ -401,16 +266,15 @@ class SettingsEditorView(KeyRecorderMixin, QWidget):
         # Check for duplicate keybindings
         config = mw.addonManager.getConfig(__name__) or {}
         keybindings = config.get("keybindings", [])
-        current_keys = self.keybinding.get("keys", [])
+        current_chord = canonical_chord(self.keybinding.get("keys", []))
 
         for i, kb in enumerate(keybindings):
             # Skip the current keybinding if we're editing
             if self.index is not None and i == self.index:
                 continue
 
-            # Check if keys match
-            existing_keys = kb.get("keys", [])
-            if existing_keys == current_keys:
+            # Check if keys match (in any order - the matcher ignores order)
+            if canonical_chord(kb.get("keys", [])) == current_chord:
                 tooltip("This key combination is already in use by another shortcut")
                 return
 
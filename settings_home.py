@@ -6,15 +6,15 @@ import webbrowser
 
 try:
     from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QFrame
-    from PyQt6.QtCore import Qt, QByteArray, QSize
-    from PyQt6.QtGui import QPixmap, QPainter, QCursor
-    from PyQt6.QtSvg import QSvgRenderer
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QCursor
 except ImportError:
     from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QFrame
-    from PyQt5.QtCore import Qt, QByteArray, QSize
-    from PyQt5.QtGui import QPixmap, QPainter, QCursor
-    from PyQt5.QtSvg import QSvgRenderer
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QCursor
 
+from .icon_cache import svg_pixmap
+from .tutorial_dispatch import tutorial_event
 
 
 class SettingsHomeView(QWidget):
@@ -33,22 +33,17 @@ class SettingsHomeView(QWidget):
         # Scrollable content area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { background: #1e1e1e; border: none; }")
+        scroll.setObjectName("settingsScroll")
 
         content = QWidget()
-        content.setStyleSheet("background: #1e1e1e;")
+        content.setObjectName("settingsContent")
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(24, 24, 24, 24)
         content_layout.setSpacing(24)
 
         # Header
         header = QLabel("Settings")
-        header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 24px;
-            font-weight: 700;
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-        """)
+        header.setObjectName("settingsTitle")
         content_layout.addWidget(header)
 
         # Navigation Cards Container
@@ -79,12 +74,21 @@ class SettingsHomeView(QWidget):
         )
         cards_layout.addWidget(quick_actions_card)
 
+        # Card 3: Diagnostics
+        diagnostics_card = self.create_nav_card(
+            title="Diagnostics",
+            icon_svg="""<svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
+                <path d="M4 24h9l5-12 8 24 5-12h13" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>""",
+            on_click=self.open_diagnostics
+        )
+        cards_layout.addWidget(diagnostics_card)
+
         content_layout.addWidget(cards_container)
         content_layout.addStretch()
 
         # Footer section - centered at bottom
         footer_container = QWidget()
-        footer_container.setStyleSheet("background: transparent;")
         footer_layout = QHBoxLayout(footer_container)
         footer_layout.setContentsMargins(0, 24, 0, 15)
         footer_layout.setSpacing(0)
@@ -109,7 +113,7 @@ class SettingsHomeView(QWidget):
 
         separator = QLabel()
         separator.setFixedSize(1, 12)
-        separator.setStyleSheet("background: #3f3f46;")
+        separator.setObjectName("footerSeparator")
         separator_layout.addWidget(separator)
 
         footer_layout.addWidget(separator_container)
@@ -156,19 +160,9 @@ class SettingsHomeView(QWidget):
         # Icon
         icon_label = QLabel()
         icon_label.setFixedSize(32, 32)
-        icon_label.setStyleSheet("background: transparent; border: none;")
-
-        # Render SVG
-        svg_bytes = QByteArray(icon_svg.encode())
-        renderer = QSvgRenderer(svg_bytes)
-        pixmap = QPixmap(48, 48)
-        try:
-            pixmap.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
+
+        # Shared icon pixmap (rasterized once per size, see icon_cache)
+        pixmap = svg_pixmap(icon_svg, 32, widget=icon_label)
 
         icon_label.setPixmap(pixmap)
         icon_label.setScaledContents(True)
@@ -177,40 +171,18 @@ class SettingsHomeView(QWidget):
 
         # Title only (no description)
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            background: transparent;
-            border: none;
-        """)
+        title_label.setObjectName("navCardTitle")
         title_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         card_layout.addWidget(title_label, 1)
 
         # Arrow icon
         arrow_label = QLabel("→")
-        arrow_label.setStyleSheet("""
-            color: #6b7280;
-            font-size: 20px;
-            background: transparent;
-            border: none;
-        """)
+        arrow_label.setObjectName("navCardArrow")
         arrow_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         card_layout.addWidget(arrow_label)
 
-        # Card styling - match existing dark theme
-        card.setStyleSheet("""
-            QPushButton {
-                background: #2c2c2c;
-                border: 1px solid #374151;
-                border-radius: 12px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: #333333;
-                border-color: #3b82f6;
-            }
-        """)
+        # Card styling comes from the shared theme (see theme.py)
+        card.setObjectName("navCard")
 
         return card
 
@@ -220,16 +192,8 @@ class SettingsHomeView(QWidget):
         container = QFrame()
         container.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
-        # Set styling to mimic a hoverable button
-        container.setStyleSheet("""
-            QFrame {
-                background: transparent;
-                border-radius: 6px;
-            }
-            QFrame:hover {
-                background: rgba(255, 255, 255, 0.05);
-            }
-        """)
+        # Styled like a hoverable button by the shared theme
+        container.setObjectName("footerLink")
 
         # Layout for the container
         layout = QHBoxLayout(container)
@@ -239,29 +203,17 @@ class SettingsHomeView(QWidget):
         # Render SVG Icon at high resolution for crisp display
         icon_label = QLabel()
         icon_label.setFixedSize(14, 14)
-        icon_label.setStyleSheet("background: transparent; border: none;")
-
-        # Render at 4x resolution (56x56) for better quality when scaled down
-        svg_bytes = QByteArray(icon_svg.encode())
-        renderer = QSvgRenderer(svg_bytes)
-        pixmap = QPixmap(56, 56)  # High resolution
-        try:
-            pixmap.fill(Qt.GlobalColor.transparent)
-        except AttributeError:
-            pixmap.fill(Qt.transparent)  # PyQt5 fallback
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        # Scale down smoothly to 14x14
+
+        # Shared icon pixmap at the label's size and pixel ratio
+        pixmap = svg_pixmap(icon_svg, 14, widget=icon_label)
+
         icon_label.setPixmap(pixmap)
         icon_label.setScaledContents(True)  # Enable smooth scaling
         layout.addWidget(icon_label)
 
         # Text Label
         text_label = QLabel(text)
-        text_label.setStyleSheet("background: transparent; border: none; color: #a1a1aa; font-size: 12px;")
+        text_label.setObjectName("footerLinkText")
         layout.addWidget(text_label)
 
         # Make the QFrame clickable by overriding mouseReleaseEvent
@@ -284,22 +236,19 @@ class SettingsHomeView(QWidget):
         if self.parent_panel and hasattr(self.parent_panel, 'show_templates_view'):
             self.parent_panel.show_templates_view()
             # Notify tutorial
-            try:
-                from .tutorial import tutorial_event
-                tutorial_event("templates_opened")
-            except:
-                pass
+            tutorial_event("templates_opened")
 
     def open_quick_actions(self):
         """Navigate to Quick Actions view"""
         if self.parent_panel and hasattr(self.parent_panel, 'show_quick_actions_view'):
             self.parent_panel.show_quick_actions_view()
             # Notify tutorial
-            try:
-                from .tutorial import tutorial_event
-                tutorial_event("quick_actions_opened")
-            except:
-                pass
+            tutorial_event("quick_actions_opened")
+
+    def open_diagnostics(self):
+        """Navigate to Diagnostics view"""
+        if self.parent_panel and hasattr(self.parent_panel, 'show_diagnostics_view'):
+            self.parent_panel.show_diagnostics_view()
 
     def request_feature(self):
         """Open feature request URL"""
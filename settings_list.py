@@ -7,17 +7,341 @@ from aqt import mw
 from aqt.utils import tooltip
 
 try:
-    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
-    from PyQt6.QtCore import Qt, QTimer, QByteArray, QSize
-    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QCursor
-    from PyQt6.QtSvg import QSvgRenderer
+    from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QListView,
+                                 QStyledItemDelegate, QAbstractItemView)
+    from PyQt6.QtCore import Qt, QTimer, QSize, QRect, QRectF, QAbstractListModel, QModelIndex
+    from PyQt6.QtGui import QPainter, QCursor, QColor, QPen, QFont, QFontMetrics
 except ImportError:
-    from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
-    from PyQt5.QtCore import Qt, QTimer, QByteArray, QSize
-    from PyQt5.QtGui import QIcon, QPixmap, QPainter, QCursor
-    from PyQt5.QtSvg import QSvgRenderer
+    from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QListView,
+                                 QStyledItemDelegate, QAbstractItemView)
+    from PyQt5.QtCore import Qt, QTimer, QSize, QRect, QRectF, QAbstractListModel, QModelIndex
+    from PyQt5.QtGui import QPainter, QCursor, QColor, QPen, QFont, QFontMetrics
 
-from .settings_utils import ElidedLabel
+from .icon_cache import svg_pixmap
+from .tutorial_dispatch import tutorial_event
+
+
+EDIT_ICON_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
+    <path d="M38 10L32 4L12 24L10 34L20 32L40 12L38 10Z M32 4L38 10 M16 28L20 32" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
+</svg>
+"""
+
+DELETE_ICON_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
+    <path d="M16 10V6h16v4M8 10h32M12 10v28h24V10" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
+    <path d="M20 18v14M28 18v14" stroke="white" stroke-width="3" stroke-linecap="round"/>
+</svg>
+"""
+
+# Row geometry (a 56px card with 12px between cards)
+CARD_HEIGHT = 56
+CARD_SPACING = 12
+ROW_HEIGHT = CARD_HEIGHT + CARD_SPACING
+BUTTON_SIZE = 32
+CONFIRM_WIDTH = 70
+ICON_SIZE = 16
+MAX_ELIDED_CACHE = 4096
+
+# Custom item roles
+KEYS_ROLE = Qt.ItemDataRole.UserRole + 1
+CONFIRM_ROLE = Qt.ItemDataRole.UserRole + 2
+
+def format_key(key):
+    """Keycap label for a key name"""
+    if key == "Control/Meta":
+        return "⌘" if sys.platform == "darwin" else "Ctrl"
+    elif key == "Meta":
+        return "⌘"  # Cmd key on macOS
+    elif key == "Control":
+        return "⌃" if sys.platform == "darwin" else "Ctrl"  # Control key
+    elif key == "Shift":
+        return "⇧"
+    elif key == "Alt":
+        return "⌥"
+    return key
+
+
+def template_preview(kb):
+    """One-line preview; if the front template is empty, use the back template"""
+    template = kb.get("question_template", "")
+    if not template or not template.strip():
+        template = kb.get("answer_template", "")
+    return template.replace("\n", " ")
+
+
+class KeybindingListModel(QAbstractListModel):
+    """
+    Keybindings as a list model.
+
+    sync() diffs against the stored config and emits row inserts, removals
+    and data changes for what actually changed, so views never rebuild.
+    At most one row is in the delete "Confirm?" state.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.keybindings = []
+        self.confirm_row = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.keybindings)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.keybindings):
+            return None
+        kb = self.keybindings[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return template_preview(kb)
+        if role == KEYS_ROLE:
+            return [format_key(key) for key in kb.get("keys", [])]
+        if role == CONFIRM_ROLE:
+            return index.row() == self.confirm_row
+        return None
+
+    def sync(self, keybindings):
+        """Update to a new keybinding list with incremental change signals"""
+        old = self.keybindings
+        new = list(keybindings)
+        self.set_confirm_row(None)
+
+        # Common prefix and suffix are unchanged; only the middle differs
+        prefix = 0
+        while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < min(len(old), len(new)) - prefix
+               and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]):
+            suffix += 1
+        old_mid = len(old) - prefix - suffix
+        new_mid = len(new) - prefix - suffix
+
+        # Rows changed in place
+        changed = min(old_mid, new_mid)
+        if changed:
+            self.keybindings[prefix:prefix + changed] = new[prefix:prefix + changed]
+            self.dataChanged.emit(self.index(prefix), self.index(prefix + changed - 1))
+
+        start = prefix + changed
+        if old_mid > new_mid:
+            self.beginRemoveRows(QModelIndex(), start, start + old_mid - new_mid - 1)
+            del self.keybindings[start:start + old_mid - new_mid]
+            self.endRemoveRows()
+        elif new_mid > old_mid:
+            self.beginInsertRows(QModelIndex(), start, start + new_mid - old_mid - 1)
+            self.keybindings[start:start] = new[start:start + new_mid - old_mid]
+            self.endInsertRows()
+
+    def set_confirm_row(self, row):
+        """Put a row's delete button in the "Confirm?" state (None to clear)"""
+        previous = self.confirm_row
+        if previous == row:
+            return
+        self.confirm_row = row
+        for changed in (previous, row):
+            if changed is not None and changed < len(self.keybindings):
+                self.dataChanged.emit(self.index(changed), self.index(changed), [CONFIRM_ROLE])
+
+
+# Shared model, so the list view and editor round trips update it in place
+_model = None
+
+
+def keybinding_model():
+    global _model
+    if _model is None:
+        _model = KeybindingListModel()
+    return _model
+
+
+class KeybindingDelegate(QStyledItemDelegate):
+    """Paints a keybinding card (keycaps, preview, edit and delete buttons)"""
+    def __init__(self, list_view):
+        super().__init__(list_view)
+        self.list_view = list_view
+        self.hover = None  # (row, "edit" | "delete") under the mouse
+
+        self.keycap_font = QFont(list_view.font())
+        self.keycap_font.setPixelSize(12)
+        self.keycap_font.setWeight(QFont.Weight.Medium)
+        self.keycap_metrics = QFontMetrics(self.keycap_font)
+
+        self.preview_font = QFont(list_view.font())
+        self.preview_font.setPixelSize(12)
+        self.preview_metrics = QFontMetrics(self.preview_font)
+
+        self.confirm_font = QFont(list_view.font())
+        self.confirm_font.setPixelSize(11)
+        self.confirm_font.setWeight(QFont.Weight.DemiBold)
+
+        # Text measurements, so scrolling doesn't re-measure every row
+        self._keycap_widths = {}   # label -> keycap width
+        self._elided = {}          # (preview text, width) -> elided text
+
+    def keycap_width(self, label):
+        width = self._keycap_widths.get(label)
+        if width is None:
+            width = self._keycap_widths[label] = self.keycap_metrics.horizontalAdvance(label) + 18
+        return width
+
+    def elided_preview(self, text, width):
+        """Elided preview text, cached per available width"""
+        key = (text, width)
+        elided = self._elided.get(key)
+        if elided is None:
+            if len(self._elided) >= MAX_ELIDED_CACHE:
+                # Widths changed (e.g. panel resized) - old entries are stale
+                self._elided.clear()
+            elided = self._elided[key] = self.preview_metrics.elidedText(
+                text, Qt.TextElideMode.ElideRight, width)
+        return elided
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def _layout(self, rect, confirm):
+        """Card, button and content rects for a row"""
+        card = QRect(rect.left() + 16, rect.top() + CARD_SPACING // 2,
+                     rect.width() - 32, CARD_HEIGHT)
+        button_top = card.top() + (CARD_HEIGHT - BUTTON_SIZE) // 2
+        right = card.right() - 16
+        if confirm:
+            delete = QRect(right - CONFIRM_WIDTH + 1, button_top, CONFIRM_WIDTH, BUTTON_SIZE)
+            edit = None
+            content_right = delete.left() - 12
+        else:
+            delete = QRect(right - BUTTON_SIZE + 1, button_top, BUTTON_SIZE, BUTTON_SIZE)
+            edit = QRect(delete.left() - 12 - BUTTON_SIZE, button_top, BUTTON_SIZE, BUTTON_SIZE)
+            content_right = edit.left() - 12
+        content = QRect(card.left() + 16, card.top() + 8,
+                        content_right - card.left() - 16, CARD_HEIGHT - 16)
+        return card, content, edit, delete
+
+    def hit_test(self, rect, index, pos):
+        """Which button of a row (if any) is at pos"""
+        _, _, edit, delete = self._layout(rect, index.data(CONFIRM_ROLE))
+        if delete.contains(pos):
+            return "delete"
+        if edit is not None and edit.contains(pos):
+            return "edit"
+        return None
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        confirm = index.data(CONFIRM_ROLE)
+        card, content, edit, delete = self._layout(option.rect, confirm)
+        hovered = self.hover[1] if self.hover and self.hover[0] == index.row() else None
+
+        # Card background
+        painter.setPen(QPen(QColor("#374151"), 1))
+        painter.setBrush(QColor("#2c2c2c"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        # Left: Keycaps
+        x = content.left()
+        painter.setFont(self.keycap_font)
+        for label in index.data(KEYS_ROLE):
+            width = self.keycap_width(label)
+            height = self.keycap_metrics.height() + 10
+            keycap = QRect(x, content.center().y() - height // 2 + 1, width, height)
+            if keycap.right() > content.right():
+                break
+            painter.setPen(QPen(QColor("#4b5563"), 1))
+            painter.setBrush(QColor("#374151"))
+            painter.drawRoundedRect(QRectF(keycap).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(keycap, Qt.AlignmentFlag.AlignCenter, label)
+            x = keycap.right() + 1 + 4
+
+        # Middle: Template preview, elided to the remaining space
+        preview_rect = QRect(x + 8 + 12, content.top(), content.right() - x - 20, content.height())
+        if preview_rect.width() > 0:
+            painter.setFont(self.preview_font)
+            painter.setPen(QColor("#9ca3af"))
+            elided = self.elided_preview(index.data(Qt.ItemDataRole.DisplayRole), preview_rect.width())
+            painter.drawText(preview_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Right: Edit button (pencil icon)
+        if edit is not None:
+            if hovered == "edit":
+                painter.setBrush(QColor(255, 255, 255, 25))
+                painter.drawRoundedRect(QRectF(edit), 4, 4)
+            painter.drawPixmap(self._icon_rect(edit), svg_pixmap(EDIT_ICON_SVG, ICON_SIZE, widget=self.list_view))
+
+        # Right: Delete button (trash icon, or "Confirm?")
+        if confirm:
+            if hovered == "delete":
+                painter.setBrush(QColor(220, 38, 38, 25))
+                painter.drawRoundedRect(QRectF(delete), 4, 4)
+            painter.setFont(self.confirm_font)
+            painter.setPen(QColor("#dc2626"))
+            painter.drawText(delete, Qt.AlignmentFlag.AlignCenter, "Confirm?")
+        else:
+            if hovered == "delete":
+                painter.setBrush(QColor(239, 68, 68, 25))
+                painter.drawRoundedRect(QRectF(delete), 4, 4)
+            painter.drawPixmap(self._icon_rect(delete), svg_pixmap(DELETE_ICON_SVG, ICON_SIZE, widget=self.list_view))
+
+        painter.restore()
+
+    def _icon_rect(self, button):
+        return QRect(button.center().x() - ICON_SIZE // 2 + 1, button.center().y() - ICON_SIZE // 2 + 1,
+                     ICON_SIZE, ICON_SIZE)
+
+
+class KeybindingListView(QListView):
+    """List view for the keybinding cards; routes button clicks to the settings view"""
+    def __init__(self, settings_view):
+        super().__init__()
+        self.settings_view = settings_view
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setObjectName("keybindingList")
+        self.delegate = KeybindingDelegate(self)
+        self.setItemDelegate(self.delegate)
+
+    def _button_at(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return index, None
+        return index, self.delegate.hit_test(self.visualRect(index), index, pos)
+
+    def _set_hover(self, hover):
+        if hover != self.delegate.hover:
+            for previous in (self.delegate.hover, hover):
+                if previous is not None:
+                    self.update(self.model().index(previous[0], 0))
+            self.delegate.hover = hover
+        if hover:
+            self.viewport().setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        else:
+            self.viewport().unsetCursor()
+
+    def mouseMoveEvent(self, event):
+        index, button = self._button_at(event.pos())
+        self._set_hover((index.row(), button) if button else None)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        super().leaveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            index, button = self._button_at(event.pos())
+            if button == "edit":
+                self.settings_view.edit_keybinding(index.row())
+            elif button == "delete":
+                self.settings_view.handle_delete_click(index.row())
+        super().mouseReleaseEvent(event)
 
 
 class SettingsListView(QWidget):
@@ -25,7 +349,13 @@ class SettingsListView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_panel = parent
-        self.revert_timers = {}  # Track revert timers by button
+        self.model = keybinding_model()
+
+        # Single timer reverting the "Confirm?" state after 3 seconds
+        self.revert_timer = QTimer(self)
+        self.revert_timer.setSingleShot(True)
+        self.revert_timer.timeout.connect(self.revert_delete_button)
+
         self.setup_ui()
         self.load_keybindings()
 
@@ -35,43 +365,21 @@ class SettingsListView(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Scrollable list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { background: #1e1e1e; border: none; }")
-
-        self.list_container = QWidget()
-        self.list_container.setStyleSheet("background: #1e1e1e;")
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setContentsMargins(16, 16, 16, 80)
-        self.list_layout.setSpacing(12)
-
-        scroll.setWidget(self.list_container)
-        layout.addWidget(scroll)
+        # Virtualized list - rows are painted by the delegate, no widget per card
+        self.list_view = KeybindingListView(self)
+        self.list_view.setModel(self.model)
+        layout.addWidget(self.list_view)
 
         # Add button (fixed at bottom)
         add_btn = QPushButton("+ Add Shortcut")
         add_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         add_btn.setFixedHeight(48)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background: #2c2c2c;
-                color: #ffffff;
-                border: 1px solid #374151;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #374151;
-                border-color: #4b5563;
-            }
-        """)
+        add_btn.setObjectName("addButton")
         add_btn.clicked.connect(self.add_keybinding)
 
         # Position add button at bottom
         add_btn_container = QWidget()
-        add_btn_container.setStyleSheet("background: #1e1e1e; border-top: 1px solid rgba(255, 255, 255, 0.06);")
+        add_btn_container.setObjectName("settingsFooter")
         add_btn_layout = QVBoxLayout(add_btn_container)
         add_btn_layout.setContentsMargins(16, 12, 16, 12)
         add_btn_layout.addWidget(add_btn)
@@ -79,7 +387,7 @@ class SettingsListView(QWidget):
         layout.addWidget(add_btn_container)
 
     def load_keybindings(self):
-        """Load and display keybindings"""
+        """Load keybindings from config and update the model in place"""
         config = mw.addonManager.getConfig(__name__) or {}
         self.keybindings = config.get("keybindings", [])
 
@@ -110,306 +418,39 @@ class SettingsListView(QWidget):
         self.refresh_list()
 
     def refresh_list(self):
-        """Refresh the keybinding cards"""
-        # Stop and clear all active revert timers before deleting widgets
-        for timer in self.revert_timers.values():
-            if timer and timer.isActive():
-                timer.stop()
-        self.revert_timers.clear()
-
-        # Clear existing cards
-        while self.list_layout.count():
-            child = self.list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        # Add cards for each keybinding
-        for i, kb in enumerate(self.keybindings):
-            card = self.create_keybinding_card(kb, i)
-            self.list_layout.addWidget(card)
-
-        self.list_layout.addStretch()
-
-    def create_keybinding_card(self, kb, index):
-        """Create a card widget for a keybinding"""
-        # Main card container (not clickable - buttons handle actions)
-        card = QWidget()
-        card.setFixedHeight(56)
-
-        # Main horizontal layout
-        card_layout = QHBoxLayout(card)
-        card_layout.setContentsMargins(16, 8, 16, 8)
-        card_layout.setSpacing(12)
+        """Sync the model with the loaded keybindings (only changed rows update)"""
+        self.revert_timer.stop()
+        self.model.sync(self.keybindings)
 
-        # Left: Keycaps
-        keycaps_layout = QHBoxLayout()
-        keycaps_layout.setSpacing(4)
-
-        keys = kb.get("keys", [])
-        for key in keys:
-            # Format key display
-            if key == "Control/Meta":
-                display = "⌘" if sys.platform == "darwin" else "Ctrl"
-            elif key == "Meta":
-                display = "⌘"  # Cmd key on macOS
-            elif key == "Control":
-                display = "⌃" if sys.platform == "darwin" else "Ctrl"  # Control key
-            elif key == "Shift":
-                display = "⇧"
-            elif key == "Alt":
-                display = "⌥"
-            else:
-                display = key
-
-            keycap = QLabel(display)
-            keycap.setStyleSheet("""
-                QLabel {
-                    background: #374151;
-                    border: 1px solid #4b5563;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    color: #ffffff;
-                    font-size: 12px;
-                    font-weight: 500;
-                }
-            """)
-            keycaps_layout.addWidget(keycap)
-
-        card_layout.addLayout(keycaps_layout)
-
-        # Middle: Template preview (uses ElidedLabel for responsive text)
-        # If front template is empty, use back template for preview
-        template = kb.get("question_template", "")
-        if not template or not template.strip():
-            template = kb.get("answer_template", "")
-        preview = template.replace("\n", " ")
-        preview_label = ElidedLabel(preview)
-        preview_label.setStyleSheet("""
-            color: #9ca3af;
-            font-size: 12px;
-            padding-left: 12px;
-        """)
-        # Add with stretch factor 1 to absorb flexible space
-        card_layout.addWidget(preview_label, 1)
+    def handle_delete_click(self, row):
+        """Handle delete button click with confirmation"""
+        if self.model.confirm_row != row:
+            # First click - show confirm, revert after 3 seconds
+            self.model.set_confirm_row(row)
+            self.revert_timer.start(3000)
+            return
 
-        # Right: Edit button (pencil icon)
-        edit_btn = QPushButton()
-        edit_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        edit_btn.setFixedSize(32, 32)
-
-        # Create high-resolution SVG icon for edit button
-        edit_icon_svg = """<?xml version="1.0" encoding="UTF-8"?>
-        <svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <path d="M38 10L32 4L12 24L10 34L20 32L40 12L38 10Z M32 4L38 10 M16 28L20 32" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
-        </svg>
-        """
-
-        # Render SVG at higher resolution for crisp display
-        svg_bytes_edit = QByteArray(edit_icon_svg.encode())
-        renderer_edit = QSvgRenderer(svg_bytes_edit)
-        pixmap_edit = QPixmap(48, 48)
-        try:
-            pixmap_edit.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap_edit.fill(Qt.transparent)
-        painter_edit = QPainter(pixmap_edit)
-        renderer_edit.render(painter_edit)
-        painter_edit.end()
-
-        edit_btn.setIcon(QIcon(pixmap_edit))
-        edit_btn.setIconSize(QSize(16, 16))
-
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.1);
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.edit_keybinding(index))
-        card_layout.addWidget(edit_btn)
-
-        # Right: Delete button (trash icon with confirm logic)
-        delete_btn = QPushButton()
-        delete_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        delete_btn.setFixedSize(32, 32)
-        delete_btn.setProperty("state", "normal")
-        delete_btn.setProperty("index", index)
-
-        # Create high-resolution SVG icon for delete button
-        delete_icon_svg = """<?xml version="1.0" encoding="UTF-8"?>
-        <svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <path d="M16 10V6h16v4M8 10h32M12 10v28h24V10" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
-            <path d="M20 18v14M28 18v14" stroke="white" stroke-width="3" stroke-linecap="round"/>
-        </svg>
-        """
-
-        # Render SVG at higher resolution for crisp display
-        svg_bytes_delete = QByteArray(delete_icon_svg.encode())
-        renderer_delete = QSvgRenderer(svg_bytes_delete)
-        pixmap_delete = QPixmap(48, 48)
-        try:
-            pixmap_delete.fill(Qt.GlobalColor.transparent)
-        except:
-            pixmap_delete.fill(Qt.transparent)
-        painter_delete = QPainter(pixmap_delete)
-        renderer_delete.render(painter_delete)
-        painter_delete.end()
-
-        delete_btn.setIcon(QIcon(pixmap_delete))
-        delete_btn.setIconSize(QSize(16, 16))
-
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(239, 68, 68, 0.1);
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.handle_delete_click(delete_btn, edit_btn, index))
-        card_layout.addWidget(delete_btn)
+        # Second click - check if this is the last keybinding before attempting delete
+        config = mw.addonManager.getConfig(__name__) or {}
+        keybindings = config.get("keybindings", [])
 
-        # Card background
-        card.setStyleSheet("""
-            QWidget {
-                background: #2c2c2c;
-                border: 1px solid #374151;
-                border-radius: 8px;
-            }
-        """)
+        if len(keybindings) <= 1:
+            # Cannot delete the last keybinding - show error and revert button
+            tooltip("Cannot delete the last keybinding")
+            self.revert_delete_button()
+            return
 
-        return card
+        # Proceed with deletion (cancel the revert since we're deleting)
+        self.revert_timer.stop()
+        self.model.set_confirm_row(None)
 
-    def handle_delete_click(self, button, edit_btn, index):
-        """Handle delete button click with confirmation"""
-        state = button.property("state")
-
-        if state == "normal":
-            # First click - show confirm
-            button.setIcon(QIcon())  # Remove icon
-            button.setText("Confirm?")
-            button.setProperty("state", "confirm")
-            # Expand button to fit text
-            button.setFixedSize(70, 32)
-            button.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    color: #dc2626;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 11px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: rgba(220, 38, 38, 0.1);
-                }
-            """)
-
-            # Hide edit button to prevent card overflow
-            if edit_btn:
-                edit_btn.hide()
-
-            # Start 3-second timer to revert
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: self.revert_delete_button(button, edit_btn))
-            timer.start(3000)
-            # Store timer reference in instance dict so we can cancel it if user confirms
-            self.revert_timers[id(button)] = timer
-
-        elif state == "confirm":
-            # Second click - check if this is the last keybinding before attempting delete
-            config = mw.addonManager.getConfig(__name__) or {}
-            keybindings = config.get("keybindings", [])
-
-            if len(keybindings) <= 1:
-                # Cannot delete the last keybinding - show error and revert button
-                tooltip("Cannot delete the last keybinding")
-                # Revert button state immediately
-                self.revert_delete_button(button, edit_btn)
-                return
-
-            # Proceed with deletion
-            # Cancel the revert timer since we're deleting
-            button_id = id(button)
-            if button_id in self.revert_timers:
-                timer = self.revert_timers[button_id]
-                if timer and timer.isActive():
-                    timer.stop()
-                del self.revert_timers[button_id]
-
-            # Disconnect button to prevent further clicks during deletion
-            try:
-                button.clicked.disconnect()
-            except:
-                pass
-
-            # Defer deletion with longer delay to ensure click event fully completes
-            QTimer.singleShot(50, lambda: self.delete_keybinding(index))
-
-    def revert_delete_button(self, button, edit_btn):
-        """Revert delete button to normal state after timeout"""
-        try:
-            # Check if button still exists and hasn't been deleted
-            if not button or not hasattr(button, 'property'):
-                return
-
-            if button.property("state") == "confirm":
-                button.setText("")
-                button.setProperty("state", "normal")
-
-                # Clean up timer reference
-                button_id = id(button)
-                if button_id in self.revert_timers:
-                    del self.revert_timers[button_id]
-
-                # Show edit button again
-                if edit_btn:
-                    edit_btn.show()
-
-                # Recreate delete icon
-                delete_icon_svg = """<?xml version="1.0" encoding="UTF-8"?>
-                <svg width="48" height="48" viewBox="0 0 48 48" fill="none" xmlns="http://www.w3.org/2000/svg">
-                    <path d="M16 10V6h16v4M8 10h32M12 10v28h24V10" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round"/>
-                    <path d="M20 18v14M28 18v14" stroke="white" stroke-width="3" stroke-linecap="round"/>
-                </svg>
-                """
-
-                svg_bytes_delete = QByteArray(delete_icon_svg.encode())
-                renderer_delete = QSvgRenderer(svg_bytes_delete)
-                pixmap_delete = QPixmap(48, 48)
-                try:
-                    pixmap_delete.fill(Qt.GlobalColor.transparent)
-                except:
-                    pixmap_delete.fill(Qt.transparent)
-                painter_delete = QPainter(pixmap_delete)
-                renderer_delete.render(painter_delete)
-                painter_delete.end()
-
-                button.setIcon(QIcon(pixmap_delete))
-                button.setIconSize(QSize(16, 16))
-                # Restore original button size
-                button.setFixedSize(32, 32)
-
-                button.setStyleSheet("""
-                    QPushButton {
-                        background: transparent;
-                        border: none;
-                        border-radius: 4px;
-                    }
-                    QPushButton:hover {
-                        background: rgba(239, 68, 68, 0.1);
-                    }
-                """)
-        except RuntimeError:
-            # Button was deleted before timer fired, ignore
-            pass
+        # Defer deletion to ensure the click event fully completes
+        QTimer.singleShot(50, lambda: self.delete_keybinding(row))
+
+    def revert_delete_button(self):
+        """Revert the delete button to its normal state"""
+        self.revert_timer.stop()
+        self.model.set_confirm_row(None)
 
     def delete_keybinding(self, index):
         """Delete a keybinding"""
@@ -424,7 +465,7 @@ class SettingsListView(QWidget):
         config["keybindings"] = keybindings
         mw.addonManager.writeConfig(__name__, config)
 
-        # Refresh the list
+        # Remove just this row from the list
         self.load_keybindings()
 
         # Refresh JavaScript in panel
@@ -450,11 +491,7 @@ class SettingsListView(QWidget):
     def edit_keybinding(self, index):
         """Edit a keybinding"""
         # Notify tutorial FIRST (before view changes)
-        try:
-            from .tutorial import tutorial_event
-            tutorial_event("template_edit_opened")
-        except Exception as e:
-            print(f"Tutorial event error: {e}")
+        tutorial_event("template_edit_opened")
         
         if self.parent_panel and hasattr(self.parent_panel, 'show_editor_view'):
             self.parent_panel.show_editor_view(self.keybindings[index].copy(), index)
@@ -16,6 +16,7 @@ except ImportError:
     from PyQt5.QtGui import QCursor
 
 from .key_recorder import KeyRecorderMixin
+from .theme import set_state
 
 
 class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
@@ -46,64 +47,61 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
         # Scrollable content area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { background: #1e1e1e; border: none; }")
+        scroll.setObjectName("settingsScroll")
 
         content = QWidget()
-        content.setStyleSheet("background: #1e1e1e;")
+        content.setObjectName("settingsContent")
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(16, 16, 16, 16)
         content_layout.setSpacing(24)
 
         # Header
         header = QLabel("Quick Actions")
-        header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 20px;
-            font-weight: 700;
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-        """)
+        header.setObjectName("viewTitle")
         content_layout.addWidget(header)
 
         # Description
         desc = QLabel("Configure keyboard shortcuts for text highlighting actions")
-        desc.setStyleSheet("""
-            color: #9ca3af;
-            font-size: 13px;
-            margin-bottom: 8px;
-        """)
+        desc.setObjectName("viewDescription")
         desc.setWordWrap(True)
         content_layout.addWidget(desc)
 
         # Add to Chat shortcut
         add_to_chat_label = QLabel("Add to Chat")
-        add_to_chat_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold; margin-top: 12px;")
+        add_to_chat_label.setObjectName("sectionLabel")
+        add_to_chat_label.setProperty("spaced", True)
         content_layout.addWidget(add_to_chat_label)
 
         self.add_to_chat_display = QPushButton()
         self.add_to_chat_display.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.add_to_chat_display.setObjectName("shortcutDisplay")
         self.add_to_chat_display.setFixedHeight(60)
         self._update_shortcut_display(self.add_to_chat_display, self.shortcuts["add_to_chat"]["keys"])
         self.add_to_chat_display.clicked.connect(lambda: self.start_recording('add_to_chat'))
         content_layout.addWidget(self.add_to_chat_display)
 
         add_to_chat_desc = QLabel("Directly add highlighted text to OpenEvidence chat")
-        add_to_chat_desc.setStyleSheet("color: #6b7280; font-size: 11px; margin-bottom: 8px;")
+        add_to_chat_desc.setObjectName("helpText")
+        add_to_chat_desc.setProperty("spaced", True)
         content_layout.addWidget(add_to_chat_desc)
 
         # Ask Question shortcut
         ask_question_label = QLabel("Ask Question")
-        ask_question_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold; margin-top: 12px;")
+        ask_question_label.setObjectName("sectionLabel")
+        ask_question_label.setProperty("spaced", True)
         content_layout.addWidget(ask_question_label)
 
         self.ask_question_display = QPushButton()
         self.ask_question_display.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.ask_question_display.setObjectName("shortcutDisplay")
         self.ask_question_display.setFixedHeight(60)
         self._update_shortcut_display(self.ask_question_display, self.shortcuts["ask_question"]["keys"])
         self.ask_question_display.clicked.connect(lambda: self.start_recording('ask_question'))
         content_layout.addWidget(self.ask_question_display)
 
         ask_question_desc = QLabel("Open question input with highlighted text as context")
-        ask_question_desc.setStyleSheet("color: #6b7280; font-size: 11px; margin-bottom: 8px;")
+        ask_question_desc.setObjectName("helpText")
+        ask_question_desc.setProperty("spaced", True)
         content_layout.addWidget(ask_question_desc)
 
         content_layout.addStretch()
@@ -119,16 +117,16 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
 
         # Bottom section with Save button
         bottom_section = QWidget()
-        bottom_section.setStyleSheet("background: #1e1e1e; border-top: 1px solid rgba(255, 255, 255, 0.06);")
+        bottom_section.setObjectName("settingsFooter")
         bottom_layout = QVBoxLayout(bottom_section)
         bottom_layout.setContentsMargins(16, 12, 16, 12)
 
-        # Save button (disabled by default)
+        # Save button (disabled by default; the theme styles the disabled state)
         self.save_btn = QPushButton("Save")
+        self.save_btn.setObjectName("primaryButton")
         self.save_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.save_btn.setFixedHeight(44)
         self.save_btn.setEnabled(False)  # Disabled by default
-        self._update_save_button_style()
         self.save_btn.clicked.connect(self.save_shortcuts)
         bottom_layout.addWidget(self.save_btn)
 
@@ -146,16 +144,7 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
             else:
                 button.setText("Press any key combination...")
 
-            button.setStyleSheet("""
-                QPushButton {
-                    background: #2c2c2c;
-                    color: #3b82f6;
-                    border: 2px solid #3b82f6;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 500;
-                }
-            """)
+            set_state(button, "state", "recording")
         else:
             # Normal state
             if keys:
@@ -164,20 +153,7 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
             else:
                 button.setText("Click to record shortcut")
 
-            button.setStyleSheet("""
-                QPushButton {
-                    background: #2c2c2c;
-                    color: #ffffff;
-                    border: 1px solid #374151;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: #333333;
-                    border-color: #4b5563;
-                }
-            """)
+            set_state(button, "state", "set")
 
     def start_recording(self, target):
         """Start recording keys for a specific shortcut"""
@@ -229,35 +205,6 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
 
         # Enable/disable save button
         self.save_btn.setEnabled(has_changes)
-        self._update_save_button_style()
-
-    def _update_save_button_style(self):
-        """Update save button appearance based on enabled state"""
-        if self.save_btn.isEnabled():
-            self.save_btn.setStyleSheet("""
-                QPushButton {
-                    background: #3b82f6;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: #2563eb;
-                }
-            """)
-        else:
-            self.save_btn.setStyleSheet("""
-                QPushButton {
-                    background: #333333;
-                    color: #666666;
-                    border: 1px solid #444444;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-            """)
 
     def save_shortcuts(self):
         """Save shortcuts to config"""
@@ -326,17 +273,9 @@ class QuickActionsSettingsView(KeyRecorderMixin, QWidget):
                 display: "{ask_question_display}"
             }};
             
-            // If bubble is visible, update the display text in the buttons
-            var bubble = document.getElementById('anki-highlight-bubble');
-            if (bubble && bubble.style.display !== 'none') {{
-                var addToChatSpan = bubble.querySelector('#add-to-chat-btn span:last-child');
-                var askQuestionSpan = bubble.querySelector('#ask-question-btn span:last-child');
-                if (addToChatSpan) {{
-                    addToChatSpan.textContent = '{add_to_chat_display}';
-                }}
-                if (askQuestionSpan) {{
-                    askQuestionSpan.textContent = '{ask_question_display}';
-                }}
+            // If the bubble is showing, refresh its shortcut hints
+            if (window.ankiHighlightBubble) {{
+                window.ankiHighlightBubble.refreshShortcuts();
             }}
             
             console.log('Anki: Quick Actions config updated:', window.quickActionsConfig);
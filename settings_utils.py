@@ -5,43 +5,85 @@ Utility classes for settings UI.
 try:
     from PyQt6.QtWidgets import QLabel, QSizePolicy
     from PyQt6.QtGui import QPainter
-    from PyQt6.QtCore import Qt
+    from PyQt6.QtCore import Qt, QEvent, QSize
 except ImportError:
     from PyQt5.QtWidgets import QLabel, QSizePolicy
     from PyQt5.QtGui import QPainter
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import Qt, QEvent, QSize
+
+# Get elide mode based on PyQt version
+try:
+    ELIDE_RIGHT = Qt.TextElideMode.ElideRight
+except AttributeError:
+    ELIDE_RIGHT = Qt.ElideRight
 
 
 class ElidedLabel(QLabel):
-    """QLabel that automatically elides text with ... when space is tight"""
+    """
+    QLabel that automatically elides text with ... when space is tight.
+
+    The elided string is only recomputed when the text, font or width
+    changes; repaints (hover, scrolling) just draw the cached string.
+    """
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
+        self._elided = None
+        self._elided_width = None
+        self._hints = None  # Cached (sizeHint, minimumSizeHint)
         try:
             self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
         except:
             # PyQt5 fallback
             self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
 
+    def setText(self, text):
+        if text != self.text():
+            super().setText(text)
+            self._invalidate()
+
+    def _invalidate(self):
+        self._elided = None
+        self._hints = None
+        self.updateGeometry()
+
+    def changeEvent(self, event):
+        """Font and style changes change the text metrics"""
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._invalidate()
+        super().changeEvent(event)
+
+    def _elided_text(self, width):
+        if self._elided is None or self._elided_width != width:
+            self._elided = self.fontMetrics().elidedText(self.text(), ELIDE_RIGHT, width)
+            self._elided_width = width
+        return self._elided
+
+    def _size_hints(self):
+        if self._hints is None:
+            metrics = self.fontMetrics()
+            margins = self.contentsMargins()
+            extra_width = margins.left() + margins.right() + 2 * self.margin()
+            height = metrics.height() + margins.top() + margins.bottom() + 2 * self.margin()
+            self._hints = (
+                QSize(metrics.horizontalAdvance(self.text()) + extra_width, height),
+                QSize(metrics.horizontalAdvance("…") + extra_width, height),
+            )
+        return self._hints
+
+    def sizeHint(self):
+        """Full text width (the label may shrink below it and elide)"""
+        return self._size_hints()[0]
+
+    def minimumSizeHint(self):
+        """Room for just the ellipsis"""
+        return self._size_hints()[1]
+
     def paintEvent(self, event):
         """Draw elided text"""
         painter = QPainter(self)
-        metrics = painter.fontMetrics()
-
-        # Get elide mode based on PyQt version
-        try:
-            elide_mode = Qt.TextElideMode.ElideRight
-        except AttributeError:
-            elide_mode = Qt.ElideRight
 
         # Use contentsRect to respect margins/padding from stylesheet
         rect = self.contentsRect()
 
-        # Get elided text that fits in current width (accounting for padding)
-        elided = metrics.elidedText(
-            self.text(),
-            elide_mode,
-            rect.width()
-        )
-
-        # Draw the elided text within the content rect
-        painter.drawText(rect, self.alignment(), elided)
+        # Draw the elided text (cached per text/font/width) within the content rect
+        painter.drawText(rect, self.alignment(), self._elided_text(rect.width()))
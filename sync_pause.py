@@ -0,0 +1,158 @@
+"""
+Pause the OpenEvidence panel while Anki syncs.
+
+The panel preloads OpenEvidence in the background, often right when Anki
+runs its start-of-session sync (and the media sync after it). The page's
+loading and polling then compete with the sync for bandwidth. While a
+collection or media sync is running:
+
+- a panel that hasn't loaded yet defers its load until the sync is done
+- a loaded panel that's hidden has its page frozen
+  (QWebEnginePage.LifecycleState.Frozen: timers, polling and loading tasks
+  stop). Chromium only freezes hidden pages, so a visible panel keeps
+  running.
+
+Opening the panel during a sync resumes it at once. When the sync
+finishes, deferred loads start, frozen pages resume, and the pending
+action queue is flushed so actions taken in the meantime are delivered.
+Sync durations, split by whether the panel was paused, are kept for the
+Diagnostics view.
+"""
+
+import time
+import weakref
+
+try:
+    from PyQt6.QtCore import QObject, QEvent
+except ImportError:
+    from PyQt5.QtCore import QObject, QEvent
+
+from .diagnostics import register_section
+from .page_lifecycle import set_lifecycle_state
+from .pending_actions import queue as pending_actions
+
+RECENT_SYNCS = 5
+
+
+class SyncState:
+    """Whether Anki is syncing, shared by every panel of the session"""
+    def __init__(self):
+        self.collection_syncing = False
+        self.media_syncing = False
+        self.started = None
+        self.paused_any = False     # A panel was paused during this sync
+        self.deferred_loads = 0
+        self.freezes = 0
+        self.recent = []            # (duration s, panel paused)
+        self._pauses = weakref.WeakSet()
+
+    @property
+    def active(self):
+        return self.collection_syncing or self.media_syncing
+
+    def register(self, pause):
+        self._pauses.add(pause)
+
+    def sync_started(self):
+        self._set(collection=True)
+
+    def sync_finished(self):
+        self._set(collection=False)
+
+    def media_sync_changed(self, running):
+        self._set(media=bool(running))
+
+    def _set(self, collection=None, media=None):
+        was_active = self.active
+        if collection is not None:
+            self.collection_syncing = collection
+        if media is not None:
+            self.media_syncing = media
+
+        if self.active and not was_active:
+            self.started = time.time()
+            self.paused_any = False
+            for pause in list(self._pauses):
+                pause.pause()
+        elif was_active and not self.active:
+            if self.started is not None:
+                self.recent.append((time.time() - self.started, self.paused_any))
+                del self.recent[:-RECENT_SYNCS]
+            self.started = None
+            for pause in list(self._pauses):
+                pause.resume()
+            pending_actions.flush()
+
+    def diagnostics(self):
+        """Rows for the Diagnostics view"""
+        if self.active:
+            status = "Syncing for %.0f s" % (time.time() - self.started)
+        else:
+            status = "Idle"
+        rows = [
+            ("Status", status),
+            ("Deferred loads", str(self.deferred_loads)),
+            ("Page freezes", str(self.freezes)),
+        ]
+        for duration, paused in reversed(self.recent):
+            rows.append(("Sync", "%.1f s (%s)" % (duration, "panel paused" if paused else "panel running")))
+        return rows
+
+
+state = SyncState()
+
+
+class SyncPause(QObject):
+    """Defers a panel's load or freezes its page while a sync runs"""
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.deferred_url = None
+        self.frozen = False
+        panel.installEventFilter(self)
+        state.register(self)
+
+    def load(self, url):
+        """Load url now, or once the running sync is done"""
+        if state.active and not self.panel.isVisible():
+            print("OpenEvidence: Sync running, deferring the panel load")
+            self.deferred_url = url
+            state.deferred_loads += 1
+            state.paused_any = True
+            return
+        self.panel.web.load(url)
+
+    def pause(self):
+        if self.deferred_url is not None or self.frozen or self.panel.isVisible():
+            return
+        monitor = getattr(self.panel, "resource_monitor", None)
+        if monitor is not None and monitor.suspended is not None:
+            return  # Already frozen or discarded for memory
+        if not set_lifecycle_state(self.panel.web.page(), "Frozen"):
+            return
+        self.frozen = True
+        state.freezes += 1
+        state.paused_any = True
+
+    def resume(self):
+        if self.frozen:
+            self.frozen = False
+            # A page the resource monitor has since frozen or discarded for
+            # memory stays that way until the panel is shown
+            monitor = getattr(self.panel, "resource_monitor", None)
+            if monitor is None or monitor.suspended is None or self.panel.isVisible():
+                set_lifecycle_state(self.panel.web.page(), "Active")
+        if self.deferred_url is not None:
+            url, self.deferred_url = self.deferred_url, None
+            self.panel.web.load(url)
+
+    def eventFilter(self, obj, event):
+        # The user opened the panel mid-sync - they want it now
+        if obj is self.panel and event.type() == QEvent.Type.Show:
+            if self.frozen or self.deferred_url is not None:
+                self.resume()
+                pending_actions.flush()
+        return False
+
+
+register_section("Sync", state.diagnostics)
@@ -0,0 +1,236 @@
+"""
+Shared stylesheet for the OpenEvidence add-on's widgets.
+
+Instead of every widget carrying its own inline stylesheet, the dock widget
+gets one stylesheet for the whole theme. Widgets are matched by object name,
+and state changes (recording a shortcut, a completed onboarding step) are
+dynamic properties toggled with set_state(), which only re-polishes the one
+widget instead of re-parsing a stylesheet. Enabled/disabled looks use the
+:disabled pseudo-state and need no restyle at all.
+
+The sheet is only set on the add-on's own dock widget, never on the
+QApplication, so it can't leak into Anki's UI.
+"""
+
+HEADING_FONT = '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif'
+
+DARK_STYLESHEET = """
+/* Panel */
+QWebEngineView { background: #1e1e1e; }
+
+/* Title bar */
+QWidget#titleBar, QWidget#titleBar QLabel {
+    background: #2a2a2a;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.06);
+}
+QLabel#titleBarTitle { color: rgba(255, 255, 255, 0.9); font-size: 13px; font-weight: 500; }
+QPushButton#titleBarButton, QPushButton#titleBarClose {
+    background: transparent;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton#titleBarButton:hover { background: rgba(255, 255, 255, 0.12); }
+QPushButton#titleBarClose:hover { background: rgba(239, 68, 68, 0.2); }
+
+/* Settings views - shared */
+QScrollArea#settingsScroll { background: #1e1e1e; border: none; }
+QWidget#settingsContent { background: #1e1e1e; }
+QWidget#settingsFooter { background: #1e1e1e; border-top: 1px solid rgba(255, 255, 255, 0.06); }
+QLabel#settingsTitle { color: #ffffff; font-size: 24px; font-weight: 700; font-family: %(heading)s; }
+QLabel#viewTitle { color: #ffffff; font-size: 20px; font-weight: 700; font-family: %(heading)s; }
+QLabel#viewDescription { color: #9ca3af; font-size: 13px; margin-bottom: 8px; }
+QLabel#sectionLabel { color: #ffffff; font-size: 14px; font-weight: bold; }
+QLabel#sectionLabel[spaced="true"] { margin-top: 12px; }
+QLabel#helpText { color: #6b7280; font-size: 11px; }
+QLabel#helpText[spaced="true"] { margin-bottom: 8px; }
+
+QPushButton#primaryButton {
+    background: #3b82f6;
+    color: #ffffff;
+    border: none;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: 600;
+}
+QPushButton#primaryButton:hover { background: #2563eb; }
+QPushButton#primaryButton:disabled {
+    background: #333333;
+    color: #666666;
+    border: 1px solid #444444;
+}
+
+QPushButton#secondaryButton {
+    background: #2c2c2c;
+    color: #ffffff;
+    border: 1px solid #374151;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: 600;
+}
+QPushButton#secondaryButton:hover { background: #333333; border-color: #4b5563; }
+QPushButton#addButton {
+    background: #2c2c2c;
+    color: #ffffff;
+    border: 1px solid #374151;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: 500;
+}
+QPushButton#addButton:hover { background: #374151; border-color: #4b5563; }
+
+/* Shortcut recorder buttons: state = "set", "empty" or "recording" */
+QPushButton#keyDisplay {
+    background: #2c2c2c;
+    color: #ffffff;
+    border: 1px solid #374151;
+    border-radius: 8px;
+    font-size: 14px;
+}
+QPushButton#keyDisplay:hover { border-color: #4b5563; }
+QPushButton#keyDisplay[state="empty"] { color: #9ca3af; border: 1px dashed #374151; }
+QPushButton#keyDisplay[state="empty"]:hover { border-color: #4b5563; }
+QPushButton#shortcutDisplay {
+    background: #2c2c2c;
+    color: #ffffff;
+    border: 1px solid #374151;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: 600;
+}
+QPushButton#shortcutDisplay:hover { background: #333333; border-color: #4b5563; }
+QPushButton#keyDisplay[state="recording"], QPushButton#keyDisplay[state="recording"]:hover,
+QPushButton#shortcutDisplay[state="recording"], QPushButton#shortcutDisplay[state="recording"]:hover {
+    background: #2c2c2c;
+    color: #3b82f6;
+    border: 2px solid #3b82f6;
+    font-weight: 500;
+}
+
+/* Template editor */
+QTextEdit#templateEdit {
+    background-color: #2c2c2c;
+    border: 1px solid #374151;
+    border-radius: 6px;
+    padding: 8px;
+    color: white;
+    font-size: 13px;
+    font-family: Menlo, Monaco, 'Courier New', monospace;
+}
+QTextEdit#templateEdit QScrollBar:vertical { width: 8px; background: transparent; }
+QTextEdit#templateEdit QScrollBar::handle:vertical { background: #4b5563; border-radius: 4px; }
+QTextEdit#templateEdit QScrollBar::add-line:vertical,
+QTextEdit#templateEdit QScrollBar::sub-line:vertical { height: 0px; }
+QPushButton#variableChip {
+    background: #374151;
+    color: #ffffff;
+    border: none;
+    border-radius: 12px;
+    padding: 4px 12px;
+    font-size: 11px;
+    font-weight: 500;
+}
+QPushButton#variableChip:hover { background: #4b5563; }
+
+/* Templates list */
+QListView#keybindingList { background: #1e1e1e; border: none; padding-top: 10px; }
+
+/* Settings home */
+QPushButton#navCard {
+    background: #2c2c2c;
+    border: 1px solid #374151;
+    border-radius: 12px;
+    text-align: left;
+}
+QPushButton#navCard:hover { background: #333333; border-color: #3b82f6; }
+QLabel#navCardTitle { color: #ffffff; font-size: 15px; font-weight: 600; }
+QLabel#navCardArrow { color: #6b7280; font-size: 20px; }
+QWidget#footerSeparator { background: #3f3f46; }
+QFrame#footerLink { background: transparent; border-radius: 6px; }
+QFrame#footerLink:hover { background: rgba(255, 255, 255, 0.05); }
+QLabel#footerLinkText { color: #a1a1aa; font-size: 12px; }
+
+/* Offline view */
+QWidget#offlineView { background: #1e1e1e; }
+QLabel#offlineTitle { color: #ffffff; font-size: 18px; font-weight: 600; font-family: %(heading)s; }
+QLabel#offlineMessage { color: #9ca3af; font-size: 13px; margin-bottom: 8px; }
+
+/* Diagnostics */
+QLabel#diagnosticName { color: #9ca3af; font-size: 12px; }
+QLabel#diagnosticValue { color: #e5e7eb; font-size: 12px; }
+
+/* Onboarding */
+QLabel#onboardingTitle {
+    font-size: 32px;
+    font-weight: 700;
+    color: #FFFFFF;
+    font-family: %(heading)s;
+    margin: 0px 0px 16px 0px;
+}
+QLabel#onboardingHeadline {
+    font-size: 26px;
+    font-weight: 700;
+    color: #FFFFFF;
+    font-family: %(heading)s;
+    margin: 0px 0px 8px 0px;
+}
+QLabel#onboardingCreator { font-size: 14px; color: #777777; font-weight: 500; }
+QLabel#onboardingBody {
+    font-size: 15px;
+    color: #BBBBBB;
+    font-weight: 400;
+    line-height: 1.5;
+    padding-left: 2px;
+}
+QPushButton#onboardingNext {
+    background: #3498db;
+    color: #FFFFFF;
+    border: none;
+    border-radius: 8px;
+    font-size: 16px;
+    font-weight: 600;
+    padding: 16px;
+}
+QPushButton#onboardingNext:hover { background: #5dade2; }
+QPushButton#onboardingNext:disabled {
+    background: #333333;
+    color: #666666;
+    border: 1px solid #444444;
+}
+QPushButton#starButton {
+    background: #2b2b2b;
+    border: 1px solid #444444;
+    border-radius: 8px;
+    text-align: left;
+}
+QPushButton#starButton:hover { background: #3a3a3a; border-color: #666666; }
+QPushButton#starButton[done="true"], QPushButton#starButton[done="true"]:hover {
+    background: #2b2b2b;
+    border-color: #444444;
+}
+QLabel#starText { color: #FFFFFF; font-size: 15px; font-weight: 500; }
+QLabel#skipLink { color: #555555; font-size: 10px; }
+QLabel#skipLink:hover { color: #777777; }
+""" % {"heading": HEADING_FONT}
+
+THEMES = {
+    "dark": DARK_STYLESHEET,
+}
+DEFAULT_THEME = "dark"
+
+
+def apply_theme(widget, theme=DEFAULT_THEME):
+    """Set the theme's stylesheet on a root widget (styles all its children)"""
+    stylesheet = THEMES.get(theme, THEMES[DEFAULT_THEME])
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
+def set_state(widget, name, value):
+    """Set a dynamic style property and re-polish just this widget if it changed"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -50,6 +50,21 @@ def tutorial_event(event_name: str):
         print(f"Tutorial event error: {e}")
 
 
+def tutorial_target_rect(source: str, payload: str):
+    """
+    Handle a target rectangle pushed by a web view's tutorial observer.
+
+    Args:
+        source: "toolbar" or "panel"
+        payload: JSON rect reported by the observer script
+    """
+    try:
+        manager = get_tutorial_manager()
+        manager.tracker.on_html_rect(source, payload)
+    except Exception as e:
+        print(f"Tutorial target rect error: {e}")
+
+
 def skip_tutorial():
     """
     Skip the tutorial entirely.
@@ -8,7 +8,7 @@ screen space.
 
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton, QApplication, QSizePolicy
 from PyQt6.QtCore import Qt, QRect, QPoint, QTimer
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath, QPixmap
 
 
 class CoachMark(QWidget):
@@ -42,6 +42,10 @@ class CoachMark(QWidget):
         self.arrow_y = 0  # Y offset for arrow position
         self.arrow_size = 10  # Half-width/height of arrow triangle
 
+        # Rendered bubble chrome, reused until size, arrow or pixel ratio change
+        self._chrome = None
+        self._chrome_key = None
+
         # Fixed content width for consistent layout
         self.content_width = 320
         
@@ -243,7 +247,7 @@ class CoachMark(QWidget):
 
         self.move(bubble_x, bubble_y)
         self._update_content_position()
-        self.update()
+        self._update_chrome()
 
     def _position_above(self, target_rect, screen, bubble_width, bubble_height):
         """Position bubble above target with arrow pointing down."""
@@ -267,7 +271,7 @@ class CoachMark(QWidget):
 
         self.move(bubble_x, bubble_y)
         self._update_content_position()
-        self.update()
+        self._update_chrome()
 
     def _position_right(self, target_rect, screen, bubble_width, bubble_height):
         """Position bubble to the right with arrow pointing left."""
@@ -291,7 +295,7 @@ class CoachMark(QWidget):
 
         self.move(bubble_x, bubble_y)
         self._update_content_position()
-        self.update()
+        self._update_chrome()
 
     def _position_left(self, target_rect, screen, bubble_width, bubble_height):
         """Position bubble to the left with arrow pointing right."""
@@ -315,7 +319,7 @@ class CoachMark(QWidget):
 
         self.move(bubble_x, bubble_y)
         self._update_content_position()
-        self.update()
+        self._update_chrome()
 
     def _position_center(self, screen, bubble_width, bubble_height):
         """Position bubble at center of screen with no arrow."""
@@ -326,7 +330,7 @@ class CoachMark(QWidget):
 
         self.move(bubble_x, bubble_y)
         self._update_content_position()
-        self.update()
+        self._update_chrome()
 
     def _update_content_position(self):
         """Update the position of the content widget based on arrow direction."""
@@ -346,14 +350,54 @@ class CoachMark(QWidget):
         
         self.content_widget.setGeometry(content_x, content_y, content_w, content_h)
 
+    def _chrome_cache_key(self):
+        """Everything the bubble chrome depends on"""
+        if self.arrow_direction in ("top", "bottom"):
+            arrow_offset = self.arrow_x
+        elif self.arrow_direction in ("left", "right"):
+            arrow_offset = self.arrow_y
+        else:
+            arrow_offset = 0
+        return (self.width(), self.height(), self.arrow_direction, arrow_offset,
+                self.devicePixelRatioF())
+
+    def _update_chrome(self):
+        """Repaint only if the bubble chrome actually changed (not on plain moves)."""
+        if self._chrome_cache_key() != self._chrome_key:
+            self.update()
+
+    def _chrome_pixmap(self):
+        """The bubble and arrow, rendered once per cache key."""
+        key = self._chrome_cache_key()
+        if self._chrome is None or key != self._chrome_key:
+            dpr = key[-1]
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self._paint_chrome(painter)
+            painter.end()
+            self._chrome = pixmap
+            self._chrome_key = key
+        return self._chrome
+
     def paintEvent(self, event):
         """
         Render the coach mark bubble and arrow.
 
+        The chrome is cached as a pixmap, so repaints (e.g. during window
+        drags) are a single blit.
+        """
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._chrome_pixmap())
+
+    def _paint_chrome(self, painter):
+        """
+        Draw the bubble and arrow.
+
         Uses QPainter to draw a rounded rectangle for the main bubble
         and a triangle for the directional arrow.
         """
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Determine bubble rect position based on arrow
@@ -0,0 +1,55 @@
+"""
+Tutorial event dispatch
+
+Hot paths (panel toggling, reviewer hooks, pycmd routes) report tutorial
+events through this module instead of importing the tutorial directly.
+Once the tutorial is completed, dispatch resolves to a no-op: the tutorial
+modules (which import PyQt6 and build the TutorialManager) are never imported.
+Callers import it once at module level; an error in the tutorial is logged
+here so it never breaks the hook or route that reported the event.
+"""
+
+from aqt import mw
+
+
+def _noop(*args):
+    pass
+
+
+# (event handler, target rect handler), resolved on first use
+_handlers = None
+
+
+def _resolve():
+    global _handlers
+    if _handlers is None:
+        config = mw.addonManager.getConfig(__name__) or {}
+        if config.get("tutorial_completed", False):
+            _handlers = (_noop, _noop)
+        else:
+            from .tutorial import tutorial_event as event_handler
+            from .tutorial import tutorial_target_rect as rect_handler
+            _handlers = (event_handler, rect_handler)
+    return _handlers
+
+
+def tutorial_event(event_name):
+    """Forward a tutorial event (no-op once the tutorial is completed)"""
+    try:
+        _resolve()[0](event_name)
+    except Exception as e:
+        print(f"OpenEvidence: Error handling tutorial event {event_name}: {e}")
+
+
+def tutorial_target_rect(source, payload):
+    """Forward a target rect pushed by a web view (no-op once completed)"""
+    try:
+        _resolve()[1](source, payload)
+    except Exception as e:
+        print(f"OpenEvidence: Error handling tutorial target rect from {source}: {e}")
+
+
+def tutorial_finished():
+    """Called when the tutorial is completed or skipped - stop dispatching"""
+    global _handlers
+    _handlers = (_noop, _noop)
@@ -9,64 +9,32 @@ from PyQt6.QtCore import QPoint, QRect
 from aqt import mw
 
 
-def get_toolbar_icon_rect_async(callback):
-    """
-    Asynchronously get the rectangle of the OpenEvidence toolbar icon.
-
-    Uses JavaScript to query the DOM for the button position.
-
-    Args:
-        callback: Function to call with QRect result (or None if not found)
-    """
-    if not mw or not mw.toolbar or not mw.toolbar.web:
-        callback(None)
-        return
-
-    # JavaScript to get the OpenEvidence button's bounding box
-    js_code = """
-    (function() {
-        // Find the link with onclick="pycmd('openevidence')"
-        const links = document.querySelectorAll('a.hitem');
-        for (const link of links) {
-            if (link.onclick && link.onclick.toString().includes('openevidence')) {
-                const rect = link.getBoundingClientRect();
-                return {
-                    x: rect.x,
-                    y: rect.y,
-                    width: rect.width,
-                    height: rect.height
-                };
-            }
+# JavaScript function expressions that locate tutorial HTML targets.
+# Used by the TargetTracker observers (tutorial_tracker.py).
+TOOLBAR_ICON_FINDER_JS = """
+function() {
+    // Find the link with onclick="pycmd('openevidence')"
+    const links = document.querySelectorAll('a.hitem');
+    for (const link of links) {
+        if (link.onclick && link.onclick.toString().includes('openevidence')) {
+            return link;
         }
-        return null;
-    })();
-    """
+    }
+    return null;
+}
+"""
 
-    def on_result(result):
-        if result:
-            try:
-                # Convert toolbar web view coordinates to global coordinates
-                toolbar_global = mw.toolbar.web.mapToGlobal(QPoint(0, 0))
-                rect = QRect(
-                    int(toolbar_global.x() + result['x']),
-                    int(toolbar_global.y() + result['y']),
-                    int(result['width']),
-                    int(result['height'])
-                )
-                callback(rect)
-            except:
-                callback(None)
-        else:
-            callback(None)
-
-    mw.toolbar.web.page().runJavaScript(js_code, on_result)
+CHAT_INPUT_FINDER_JS = """
+function() {
+    // Kept current by the panel's input locator (input_locator.py)
+    return window.ankiInputs ? window.ankiInputs.main() : null;
+}
+"""
 
 
 def get_toolbar_icon_rect():
     """
-    Synchronous fallback for toolbar icon rect (uses approximation).
-
-    Note: This is a fallback. Prefer using get_toolbar_icon_rect_async for accuracy.
+    Approximate toolbar icon rect, from the toolbar's geometry.
 
     Returns:
         QRect in global screen coordinates, or None if toolbar not available
@@ -127,6 +95,30 @@ def get_gear_button_rect():
         return None
 
 
+def get_reviewer_web_view():
+    """
+    Get the reviewer's web view widget.
+
+    Returns:
+        AnkiWebView widget, or None if reviewer not active
+    """
+    if not mw or not mw.reviewer:
+        return None
+    return mw.reviewer.web
+
+
+def get_toolbar_web_view():
+    """
+    Get the top toolbar's web view widget.
+
+    Returns:
+        AnkiWebView widget, or None if toolbar not available
+    """
+    if not mw or not mw.toolbar:
+        return None
+    return mw.toolbar.web
+
+
 def get_reviewer_card_center():
     """
     Get the center point of the reviewer card area.
@@ -205,57 +197,6 @@ def get_panel_global_pos():
     return None
 
 
-def get_chat_input_rect_async(callback):
-    """
-    Asynchronously get the rectangle of the chat input box in the panel.
-
-    Uses JavaScript to query the DOM for the input element position.
-
-    Args:
-        callback: Function to call with QRect result (or None if not found)
-    """
-    web_view = get_panel_web_view()
-    if web_view is None:
-        callback(None)
-        return
-
-    # JavaScript to get input bounding box
-    js_code = """
-    (function() {
-        const input = document.querySelector('input[placeholder*="medical"], input[type="text"]');
-        if (input) {
-            const rect = input.getBoundingClientRect();
-            return {
-                x: rect.x,
-                y: rect.y,
-                width: rect.width,
-                height: rect.height
-            };
-        }
-        return null;
-    })();
-    """
-
-    def on_result(result):
-        if result:
-            try:
-                # Convert web view coordinates to global coordinates
-                web_global = web_view.mapToGlobal(QPoint(0, 0))
-                rect = QRect(
-                    int(web_global.x() + result['x']),
-                    int(web_global.y() + result['y']),
-                    int(result['width']),
-                    int(result['height'])
-                )
-                callback(rect)
-            except:
-                callback(None)
-        else:
-            callback(None)
-
-    web_view.page().runJavaScript(js_code, on_result)
-
-
 def get_panel_rect():
     """
     Get the rectangle of the entire panel.
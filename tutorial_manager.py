@@ -5,13 +5,55 @@ This module manages the tutorial flow, including step progression,
 UI coordination, state persistence, and event handling.
 """
 
-from PyQt6.QtCore import QTimer, QEvent, QObject
+from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QApplication
 from aqt import mw
 
 from .tutorial_coach_mark import CoachMark
 from .tutorial_overlay import TutorialOverlay
-from .tutorial_steps import TUTORIAL_STEPS, get_step_target_rect
+from .tutorial_steps import TUTORIAL_STEPS
+from .tutorial_tracker import TargetTracker
+
+DEMO_DECK_NAME = "OpenEvidence Demo"
+DEMO_CARDS = [
+    ("What is the first-line treatment for hypertension in most patients?",
+     "Thiazide diuretics or ACE inhibitors/ARBs"),
+    ("What are the classic signs of sepsis?",
+     "Fever, tachycardia, tachypnea, and altered mental status"),
+]
+
+
+def _create_demo_deck(col):
+    """
+    Collection operation: create the demo deck, add the sample notes in one
+    batch and select the deck. Runs in the background; returns the OpChanges
+    so Anki only refreshes what changed.
+    """
+    undo_start = col.add_custom_undo_entry("Create OpenEvidence Demo Deck")
+
+    deck_id = col.decks.id(DEMO_DECK_NAME)
+
+    # Only add sample cards if the deck is empty
+    if col.decks.card_count(deck_id, include_subdecks=False) == 0:
+        model = col.models.by_name("Basic")
+        if model:
+            notes = []
+            for front, back in DEMO_CARDS:
+                note = col.new_note(model)
+                note['Front'] = front
+                note['Back'] = back
+                notes.append(note)
+
+            try:
+                from anki.collection import AddNoteRequest
+                col.add_notes([AddNoteRequest(note=note, deck_id=deck_id) for note in notes])
+            except ImportError:
+                # Older Anki without batched adds
+                for note in notes:
+                    col.add_note(note, deck_id)
+
+    col.decks.select(deck_id)
+    return col.merge_undo_entries(undo_start)
 
 
 class TutorialManager(QObject):
@@ -36,25 +78,11 @@ class TutorialManager(QObject):
         # UI components
         self.coach_mark = None
         self.overlay = None
+        self._creating_demo_deck = False
 
-        # Retry mechanism for widget availability
-        self.retry_timer = QTimer()
-        self.retry_timer.timeout.connect(self._retry_show_step)
-        self.retry_count = 0
-        self.max_retries = 50  # Max 10 seconds (50 * 200ms)
-
-        # Window resize handling
-        self.resize_timer = QTimer()
-        self.resize_timer.setSingleShot(True)
-        self.resize_timer.timeout.connect(self._update_positions)
-
-        # Periodic position check (for layout changes that don't trigger resize)
-        self.position_check_timer = QTimer()
-        self.position_check_timer.timeout.connect(self._update_positions)
-
-        # Install event filter for window resize
-        if mw:
-            mw.installEventFilter(self)
+        # Event-driven target tracking (replaces polling for positions)
+        self.tracker = TargetTracker(mw, self)
+        self.displayed_step_index = None  # Step whose coach mark content is shown
 
     def start_tutorial(self):
         """
@@ -80,9 +108,6 @@ class TutorialManager(QObject):
         self.tutorial_active = True
         self.is_paused = False
 
-        # Start periodic position updates (every 500ms)
-        self.position_check_timer.start(500)
-
         # Show first/current step
         self._show_current_step()
 
@@ -93,7 +118,7 @@ class TutorialManager(QObject):
         Hides all UI components and saves completion state to config.
         """
         self.tutorial_active = False
-        self.position_check_timer.stop()
+        self.tracker.stop()
         self._hide_all()
         self._save_completion()
 
@@ -153,15 +178,14 @@ class TutorialManager(QObject):
         if self.overlay is None:
             self.overlay = TutorialOverlay(mw)
 
-    def _show_current_step(self, retry_count=0):
+    def _show_current_step(self):
         """
         Display the current tutorial step.
 
-        Handles target resolution, CoachMark positioning, and overlay highlighting.
-        Implements retry logic for widgets that may not be available immediately.
-
-        Args:
-            retry_count: Number of retries attempted (for internal use)
+        Starts tracking the step's target; the coach mark is shown once the
+        target is found and repositioned whenever the target moves. Targets
+        that never appear are retried a bounded number of times by the
+        tracker, then the step is skipped.
         """
         if not self.tutorial_active:
             return
@@ -171,30 +195,28 @@ class TutorialManager(QObject):
             return
 
         step = TUTORIAL_STEPS[self.current_step_index]
+        step_index = self.current_step_index
+        self.displayed_step_index = None
 
-        # Get target rectangle
-        def on_target_rect_ready(target_rect):
-            # If target is None and step requires a target, retry
-            if target_rect is None and step.target_type != "none":
-                if retry_count < self.max_retries:
-                    # Retry after delay
-                    self.retry_count = retry_count
-                    QTimer.singleShot(200, lambda: self._show_current_step(retry_count + 1))
-                else:
-                    # Max retries reached, skip this step
-                    print(f"Could not find target for step {step.step_id}, skipping...")
-                    self.advance_to_next_step()
+        def on_target_rect(target_rect):
+            if self.current_step_index != step_index or not self.tutorial_active or self.is_paused:
                 return
+            if self.displayed_step_index != step_index:
+                # First time the target is known - display the step
+                self.displayed_step_index = step_index
+                self._display_step(step, target_rect)
+            elif target_rect:
+                # Target moved - just update coach mark position, no overlay
+                self.coach_mark.position_at_target(target_rect)
 
-            # Display the step
-            self._display_step(step, target_rect)
-
-        # Get target rect (may be async for HTML elements)
-        get_step_target_rect(step, on_target_rect_ready)
+        def on_target_missing():
+            if self.current_step_index != step_index or not self.tutorial_active:
+                return
+            # Target never appeared, skip this step
+            print(f"Could not find target for step {step.step_id}, skipping...")
+            self.advance_to_next_step()
 
-    def _retry_show_step(self):
-        """Retry showing current step (used by QTimer)."""
-        self._show_current_step(self.retry_count + 1)
+        self.tracker.track(step, on_target_rect, on_target_missing)
 
     def _display_step(self, step, target_rect):
         """
@@ -247,55 +269,44 @@ class TutorialManager(QObject):
         Create a demo deck with sample medical flashcards and open it for review.
 
         This allows users to immediately test OpenEvidence features without
-        needing their own content.
+        needing their own content. The deck and notes are created in one
+        background collection operation (undoable as a single step), and the
+        tutorial advances once it has finished.
         """
+        if self._creating_demo_deck:
+            return
+
         try:
-            import aqt
-            from aqt import mw
-            from anki.collection import Collection
-
-            # Create or get the demo deck
-            deck_name = "OpenEvidence Demo"
-            deck_id = mw.col.decks.id(deck_name)
-
-            # Check if deck already has cards
-            card_count = mw.col.decks.card_count(deck_id, include_subdecks=False)
-
-            if card_count == 0:
-                # Add sample medical flashcards
-                model = mw.col.models.by_name("Basic")
-                if model:
-                    mw.col.models.set_current(model)
-
-                    sample_cards = [
-                        ("What is the first-line treatment for hypertension in most patients?",
-                         "Thiazide diuretics or ACE inhibitors/ARBs"),
-                        ("What are the classic signs of sepsis?",
-                         "Fever, tachycardia, tachypnea, and altered mental status"),
-                    ]
-
-                    for front, back in sample_cards:
-                        note = mw.col.new_note(model)
-                        note['Front'] = front
-                        note['Back'] = back
-                        mw.col.add_note(note, deck_id)
-
-            # Save changes
-            mw.col.save()
-
-            # Open the deck for review
-            mw.col.decks.select(deck_id)
-            mw.col.reset()
-            mw.moveToState("review")
+            from aqt.operations import CollectionOp
 
-            # Advance to next step
-            self.advance_to_next_step()
+            self._creating_demo_deck = True
+            CollectionOp(parent=mw, op=_create_demo_deck).success(
+                self._on_demo_deck_created
+            ).failure(
+                self._on_demo_deck_failed
+            ).run_in_background()
 
         except Exception as e:
+            self._creating_demo_deck = False
             print(f"Error creating demo deck: {e}")
             # Still advance even if deck creation fails
             self.advance_to_next_step()
 
+    def _on_demo_deck_created(self, changes):
+        """Open the demo deck for review and move on to the next step"""
+        self._creating_demo_deck = False
+        try:
+            mw.moveToState("review")
+        except Exception as e:
+            print(f"Error opening demo deck: {e}")
+        self.advance_to_next_step()
+
+    def _on_demo_deck_failed(self, error):
+        self._creating_demo_deck = False
+        print(f"Error creating demo deck: {error}")
+        # Still advance even if deck creation fails
+        self.advance_to_next_step()
+
     def _pause_tutorial(self):
         """
         Pause the tutorial (e.g., when panel is closed mid-tutorial).
@@ -303,6 +314,7 @@ class TutorialManager(QObject):
         Hides UI but maintains state for later resumption.
         """
         self.is_paused = True
+        self.tracker.stop()
         self._hide_all()
 
     def _resume_tutorial(self):
@@ -310,33 +322,6 @@ class TutorialManager(QObject):
         self.is_paused = False
         self._show_current_step()
 
-    def _update_positions(self):
-        """
-        Update positions of coach mark and overlay (e.g., after window resize).
-
-        Re-queries the target location and repositions UI components.
-        This forces a fresh JavaScript query for HTML elements to get current coordinates.
-        """
-        if not self.tutorial_active or self.is_paused:
-            return
-
-        if self.current_step_index >= len(TUTORIAL_STEPS):
-            return
-
-        step = TUTORIAL_STEPS[self.current_step_index]
-
-        def on_target_rect_ready(target_rect):
-            if target_rect:
-                # Just update coach mark position, no overlay
-                self.coach_mark.position_at_target(target_rect)
-            else:
-                # If target not found, try again after delay
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(100, self._update_positions)
-
-        # This will re-run JavaScript queries for HTML targets
-        get_step_target_rect(step, on_target_rect_ready)
-
     def _hide_all(self):
         """Hide all tutorial UI components."""
         if self.coach_mark:
@@ -357,6 +342,10 @@ class TutorialManager(QObject):
         config["tutorial_step_index"] = len(TUTORIAL_STEPS)
         mw.addonManager.writeConfig(__name__, config)
 
+        # Events from now on go nowhere, without importing the tutorial
+        from .tutorial_dispatch import tutorial_finished
+        tutorial_finished()
+
     def _complete_tutorial(self):
         """
         Complete the tutorial.
@@ -364,25 +353,11 @@ class TutorialManager(QObject):
         Hides all UI, marks as completed, and deactivates tutorial mode.
         """
         self.tutorial_active = False
-        self.position_check_timer.stop()
+        self.tracker.stop()
         self._hide_all()
         self._save_completion()
         print("Tutorial completed!")
 
-    def eventFilter(self, obj, event):
-        """
-        Qt event filter to detect window resizes and moves.
-
-        Triggers position update after a short delay to avoid excessive updates.
-        """
-        if self.tutorial_active:
-            if event.type() in [QEvent.Type.Resize, QEvent.Type.Move]:
-                # Debounce: wait 50ms after resize/move before updating
-                self.resize_timer.start(50)
-
-        return False  # Don't consume the event
-
-
 # Singleton instance
 _tutorial_manager = None
 
@@ -7,7 +7,12 @@ a specific target element by creating a cutout in the overlay.
 
 from PyQt6.QtWidgets import QWidget, QApplication
 from PyQt6.QtCore import Qt, QRect, QRectF
-from PyQt6.QtGui import QPainter, QColor, QPen, QRegion, QPainterPath
+from PyQt6.QtGui import QPainter, QColor, QPen, QPainterPath
+
+# Padding between the target and the cutout, and room for the antialiased border
+HIGHLIGHT_PADDING = 8
+BORDER_MARGIN = 2
+BACKDROP_COLOR = QColor(0, 0, 0, 180)
 
 
 class TutorialOverlay(QWidget):
@@ -17,6 +22,10 @@ class TutorialOverlay(QWidget):
     Creates a dark backdrop that covers the entire screen except for a
     highlighted rectangular area. The highlighted area has a glowing border
     and allows click-through, while clicks outside are blocked.
+
+    The overlay follows the geometry of the screen it's on. The backdrop is
+    filled only inside the area being repainted, and moving the highlight
+    only repaints the old and new cutout areas.
     """
 
     def __init__(self, parent=None):
@@ -30,16 +39,60 @@ class TutorialOverlay(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        # Highlight rectangle (empty by default)
+        # Highlight rectangle in global coordinates (empty by default)
         self.highlight_rect = QRect()
 
-        # Make full screen
+        # Screen the overlay covers, and its geometry
+        self._screen = None
+        self._screen_geometry = QRect()
+        self._follows_window_screen = False
+
+        # Make full screen, and follow screen geometry changes
+        self._watch_screen(self.screen() or QApplication.primaryScreen())
+
+    def _watch_screen(self, screen):
+        """Cover the given screen and follow its geometry changes."""
+        if screen is None:
+            return
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.geometryChanged.disconnect(self._resize_to_screen)
+                except (TypeError, RuntimeError):
+                    pass
+            self._screen = screen
+            screen.geometryChanged.connect(self._resize_to_screen)
         self._resize_to_screen()
 
-    def _resize_to_screen(self):
-        """Resize the overlay to cover the entire screen."""
-        screen = QApplication.primaryScreen().geometry()
+    def _resize_to_screen(self, *args):
+        """Resize the overlay to cover its entire screen, if the geometry changed."""
+        screen = self._screen.geometry()
+        if screen == self._screen_geometry:
+            return
+        self._screen_geometry = screen
         self.setGeometry(screen)
+        self.update()
+
+    def showEvent(self, event):
+        """Follow the overlay's window onto whichever screen it ends up on."""
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not self._follows_window_screen:
+            handle.screenChanged.connect(self._watch_screen)
+            self._follows_window_screen = True
+        self._watch_screen(self.screen())
+
+    def _cutout_rect(self, rect=None):
+        """Padded highlight rect in widget coordinates (empty if no highlight)."""
+        rect = self.highlight_rect if rect is None else rect
+        if rect.isEmpty():
+            return QRect()
+        local = rect.translated(-self._screen_geometry.topLeft())
+        return local.adjusted(-HIGHLIGHT_PADDING, -HIGHLIGHT_PADDING, HIGHLIGHT_PADDING, HIGHLIGHT_PADDING)
+
+    def _dirty_rect(self, cutout):
+        """Area to repaint for a cutout, including its border."""
+        return cutout.adjusted(-BORDER_MARGIN, -BORDER_MARGIN, BORDER_MARGIN, BORDER_MARGIN)
 
     def set_highlight_rect(self, rect: QRect):
         """
@@ -48,57 +101,55 @@ class TutorialOverlay(QWidget):
         Args:
             rect: QRect in global screen coordinates to highlight
         """
-        # Ensure overlay is full screen
-        self._resize_to_screen()
+        if rect == self.highlight_rect:
+            return
+        old_cutout = self._cutout_rect()
         self.highlight_rect = rect
-        self.update()  # Trigger repaint
+
+        # Repaint only where the cutout was and where it is now
+        if not old_cutout.isEmpty():
+            self.update(self._dirty_rect(old_cutout))
+        new_cutout = self._cutout_rect()
+        if not new_cutout.isEmpty():
+            self.update(self._dirty_rect(new_cutout))
 
     def clear_highlight(self):
         """Remove the highlight cutout."""
-        self.highlight_rect = QRect()
-        self.update()
+        self.set_highlight_rect(QRect())
 
     def paintEvent(self, event):
         """
         Render the overlay with cutout highlight.
 
-        Uses QPainterPath to create a rounded rectangle cutout in the
-        semi-transparent backdrop. Draws a glowing blue border around
-        the highlighted area.
+        Fills the backdrop color into the repainted region only, then clears
+        a rounded cutout and draws a glowing blue border around it.
+        Antialiasing is only used for the cutout.
         """
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Create full-screen region
-        full_region = QRegion(self.rect())
-
-        # Create cutout for highlight if rect exists
-        if not self.highlight_rect.isEmpty():
-            # Add padding around highlight
-            padded_rect = self.highlight_rect.adjusted(-8, -8, 8, 8)
+        # Backdrop - replaces whatever was in the dirty area
+        painter.setClipRegion(event.region())
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(event.rect(), BACKDROP_COLOR)
 
-            # Create rounded rectangle path for highlight
-            highlight_path = QPainterPath()
-            highlight_path.addRoundedRect(QRectF(padded_rect), 4, 4)
+        cutout = self._cutout_rect()
+        if cutout.isEmpty() or not self._dirty_rect(cutout).intersects(event.rect()):
+            return
 
-            # Convert path to region and subtract from full region
-            highlight_region = QRegion(highlight_path.toFillPolygon().toPolygon())
-            full_region = full_region.subtracted(highlight_region)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Draw semi-transparent backdrop (everywhere except highlight)
-        painter.setClipRegion(full_region)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 180))
+        # Clear the rounded cutout
+        highlight_path = QPainterPath()
+        highlight_path.addRoundedRect(QRectF(cutout), 4, 4)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+        painter.fillPath(highlight_path, QColor(0, 0, 0, 0))
 
         # Draw glowing blue border around highlight
-        if not self.highlight_rect.isEmpty():
-            painter.setClipping(False)
-            padded_rect = self.highlight_rect.adjusted(-8, -8, 8, 8)
-
-            # Blue border with slight glow effect
-            pen = QPen(QColor("#3b82f6"), 2)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(padded_rect, 4, 4)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        pen = QPen(QColor("#3b82f6"), 2)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(cutout, 4, 4)
 
     def mousePressEvent(self, event):
         """
@@ -109,8 +160,7 @@ class TutorialOverlay(QWidget):
         """
         if not self.highlight_rect.isEmpty():
             # Check if click is inside highlight (with padding)
-            padded_rect = self.highlight_rect.adjusted(-8, -8, 8, 8)
-            if padded_rect.contains(event.pos()):
+            if self._cutout_rect().contains(event.pos()):
                 # Pass through to highlighted element
                 event.ignore()
                 return
@@ -121,8 +171,7 @@ class TutorialOverlay(QWidget):
     def mouseReleaseEvent(self, event):
         """Block mouse releases outside highlight."""
         if not self.highlight_rect.isEmpty():
-            padded_rect = self.highlight_rect.adjusted(-8, -8, 8, 8)
-            if padded_rect.contains(event.pos()):
+            if self._cutout_rect().contains(event.pos()):
                 event.ignore()
                 return
         event.accept()
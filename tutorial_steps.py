@@ -6,14 +6,11 @@ each with a target, content, and progression trigger.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Callable, Any
-from PyQt6.QtCore import QRect, QPoint
+from typing import Optional, Any
 
 from .tutorial_helpers import (
-    get_toolbar_icon_rect_async,
     get_reviewer_card_rect,
     get_gear_button_rect,
-    get_chat_input_rect_async,
 )
 
 
@@ -485,55 +482,6 @@ TUTORIAL_STEPS = [
 ]
 
 
-def get_step_target_rect(step: TutorialStep, callback: Callable[[Optional[QRect]], None]):
-    """
-    Get the target rectangle for a tutorial step.
-
-    Handles different target types:
-    - "widget": Directly calls target_ref() to get QRect
-    - "coordinates": Calls target_ref() to get QRect
-    - "html": Asynchronously queries HTML element via JavaScript
-    - "none": Returns None (center screen, no target)
-
-    Args:
-        step: The tutorial step to get target for
-        callback: Function to call with QRect result (or None)
-    """
-    if step.target_type == "none":
-        callback(None)
-        return
-
-    elif step.target_type in ["widget", "coordinates"]:
-        # Directly call the target_ref function
-        try:
-            rect = step.target_ref()
-            callback(rect)
-        except Exception as e:
-            print(f"Error getting target rect for step {step.step_id}: {e}")
-            callback(None)
-
-    elif step.target_type == "html":
-        # Asynchronous HTML element query
-        try:
-            # target_ref is a tuple: (web_view_attr, selector)
-            web_view_attr, selector = step.target_ref
-
-            # Special handling for toolbar
-            if web_view_attr == "toolbar":
-                get_toolbar_icon_rect_async(callback)
-            else:
-                # Panel input box
-                get_chat_input_rect_async(callback)
-        except Exception as e:
-            print(f"Error getting HTML target for step {step.step_id}: {e}")
-            callback(None)
-
-    else:
-        # Unknown target type
-        print(f"Unknown target type: {step.target_type}")
-        callback(None)
-
-
 def get_total_steps():
     """Get the total number of tutorial steps."""
     return len(TUTORIAL_STEPS)
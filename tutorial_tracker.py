@@ -0,0 +1,384 @@
+"""
+Tutorial Target Tracker - Event-driven geometry tracking for coach marks
+
+Keeps the current step's target rectangle up to date without polling:
+
+- Qt targets (widgets, reviewer area): an event filter on the target widget,
+  its web view and the main window recomputes the rect on move/resize/show
+- HTML targets (toolbar icon, chat input): an observer script injected into
+  the web view (ResizeObserver + IntersectionObserver + MutationObserver)
+  pushes the element's rect only when it changes. The toolbar reports through
+  pycmd, the panel through a console message.
+
+Targets that aren't available yet are retried a bounded number of times.
+When nothing changes, the tracker does no work at all.
+"""
+
+import json
+
+from PyQt6.QtCore import QObject, QTimer, QEvent, QPoint, QRect
+
+from .tutorial_helpers import (
+    TOOLBAR_ICON_FINDER_JS,
+    CHAT_INPUT_FINDER_JS,
+    get_gear_button_rect,
+    get_gear_button_widget,
+    get_reviewer_card_rect,
+    get_reviewer_web_view,
+    get_toolbar_web_view,
+    get_panel_web_view,
+)
+
+MAX_RETRIES = 50          # Attempts to find a missing target (~10 seconds)
+RETRY_INTERVAL_MS = 200
+DEBOUNCE_MS = 50          # Coalesce bursts of move/resize events
+TARGET_TIMEOUT_MS = 10000 # How long the observer script waits for a missing element
+
+# Events on watched widgets that can move the target
+GEOMETRY_EVENTS = (
+    QEvent.Type.Move,
+    QEvent.Type.Resize,
+    QEvent.Type.Show,
+    QEvent.Type.Hide,
+    QEvent.Type.WindowStateChange,
+)
+
+# Widgets whose geometry a Qt target depends on, keyed by the step's target_ref
+TARGET_WIDGETS = {
+    get_gear_button_rect: get_gear_button_widget,
+    get_reviewer_card_rect: get_reviewer_web_view,
+}
+
+# How each HTML target's web view reports rect changes back to Python
+TOOLBAR_REPORT_JS = "function(payload) { pycmd('openevidence:tutorial_rect:' + payload); }"
+PANEL_REPORT_JS = "function(payload) { console.log('ANKI_TUTORIAL_RECT:' + payload); }"
+
+HTML_TARGETS = {
+    "toolbar": (get_toolbar_web_view, TOOLBAR_ICON_FINDER_JS, TOOLBAR_REPORT_JS),
+    "panel": (get_panel_web_view, CHAT_INPUT_FINDER_JS, PANEL_REPORT_JS),
+}
+
+# Observer script. Reports {x, y, width, height} in page coordinates,
+# {"hidden": true} while the element is out of view, or {"missing": true}
+# if it doesn't appear within the timeout.
+OBSERVER_JS = """
+(function() {
+    if (window.ankiTutorialTracker) {
+        window.ankiTutorialTracker.stop();
+    }
+
+    const findTarget = %(finder)s;
+    const report = %(report)s;
+    let target = null;
+    let last = '';
+    let frame = 0;
+    let giveUpTimer = 0;
+
+    function send(payload) {
+        if (payload !== last) {
+            last = payload;
+            report(payload);
+        }
+    }
+
+    function measure() {
+        frame = 0;
+        if (!target || !target.isConnected) {
+            detach();
+            waitForTarget();
+            return;
+        }
+        const rect = target.getBoundingClientRect();
+        send(JSON.stringify({ x: rect.x, y: rect.y, width: rect.width, height: rect.height }));
+    }
+
+    function schedule() {
+        if (!frame) {
+            frame = requestAnimationFrame(measure);
+        }
+    }
+
+    const resizeObserver = new ResizeObserver(schedule);
+    const intersectionObserver = new IntersectionObserver((entries) => {
+        const entry = entries[entries.length - 1];
+        if (entry.isIntersecting) {
+            schedule();
+        } else {
+            send(JSON.stringify({ hidden: true }));
+        }
+    });
+    // Watches for the target appearing (or being replaced) in the DOM
+    const mutationObserver = new MutationObserver(() => {
+        if (!target || !target.isConnected) {
+            const element = findTarget();
+            if (element) {
+                attach(element);
+            }
+        }
+    });
+
+    function attach(element) {
+        detach();
+        target = element;
+        clearTimeout(giveUpTimer);
+        giveUpTimer = 0;
+        resizeObserver.observe(element);
+        if (element.parentElement) {
+            resizeObserver.observe(element.parentElement);
+        }
+        intersectionObserver.observe(element);
+        schedule();
+    }
+
+    function detach() {
+        target = null;
+        resizeObserver.disconnect();
+        intersectionObserver.disconnect();
+    }
+
+    function waitForTarget() {
+        if (!giveUpTimer) {
+            giveUpTimer = setTimeout(() => {
+                mutationObserver.disconnect();
+                send(JSON.stringify({ missing: true }));
+            }, %(timeout)d);
+        }
+    }
+
+    window.addEventListener('resize', schedule);
+    window.addEventListener('scroll', schedule, true);
+    mutationObserver.observe(document.documentElement, { childList: true, subtree: true });
+
+    window.ankiTutorialTracker = {
+        stop: function() {
+            detach();
+            mutationObserver.disconnect();
+            clearTimeout(giveUpTimer);
+            window.removeEventListener('resize', schedule);
+            window.removeEventListener('scroll', schedule, true);
+            window.ankiTutorialTracker = null;
+        }
+    };
+
+    const element = findTarget();
+    if (element) {
+        attach(element);
+    } else {
+        waitForTarget();
+    }
+})();
+"""
+
+STOP_OBSERVER_JS = "window.ankiTutorialTracker && window.ankiTutorialTracker.stop();"
+
+
+class TargetTracker(QObject):
+    """
+    Tracks the target rectangle of one tutorial step at a time.
+
+    on_rect(rect) is called with the global QRect when the target is first
+    found and whenever it changes (None for steps without a target);
+    on_missing() is called if the target can't be found.
+    """
+
+    def __init__(self, main_window, parent=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        self.step = None
+        self.on_rect = None
+        self.on_missing = None
+
+        self._watched = []          # Widgets with our event filter installed
+        self._web_view = None       # Web view of the current HTML target
+        self._page_rect = None      # Last rect reported by the observer script
+        self._last_rect = None      # Last rect sent to on_rect
+        self._retries = 0
+
+        # Debounce timer for geometry events
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh)
+
+        # Bounded retry timer for targets that aren't available yet
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._attach)
+
+    def track(self, step, on_rect, on_missing):
+        """Start tracking a step's target, replacing any previous step"""
+        self.stop()
+        self.step = step
+        self.on_rect = on_rect
+        self.on_missing = on_missing
+        self._retries = 0
+
+        if step.target_type == "none":
+            on_rect(None)
+            return
+
+        self._attach()
+
+    def stop(self):
+        """Stop tracking and remove all filters, observers and timers"""
+        self._refresh_timer.stop()
+        self._retry_timer.stop()
+        for widget in self._watched:
+            try:
+                widget.removeEventFilter(self)
+            except:
+                pass
+        self._watched = []
+
+        if self._web_view is not None:
+            try:
+                self._web_view.loadFinished.disconnect(self._on_load_finished)
+            except:
+                pass
+            try:
+                self._web_view.page().runJavaScript(STOP_OBSERVER_JS)
+            except:
+                pass
+        self._web_view = None
+        self._page_rect = None
+        self._last_rect = None
+        self.step = None
+
+    def _attach(self):
+        """Hook up to the current step's target, retrying if it isn't there yet"""
+        step = self.step
+        if step is None or step.target_type == "none":
+            return
+
+        if step.target_type == "html":
+            attached = self._attach_html(step.target_ref[0])
+        else:
+            attached = self._attach_widget(step)
+
+        if not attached:
+            self._retry()
+
+    def _retry(self):
+        if self._retries >= MAX_RETRIES:
+            self._give_up()
+            return
+        self._retries += 1
+        self._retry_timer.start(RETRY_INTERVAL_MS)
+
+    def _give_up(self):
+        on_missing = self.on_missing
+        self.stop()
+        if on_missing:
+            on_missing()
+
+    def _watch(self, widgets):
+        for widget in widgets:
+            if widget is not None and widget not in self._watched:
+                widget.installEventFilter(self)
+                self._watched.append(widget)
+
+    def _attach_widget(self, step):
+        """Qt target: compute the rect now and watch the widgets it depends on"""
+        try:
+            rect = step.target_ref()
+        except Exception as e:
+            print(f"Error getting target rect for step {step.step_id}: {e}")
+            rect = None
+        if rect is None:
+            return False
+
+        get_widget = TARGET_WIDGETS.get(step.target_ref)
+        self._watch([self.main_window, get_widget() if get_widget else None])
+        self._emit(rect)
+        return True
+
+    def _attach_html(self, source):
+        """HTML target: inject the observer script into the target's web view"""
+        get_web_view = HTML_TARGETS[source][0]
+        web_view = get_web_view()
+        if web_view is None:
+            return False
+
+        self._web_view = web_view
+        self._watch([self.main_window, web_view, web_view.window()])
+        # The script is lost on navigation, so re-inject after every load
+        web_view.loadFinished.connect(self._on_load_finished)
+        self._inject_observer()
+        return True
+
+    def _inject_observer(self):
+        source = self.step.target_ref[0]
+        _, finder_js, report_js = HTML_TARGETS[source]
+        js = OBSERVER_JS % {
+            "finder": finder_js.strip(),
+            "report": report_js,
+            "timeout": TARGET_TIMEOUT_MS,
+        }
+        try:
+            self._web_view.page().runJavaScript(js)
+        except Exception as e:
+            print(f"Tutorial: could not inject target observer: {e}")
+
+    def _on_load_finished(self, ok):
+        if ok and self._web_view is not None and self.step is not None:
+            self._page_rect = None
+            self._inject_observer()
+
+    def on_html_rect(self, source, payload):
+        """Rect pushed by the observer script in the toolbar or panel"""
+        step = self.step
+        if step is None or step.target_type != "html" or step.target_ref[0] != source:
+            return
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return
+
+        if data.get("missing"):
+            self._give_up()
+            return
+        if data.get("hidden"):
+            return
+
+        self._page_rect = data
+        self._refresh()
+
+    def eventFilter(self, obj, event):
+        """Geometry changes of watched widgets: recompute after a short debounce"""
+        if event.type() in GEOMETRY_EVENTS:
+            self._refresh_timer.start(DEBOUNCE_MS)
+        return False  # Don't consume the event
+
+    def _refresh(self):
+        """Recompute the global rect from cached state (no JavaScript round trip)"""
+        step = self.step
+        if step is None:
+            return
+
+        if step.target_type == "html":
+            if self._page_rect is None or self._web_view is None:
+                return
+            try:
+                origin = self._web_view.mapToGlobal(QPoint(0, 0))
+            except:
+                return
+            rect = QRect(
+                int(origin.x() + self._page_rect['x']),
+                int(origin.y() + self._page_rect['y']),
+                int(self._page_rect['width']),
+                int(self._page_rect['height'])
+            )
+        else:
+            try:
+                rect = step.target_ref()
+            except:
+                rect = None
+            if rect is None:
+                return
+
+        self._emit(rect)
+
+    def _emit(self, rect):
+        if rect != self._last_rect:
+            self._last_rect = rect
+            if self.on_rect:
+                self.on_rect(rect)